@@ -0,0 +1,86 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+# The budget for ``import serpapi``, in milliseconds: requests, httpx and the
+# default client are only loaded once they are used.
+BUDGET_MS = 25.0
+
+STATEMENTS = {
+    "import": "import serpapi",
+    "client": "import serpapi; serpapi.Client",
+}
+
+_LINE = re.compile(r"import time:\s+\d+\s*\|\s*(\d+)\s*\| (\s*)(\S+)")
+
+
+def import_time_ms(statement="import serpapi"):
+    """Run ``statement`` in a fresh interpreter under ``-X importtime``, and return the time spent
+    on the imports it triggered (from the first ``serpapi`` module on), in milliseconds.
+    """
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total, started = 0, False
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        # Only top-level imports: their times already include what they imported in turn.
+        if match is None or match.group(2):
+            continue
+        started = started or match.group(3).startswith("serpapi")
+        if started:
+            total += int(match.group(1))
+
+    if not started:
+        raise RuntimeError(f"{ repr(statement) } didn't import serpapi")
+    return total / 1000
+
+
+def imported_modules(statement="import serpapi"):
+    """Return the names of the modules imported by running ``statement`` in a fresh interpreter."""
+
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{ statement }; import sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+def measure(runs=5):
+    """Return the median import time of each statement in :data:`STATEMENTS`, in milliseconds."""
+
+    return {
+        name: statistics.median(import_time_ms(statement) for _ in range(runs))
+        for name, statement in STATEMENTS.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=f"Measure how long importing serpapi takes, and check it against the { BUDGET_MS:.0f} ms budget."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="the number of fresh interpreters to time each import in")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help="the budget for 'import serpapi', in milliseconds")
+    args = parser.parse_args(argv)
+
+    results = measure(args.runs)
+    for name, statement in STATEMENTS.items():
+        print(f"{ statement:>32}  { results[name]:8.2f} ms")
+
+    if results["import"] > args.budget:
+        print(f"'import serpapi' took { results['import']:.2f} ms, over the { args.budget:.0f} ms budget.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
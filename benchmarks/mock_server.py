@@ -0,0 +1,285 @@
+import hashlib
+import json
+import random
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+def organic_result(position, query):
+    return {
+        "position": position,
+        "title": f"{ query.title() } - Result { position }",
+        "link": f"https://example.com/{ query }/{ position }",
+        "redirect_link": f"https://www.google.com/url?sa=t&url=https://example.com/{ query }/{ position }",
+        "displayed_link": f"https://example.com › { query } › { position }",
+        "favicon": "https://serpapi.com/searches/favicon.png",
+        "snippet": (
+            f"Everything you need to know about { query }: history, varieties, preparation "
+            "and the best places to find it near you. Updated daily with reviews and ratings."
+        ),
+        "snippet_highlighted_words": [query],
+        "sitelinks": {
+            "inline": [
+                {"title": title, "link": f"https://example.com/{ query }/{ position }/{ title.lower() }"}
+                for title in ("About", "Reviews", "Locations", "Contact")
+            ]
+        },
+        "rich_snippet": {
+            "bottom": {"extensions": ["Rating: 4.6", "1,024 reviews"], "detected_extensions": {"rating": 4.6, "reviews": 1024}}
+        },
+        "source": "Example",
+    }
+
+
+def local_result(position, query):
+    return {
+        "position": position,
+        "title": f"{ query.title() } House #{ position }",
+        "place_id": hashlib.md5(f"{ query }{ position }".encode()).hexdigest(),
+        "data_id": f"0x8644b5a{ position:07x}:0x{ position:016x}",
+        "gps_coordinates": {"latitude": 30.26 + position / 1e4, "longitude": -97.74 - position / 1e4},
+        "rating": 4.5,
+        "reviews": 100 + position,
+        "price": "$$",
+        "type": "Coffee shop",
+        "types": ["Coffee shop", "Cafe", "Breakfast restaurant"],
+        "address": f"{ position } Congress Ave, Austin, TX 78701",
+        "open_state": "Open ⋅ Closes 7 PM",
+        "hours": "Open ⋅ Closes 7 PM",
+        "operating_hours": {day: "7 AM–7 PM" for day in ("monday", "tuesday", "wednesday", "thursday", "friday")},
+        "phone": "(512) 555-0100",
+        "website": f"https://example.com/{ position }",
+        "description": "Cozy spot for single-origin pour-overs, espresso drinks and pastries.",
+        "service_options": {"dine_in": True, "takeout": True, "delivery": False},
+        "thumbnail": f"https://lh5.googleusercontent.com/p/{ position }=w80-h106-k-no",
+    }
+
+
+class MockSerpApi:
+    """A local, in-process stand-in for SerpApi.com, serving payloads shaped like real responses.
+
+    It serves ``/search`` (and ``/search.json``), ``/searches/<id>``, ``/locations.json`` and
+    ``/account.json``. The size of a search response follows its ``num`` parameter (the number
+    of ``organic_results``, or of ``local_results`` for ``engine=google_maps``), and every search
+    has ``pages`` pages linked through ``serpapi_pagination``.
+
+    .. code-block:: python
+
+        >>> with MockSerpApi(latency=0.05, error_rate=0.01) as server:
+        ...     client = serpapi.Client(api_key="secret_api_key")
+        ...     client.BASE_DOMAIN = server.url
+
+    :param latency: the time, in seconds, taken to answer every request.
+    :param jitter: a random extra delay, up to this many seconds, added to ``latency``.
+    :param error_rate: the fraction of searches answered with a ``503``.
+    :param pages: the number of pages of results every search has.
+    :param seed: seeds the latency jitter and error injection, for repeatable runs.
+    """
+
+    def __init__(self, *, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0, pages=5, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.pages = pages
+        self.requests = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._payloads = {}
+        self._archive = {}
+
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{ host }:{ port }"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle's algorithm on, the
+            # body then waits for the client's delayed ACK (~40ms) on every request.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, body, headers = mock.respond(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def respond(self, path):
+        """Return ``(status, body, headers)`` for a request to ``path``."""
+
+        url = urlsplit(path)
+        params = dict(parse_qsl(url.query))
+
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            fail = self.error_rate and self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if url.path in ("/search", "/search.json"):
+            if fail:
+                return 503, b'{\n  "error": "Service temporarily unavailable."\n}', {"Retry-After": "0"}
+            return 200, self.search(params), {}
+
+        if url.path.startswith("/searches/"):
+            search_id = url.path[len("/searches/"):].split(".")[0]
+            with self._lock:
+                body = self._archive.get(search_id)
+            if body is None:
+                return 404, b'{\n  "error": "Invalid search id."\n}', {}
+            return 200, body, {}
+
+        if url.path == "/locations.json":
+            return 200, self.locations(params), {}
+
+        if url.path == "/account.json":
+            return 200, self.account(), {}
+
+        return 404, b'{\n  "error": "Not found."\n}', {}
+
+    def search(self, params):
+        engine = params.get("engine", "google")
+        query = params.get("q", "coffee")
+        num = int(params.get("num", 10))
+        start = int(params.get("start", 0))
+
+        key = (engine, query, num, start)
+        with self._lock:
+            body = self._payloads.get(key)
+        if body is not None:
+            return body
+
+        search_id = hashlib.md5(repr(key).encode()).hexdigest()[:24]
+        page = start // num + 1
+
+        def page_url(number):
+            page_params = {k: v for k, v in params.items() if k != "api_key"}
+            page_params["start"] = (number - 1) * num
+            return f"{ self.url }/search.json?{ urlencode(page_params) }"
+
+        if engine == "google_maps":
+            results_key, make_result = "local_results", local_result
+        else:
+            results_key, make_result = "organic_results", organic_result
+
+        payload = {
+            "search_metadata": {
+                "id": search_id,
+                "status": "Success",
+                "json_endpoint": f"{ self.url }/searches/{ search_id }.json",
+                "created_at": "2026-01-01 00:00:00 UTC",
+                "processed_at": "2026-01-01 00:00:00 UTC",
+                "google_url": f"https://www.google.com/search?q={ query }&start={ start }",
+                "raw_html_file": f"{ self.url }/searches/{ search_id }.html",
+                "total_time_taken": 1.23,
+            },
+            "search_parameters": dict({k: v for k, v in params.items() if k != "api_key"}, engine=engine),
+            "search_information": {
+                "query_displayed": query,
+                "total_results": num * self.pages,
+                "time_taken_displayed": 0.42,
+                "organic_results_state": "Results for exact spelling",
+            },
+            results_key: [make_result(start + i + 1, query) for i in range(num)],
+            "related_searches": [
+                {"query": f"{ query } { suffix }", "link": f"https://www.google.com/search?q={ query }+{ suffix }"}
+                for suffix in ("near me", "shop", "beans", "maker")
+            ],
+            "serpapi_pagination": {"current": page},
+        }
+
+        if page < self.pages:
+            payload["serpapi_pagination"]["next"] = page_url(page + 1)
+            payload["serpapi_pagination"]["other_pages"] = {
+                str(number): page_url(number)
+                for number in range(page + 1, min(page + 5, self.pages) + 1)
+            }
+
+        # Pretty-printed with two spaces, like SerpApi.com's own responses.
+        body = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            self._payloads[key] = body
+            self._archive[search_id] = body
+        return body
+
+    def locations(self, params):
+        limit = int(params.get("limit", 10))
+        query = params.get("q", "Austin")
+        return json.dumps(
+            [
+                {
+                    "id": str(585069 + i),
+                    "google_id": 1026201 + i,
+                    "google_parent_id": 21176,
+                    "name": f"{ query } { i }",
+                    "canonical_name": f"{ query } { i },Texas,United States",
+                    "country_code": "US",
+                    "target_type": "City",
+                    "reach": 5560000 - i,
+                    "gps": [-97.7430608, 30.267153],
+                    "keys": [query.lower(), "texas", "united", "states"],
+                }
+                for i in range(limit)
+            ],
+            indent=2,
+        ).encode("utf-8")
+
+    def account(self):
+        with self._lock:
+            used = self.requests
+        return json.dumps(
+            {
+                "account_id": "0123456789abcdef01234567",
+                "api_key": "secret_api_key",
+                "account_email": "demo@example.com",
+                "plan_id": "bigdata",
+                "plan_name": "Big Data Plan",
+                "searches_per_month": 30000,
+                "plan_searches_left": max(30000 - used, 0),
+                "extra_credits": 0,
+                "total_searches_left": max(30000 - used, 0),
+                "this_month_usage": used,
+                "this_hour_searches": used,
+                "last_hour_searches": 0,
+                "account_rate_limit_per_hour": 6000,
+            },
+            indent=2,
+        ).encode("utf-8")
@@ -0,0 +1,203 @@
+import argparse
+import json
+import multiprocessing
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import serpapi
+
+from .mock_server import MockSerpApi
+
+
+def percentile(values, p):
+    """Return the ``p``-th percentile of ``values``, by the nearest-rank method."""
+
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(int(round(p / 100 * len(values))), 1)
+    return values[min(rank, len(values)) - 1]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in kilobytes elsewhere.
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+def run_sync(client, args):
+    for i in range(args.searches):
+        client.search(q=f"coffee { i }", num=args.num, engine=args.engine)
+
+
+def run_batch(client, args):
+    params = ({"q": f"coffee { i }", "num": args.num, "engine": args.engine} for i in range(args.searches))
+    for record in client.search_many(params, max_workers=args.workers):
+        pass
+
+
+def run_paginate(client, args):
+    for i in range(max(args.searches // args.pages, 1)):
+        results = client.search(q=f"coffee { i }", num=args.num, engine=args.engine)
+        for page in results.yield_pages(max_pages=args.pages, prefetch=args.prefetch):
+            pass
+
+
+def run_archive(client, args):
+    search_id = client.search(q="coffee", num=args.num, engine=args.engine)["search_metadata"]["id"]
+    for i in range(args.searches):
+        client.search_archive(search_id=search_id)
+
+
+SCENARIOS = {
+    "sync": run_sync,
+    "batch": run_batch,
+    "paginate": run_paginate,
+    "archive": run_archive,
+}
+
+
+def measure(scenario, url, args):
+    """Run one scenario against the mock server at ``url``, and return its measurements."""
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def hook(event):
+        if event.name == "request_end":
+            with lock:
+                latencies.append(event.elapsed)
+                if event.error is not None:
+                    errors.append(event.error)
+
+    client = serpapi.Client(
+        api_key="secret_api_key",
+        hooks=[hook],
+        lazy_results=args.lazy,
+        pool_maxsize=max(args.workers, 10),
+        retry=serpapi.RetryPolicy(max_attempts=args.retries, backoff_base=0.01) if args.retries > 1 else None,
+    )
+    client.BASE_DOMAIN = url
+
+    # Warm up the connection pool and imports before measuring.
+    client.search(q="warmup", num=args.num, engine=args.engine)
+    latencies.clear()
+    errors.clear()
+
+    failure = None
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        SCENARIOS[scenario](client, args)
+    except serpapi.SerpApiError as e:
+        failure = repr(e)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+
+    requests = len(latencies)
+    return {
+        "scenario": scenario,
+        "requests": requests,
+        "errors": len(errors),
+        "failure": failure,
+        "seconds": wall,
+        "throughput": requests / wall if wall else None,
+        "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else None,
+        "cpu_ms_per_request": cpu / requests * 1000 if requests else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _measure_in_child(scenario, url, args, queue):
+    queue.put(measure(scenario, url, args))
+
+
+def _serve(options, urls, stop):
+    with MockSerpApi(**options) as server:
+        urls.put(server.url)
+        stop.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark serpapi-python against a local mock SerpApi server; no network access or API key needed."
+    )
+    parser.add_argument("scenarios", nargs="*", help=f"the scenarios to run: { ', '.join(SCENARIOS) } (default: all)")
+    parser.add_argument("--searches", type=int, default=200, help="the number of searches per scenario")
+    parser.add_argument("--num", type=int, default=10, help="the number of results per page (the payload size)")
+    parser.add_argument("--engine", default="google", help="google (organic_results) or google_maps (local_results)")
+    parser.add_argument("--pages", type=int, default=5, help="the number of pages per search")
+    parser.add_argument("--prefetch", type=int, default=0, help="pages to prefetch when paginating")
+    parser.add_argument("--workers", type=int, default=8, help="the number of threads for the batch scenario")
+    parser.add_argument("--latency", type=float, default=0.0, help="the mock server's response time, in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra server latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="the fraction of searches answered with a 503")
+    parser.add_argument("--retries", type=int, default=1, help="the maximum attempts per request")
+    parser.add_argument("--lazy", action="store_true", help="use Client(lazy_results=True)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: { ', '.join(sorted(unknown)) }")
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    # The server and every scenario run in their own processes, so that CPU time and
+    # peak RSS are the client's alone, and one scenario's memory doesn't inflate the next.
+    context = multiprocessing.get_context("spawn")
+    urls, stop = context.Queue(), context.Event()
+    server = context.Process(
+        target=_serve,
+        args=(
+            dict(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, pages=args.pages),
+            urls,
+            stop,
+        ),
+        daemon=True,
+    )
+    server.start()
+    url = urls.get(timeout=30)
+
+    results = []
+    try:
+        for scenario in args.scenarios:
+            queue = context.Queue()
+            child = context.Process(target=_measure_in_child, args=(scenario, url, args, queue))
+            child.start()
+            results.append(queue.get())
+            child.join()
+    finally:
+        stop.set()
+        server.join(5)
+
+    columns = ["scenario", "requests", "errors", "throughput", "p50_ms", "p99_ms", "cpu_ms_per_request", "peak_rss_mb"]
+    print("  ".join(f"{ column:>18}" for column in columns))
+    for result in results:
+        print(
+            "  ".join(
+                f"{ value:>18.2f}" if isinstance(value, float) else f"{ str(value):>18}"
+                for value in (result[column] for column in columns)
+            )
+        )
+        if result["failure"]:
+            print(f"  { result['scenario'] } stopped early: { result['failure'] }")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"options": vars(args), "results": results}, f, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,78 @@
+import importlib
+
 from .__version__ import __version__
 
-from .core import *
-from .exceptions import *
+# Public names, and the submodule each is imported from on first access. Importing ``serpapi``
+# itself stays cheap: requests (and the default client's connection pool) only load when used.
+_LAZY_NAMES = {
+    "Client": "core",
+    "search": "core",
+    "search_archive": "core",
+    "locations": "core",
+    "account": "core",
+    "HTTPClient": "http",
+    "wire_bytes": "http",
+    "SerpResults": "models",
+    "AsyncSerpResults": "models",
+    "BatchResult": "batch",
+    "SingleFlight": "singleflight",
+    "canonical_params": "utils",
+    "normalize_params": "utils",
+    "QueryPlan": "plan",
+    "SerpApiError": "exceptions",
+    "APIKeyNotProvided": "exceptions",
+    "SearchIDNotProvided": "exceptions",
+    "InvalidLocation": "exceptions",
+    "QuotaExceeded": "exceptions",
+    "SearchError": "exceptions",
+    "HTTPError": "exceptions",
+    "HTTPConnectionError": "exceptions",
+    "TimeoutError": "exceptions",
+    "AsyncClient": "aio",
+    "ResponseCache": "cache",
+    "MemoryCache": "cache",
+    "SQLiteCache": "cache",
+    "CacheStats": "cache",
+    "RetryPolicy": "retry",
+    "RateLimiter": "ratelimit",
+    "SearchPipeline": "pipeline",
+    "Event": "instrumentation",
+    "LoggingHook": "instrumentation",
+    "MetricsRegistry": "instrumentation",
+    "OpenTelemetryHook": "instrumentation",
+    "LocationIndex": "location_index",
+    "QuotaTracker": "quota",
+    "Transport": "transport",
+    "RequestsTransport": "transport",
+    "HTTPXTransport": "transport",
+    "ClientPool": "pool",
+    "ArchiveStore": "archive",
+    "Projection": "projection",
+    "Record": "records",
+    "OrganicResult": "records",
+    "LocalResult": "records",
+    "ShoppingResult": "records",
+    "NewsResult": "records",
+    "JobResult": "records",
+}
+
+__all__ = ["__version__", *_LAZY_NAMES]
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is not None:
+        value = globals()[name] = getattr(importlib.import_module(f".{ module_name }", __name__), name)
+        return value
+
+    # Submodules, e.g. serpapi.export, are also available without importing them first.
+    try:
+        return importlib.import_module(f".{ name }", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{ __name__ }.{ name }":
+            raise
+        raise AttributeError(f"module { repr(__name__) } has no attribute { repr(name) }") from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
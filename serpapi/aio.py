@@ -0,0 +1,371 @@
+import asyncio
+import threading
+import time
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .http import HTTPClient, TransferStats
+from .exceptions import (
+    HTTPError,
+    HTTPConnectionError,
+    SearchIDNotProvided,
+    TimeoutError,
+)
+from .instrumentation import next_request_id
+from .models import AsyncSerpResults
+from .projection import Projection
+from .singleflight import AsyncSingleFlight
+from .utils import REQUEST_OPTIONS, canonical_params, normalize_params
+
+
+class AsyncHTTPClient:
+    """This class handles outgoing asynchronous HTTP requests to SerpApi.com.
+
+    Requests are issued through a single ``httpx.AsyncClient``, so every coroutine
+    sharing this client also shares its connection pool.
+    """
+
+    BASE_DOMAIN = HTTPClient.BASE_DOMAIN
+    USER_AGENT = HTTPClient.USER_AGENT
+
+    def __init__(
+        self,
+        *,
+        api_key=None,
+        timeout=None,
+        max_connections=100,
+        max_keepalive_connections=20,
+        http2=False,
+        retry=None,
+        rate_limiter=None,
+        hooks=None,
+        compression=True,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncClient requires httpx. Install it with: pip install serpapi[async]"
+            )
+
+        self.api_key = api_key
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks or [])
+        self.transfer = TransferStats()
+        self._transfer_lock = threading.Lock()
+        self.session = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            # Timeouts are applied per request below, mirroring requests' defaults.
+            timeout=None,
+            follow_redirects=True,
+        )
+
+        # Ask for every content coding httpx can decode, unless told otherwise.
+        if compression is True:
+            self.accept_encoding = self.session.headers.get("Accept-Encoding", "gzip, deflate")
+        elif not compression:
+            self.accept_encoding = "identity"
+        else:
+            self.accept_encoding = compression
+
+    transfer_stats = HTTPClient.transfer_stats
+    record_transfer = HTTPClient.record_transfer
+    add_hook = HTTPClient.add_hook
+    remove_hook = HTTPClient.remove_hook
+    emit = HTTPClient.emit
+
+    async def request(self, method, path, params, *, assert_200=True, throttle=True, **kwargs):
+        # Inject the API Key into (a copy of) the params.
+        if "api_key" not in params:
+            params = dict(params, api_key=self.api_key)
+
+        # Build the URL, as needed.
+        if not path.startswith("http"):
+            url = self.BASE_DOMAIN + path
+        else:
+            url = path
+
+        # Unlike requests, httpx replaces an existing query string (e.g. in a
+        # next page URL) and sends None values as empty strings.
+        url = httpx.URL(url).copy_merge_params(
+            {k: v for k, v in params.items() if v is not None}
+        )
+
+        # Use the default retry policy, unless one (or False) was given for this call.
+        retry = kwargs.pop("retry", self.retry)
+
+        attempt = 0
+        while True:
+            attempt += 1
+
+            # Searches wait for the rate limiter; free endpoints (account, archive, locations) don't.
+            if throttle and self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            try:
+                if self.hooks:
+                    r = await self._send_observed(method, url, params, attempt, assert_200=assert_200, **kwargs)
+                else:
+                    r = await self._send(method, url, assert_200=assert_200, **kwargs)
+            except (HTTPError, TimeoutError) as e:
+                e.attempts = attempt
+                delay = retry.next_delay(e, attempt) if retry else None
+                if delay is None:
+                    raise
+                # Release the failed attempt's connection, which a streamed response would otherwise keep.
+                response = getattr(e, "response", None)
+                if response is not None:
+                    await response.aclose()
+                if self.hooks:
+                    self.emit(
+                        "retry",
+                        request_id=getattr(e, "request_id", None),
+                        path=url.path,
+                        engine=params.get("engine"),
+                        attempt=attempt,
+                        delay=delay,
+                        error=e,
+                    )
+                await asyncio.sleep(delay)
+                continue
+
+            r.attempts = attempt
+            return r
+
+    async def _send(self, method, url, *, assert_200=True, **kwargs):
+        """Make a single attempt at an HTTP request, translating errors into SerpApi exceptions."""
+
+        try:
+            headers = {"User-Agent": self.USER_AGENT, "Accept-Encoding": self.accept_encoding}
+
+            # Use the default timeout if one was provided to the client.
+            if self.timeout and "timeout" not in kwargs:
+                kwargs["timeout"] = self.timeout
+
+            r = await self.session.request(
+                method=method, url=url, headers=headers, **kwargs
+            )
+
+        except httpx.TimeoutException as e:
+            raise TimeoutError(e)
+        except httpx.TransportError as e:
+            raise HTTPConnectionError(e)
+
+        self.record_transfer(r.num_bytes_downloaded, len(r.content))
+
+        # Raise an exception if the status code is not 200.
+        if assert_200 and r.status_code >= 400:
+            try:
+                r.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise HTTPError(e)
+
+        return r
+
+    async def _send_observed(self, method, url, params, attempt, **kwargs):
+        """Like :meth:`_send`, but emit ``request_start`` and ``request_end`` events around it."""
+
+        fields = dict(
+            request_id=next_request_id(),
+            method=method,
+            path=url.path,
+            engine=params.get("engine"),
+            attempt=attempt,
+        )
+        self.emit("request_start", **fields)
+
+        started = time.perf_counter()
+        r = error = None
+        try:
+            r = await self._send(method, url, **kwargs)
+            return r
+        except Exception as e:
+            error = e
+            e.request_id = fields["request_id"]
+            r = getattr(e, "response", None)
+            raise
+        finally:
+            self.emit(
+                "request_end",
+                elapsed=time.perf_counter() - started,
+                status_code=r.status_code if r is not None else None,
+                server_time=r.elapsed.total_seconds() if r is not None else None,
+                response_bytes=len(r.content) if r is not None else None,
+                wire_bytes=r.num_bytes_downloaded if r is not None else None,
+                error=error,
+                **fields,
+            )
+            if r is not None:
+                r.request_id = fields["request_id"]
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+def _split_request_kwargs(params, kwargs):
+    """Separate API parameters from arguments meant for the HTTP request itself."""
+
+    # Work on a copy: the caller's dict is never modified.
+    params = dict(params or {})
+
+    # These are arguments that should be passed to the underlying httpx request call.
+    request_kwargs = {}
+    for key in ["timeout", "retry"]:
+        if key in kwargs:
+            request_kwargs[key] = kwargs.pop(key)
+
+    # httpx only takes the others when the client is created; don't send them to SerpApi as parameters.
+    unsupported = sorted(key for key in REQUEST_OPTIONS if key in kwargs)
+    if unsupported:
+        raise TypeError(
+            f"AsyncClient doesn't support per-request { ', '.join(unsupported) }; configure the client instead."
+        )
+
+    if kwargs:
+        params.update(kwargs)
+
+    return params, request_kwargs
+
+
+class AsyncClient(AsyncHTTPClient):
+    """An asyncio-native counterpart to :class:`Client <serpapi.Client>`.
+
+    :param api_key: The API Key to use for SerpApi.com.
+    :param timeout: the default timeout, in seconds, applied to every request.
+    :param max_connections: the maximum number of concurrent connections to SerpApi.com.
+    :param max_keepalive_connections: the number of idle connections kept open for reuse.
+    :param compression: ``True`` (default) to accept every content coding httpx can decode (gzip, deflate, and br and zstd when their decoders are installed), ``False`` to disable compression, or an explicit ``Accept-Encoding`` value.
+    :param http2: if ``True``, multiplex concurrent requests over HTTP/2 connections (requires ``pip install serpapi[http2]``).
+    :param retry: an optional :class:`RetryPolicy <serpapi.RetryPolicy>`, overridable per call with ``retry=...``.
+    :param rate_limiter: an optional :class:`RateLimiter <serpapi.RateLimiter>`, which may be shared with other clients.
+    :param coalesce: if ``True``, concurrent identical searches share a single request.
+    :param hooks: callables that receive an :class:`Event <serpapi.instrumentation.Event>` for every request attempt and retry.
+
+    Requires the optional ``httpx`` dependency (``pip install serpapi[async]``).
+    Every method is a coroutine, and errors are raised as the same exceptions
+    :class:`Client <serpapi.Client>` raises:
+
+        .. code-block:: python
+
+            import asyncio
+            import os
+            import serpapi
+
+            async def main():
+                async with serpapi.AsyncClient(api_key=os.environ["SERPAPI_KEY"]) as client:
+                    results = await asyncio.gather(
+                        client.search(q="Coffee"),
+                        client.search(q="Tea"),
+                    )
+
+            asyncio.run(main())
+
+    """
+
+    DASHBOARD_URL = "https://serpapi.com/dashboard"
+
+    def __init__(self, *, api_key=None, timeout=None, coalesce=False, **kwargs):
+        super().__init__(api_key=api_key, timeout=timeout, **kwargs)
+        self.in_flight = AsyncSingleFlight() if coalesce else None
+
+    def __repr__(self):
+        return "<SerpApi AsyncClient>"
+
+    async def search(self, params: dict = None, **kwargs):
+        """Fetch a page of results from SerpApi. Returns an :class:`AsyncSerpResults <serpapi.AsyncSerpResults>` object, or unicode text (*e.g.* if ``'output': 'html'`` was passed).
+
+        Accepts the same arguments as :meth:`Client.search <serpapi.Client.search>`.
+
+        **Learn more**: https://serpapi.com/search-api
+        """
+        projection = Projection.coerce(kwargs.pop("projection", None))
+        params, request_kwargs = _split_request_kwargs(params, kwargs)
+        params = normalize_params(params)
+
+        if projection is not None:
+            params = projection.restrict(params)
+
+        async def fetch():
+            r = await self.request("GET", "/search", params=params, **request_kwargs)
+
+            return AsyncSerpResults.from_http_response(r, client=self, projection=projection)
+
+        if self.in_flight is not None:
+            return await self.in_flight.do((canonical_params(params), projection), fetch)
+
+        return await fetch()
+
+    async def search_archive(self, params: dict = None, **kwargs):
+        """Get a result from the SerpApi Search Archive API.
+
+        :param search_id: the Search ID of the search to retrieve from the archive.
+        :param api_key: the API Key to use for SerpApi.com.
+        :param output: the output format desired (``html`` or ``json``). Defaults to ``json``.
+        :param **: any additional parameters to pass to the API.
+
+        **Learn more**: https://serpapi.com/search-archive-api
+        """
+        params, request_kwargs = _split_request_kwargs(params, kwargs)
+
+        try:
+            search_id = params["search_id"]
+        except KeyError:
+            raise SearchIDNotProvided(
+                f"Please provide 'search_id', found here: { self.DASHBOARD_URL }"
+            )
+
+        r = await self.request(
+            "GET", f"/searches/{ search_id }", params=params, throttle=False, **request_kwargs
+        )
+        return AsyncSerpResults.from_http_response(r, client=self)
+
+    async def locations(self, params: dict = None, **kwargs):
+        """Get a list of supported Google locations.
+
+        :param q: restricts your search to locations that contain the supplied string.
+        :param limit: limits the number of locations returned.
+        :param **: any additional parameters to pass to the API.
+
+        **Learn more**: https://serpapi.com/locations-api
+        """
+        params, request_kwargs = _split_request_kwargs(params, kwargs)
+
+        r = await self.request(
+            "GET",
+            "/locations.json",
+            params=params,
+            assert_200=True,
+            throttle=False,
+            **request_kwargs,
+        )
+        return r.json()
+
+    async def account(self, params: dict = None, **kwargs):
+        """Get SerpApi account information.
+
+        :param api_key: the API Key to use for SerpApi.com.
+        :param **: any additional parameters to pass to the API.
+
+        **Learn more**: https://serpapi.com/account-api
+        """
+        params, request_kwargs = _split_request_kwargs(params, kwargs)
+
+        r = await self.request(
+            "GET", "/account.json", params=params, assert_200=True, throttle=False, **request_kwargs
+        )
+        return r.json()
@@ -0,0 +1,248 @@
+import mmap
+import os
+import sqlite3
+import threading
+import zlib
+
+from .models import SerpResults
+
+
+class ArchiveStore:
+    """A local archive of search results, keyed by ``search_metadata.id``.
+
+    Raw response bodies are compressed and appended to segment files; a SQLite index
+    locates each one, and indexes searches by engine, query, location and creation date.
+    Segments are read through memory maps, so replaying a large archive is bound by the
+    disk rather than the network.
+
+    .. code-block:: python
+
+        >>> archive = serpapi.ArchiveStore("serpapi-archive")
+        >>> client = serpapi.Client(api_key="secret_api_key", archive=archive)
+        >>> results = client.search(q="Coffee")   # stored automatically
+        >>> client.search_archive(search_id=results["search_metadata"]["id"])   # read from disk
+        >>> for results in archive.replay(engine="google", since="2026-01-01"):
+        ...     process(results)
+
+    Only one process should write to an archive at a time; any number may read it.
+
+    :param directory: the directory holding the segments and the index. It is created if needed.
+    :param segment_size: start a new segment file once the current one reaches this many bytes.
+    :param compress_level: the zlib compression level, from ``1`` (fastest) to ``9`` (smallest).
+    """
+
+    INDEX_NAME = "index.sqlite3"
+
+    #: The number of index rows :meth:`replay` reads at a time.
+    REPLAY_BATCH = 1000
+
+    def __init__(self, directory, *, segment_size=256 << 20, compress_level=6):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.compress_level = compress_level
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._maps = {}
+        self._db = sqlite3.connect(
+            os.path.join(directory, self.INDEX_NAME), check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS searches ("
+            "id TEXT PRIMARY KEY, segment INTEGER NOT NULL, offset INTEGER NOT NULL, length INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, engine TEXT, q TEXT, location TEXT, created_at TEXT)"
+        )
+        for columns in ("engine, q", "location", "created_at", "segment, offset"):
+            name = "searches_by_" + columns.replace(", ", "_")
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS { name } ON searches ({ columns })")
+
+        row = self._db.execute("SELECT MAX(segment) FROM searches").fetchone()
+        self._segment = row[0] or 1
+        self._writer = None
+
+    def __repr__(self):
+        return f"<ArchiveStore { repr(self.directory) } searches={ len(self) }>"
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+
+    def __contains__(self, search_id):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM searches WHERE id = ?", (search_id,)).fetchone() is not None
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, f"{ segment:06d}.seg")
+
+    def store(self, content, results=None):
+        """Store a raw response body, and return its search id (or ``None`` if it isn't a finished search).
+
+        :param content: the raw JSON body, as ``bytes``.
+        :param results: the body decoded as :class:`SerpResults <serpapi.SerpResults>`, if already at hand.
+
+        A search that is already archived isn't stored again.
+        """
+
+        if results is None:
+            results = SerpResults.from_cache(content)
+
+        metadata = results.get("search_metadata") or {}
+        search_id = metadata.get("id")
+        # Searches submitted with async=true have no results yet.
+        if not search_id or metadata.get("status", "Success") != "Success":
+            return None
+
+        parameters = results.get("search_parameters") or {}
+        compressed = zlib.compress(content, self.compress_level)
+
+        with self._lock:
+            if self._db.execute("SELECT 1 FROM searches WHERE id = ?", (search_id,)).fetchone():
+                return search_id
+
+            writer = self._open_writer(len(compressed))
+            offset = writer.tell()
+            writer.write(compressed)
+            writer.flush()
+
+            # The body is written before it is indexed, so a crash can only leave unindexed bytes behind.
+            self._db.execute(
+                "INSERT INTO searches (id, segment, offset, length, size, engine, q, location, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    search_id,
+                    self._segment,
+                    offset,
+                    len(compressed),
+                    len(content),
+                    parameters.get("engine"),
+                    parameters.get("q"),
+                    parameters.get("location_used", parameters.get("location_requested", parameters.get("location"))),
+                    metadata.get("created_at"),
+                ),
+            )
+
+        return search_id
+
+    def _open_writer(self, length):
+        if self._writer is None:
+            self._writer = open(self._segment_path(self._segment), "ab")
+
+        if self._writer.tell() and self._writer.tell() + length > self.segment_size:
+            self._writer.close()
+            self._segment += 1
+            self._writer = open(self._segment_path(self._segment), "ab")
+
+        return self._writer
+
+    def _read(self, segment, offset, length):
+        mapped = self._maps.get(segment)
+
+        # A segment still being written may have grown since it was mapped.
+        if mapped is None or offset + length > len(mapped):
+            if mapped is not None:
+                mapped.close()
+            with open(self._segment_path(segment), "rb") as f:
+                mapped = self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return zlib.decompress(mapped[offset:offset + length])
+
+    def get(self, search_id):
+        """Return the raw JSON body archived for ``search_id``, or ``None``."""
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT segment, offset, length FROM searches WHERE id = ?", (search_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return self._read(*row)
+
+    def load(self, search_id, *, client=None):
+        """Return the :class:`SerpResults <serpapi.SerpResults>` archived for ``search_id``, or ``None``."""
+
+        content = self.get(search_id)
+        if content is None:
+            return None
+        return SerpResults.from_cache(content, client=client)
+
+    def find(self, *, engine=None, q=None, location=None, since=None, until=None, limit=None):
+        """Return the ids of the archived searches matching every filter given, oldest first.
+
+        :param since: include searches created at or after this date, *e.g.* ``"2026-01-01"``.
+        :param until: include searches created before this date.
+        """
+
+        clauses, values = self._filters(engine=engine, q=q, location=location, since=since, until=until)
+
+        query = "SELECT id FROM searches"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at, segment, offset"
+        if limit is not None:
+            query += " LIMIT ?"
+            values.append(limit)
+
+        with self._lock:
+            return [row[0] for row in self._db.execute(query, values)]
+
+    @staticmethod
+    def _filters(*, engine=None, q=None, location=None, since=None, until=None):
+        clauses, values = [], []
+        for column, value in (("engine", engine), ("q", q), ("location", location)):
+            if value is not None:
+                clauses.append(f"{ column } = ?")
+                values.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            values.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            values.append(until)
+        return clauses, values
+
+    def replay(self, *, client=None, limit=None, **filters):
+        """Yield :class:`SerpResults <serpapi.SerpResults>` for every archived search matching ``filters``
+        (see :meth:`find`), in the order they are laid out on disk.
+
+        The index is read :attr:`REPLAY_BATCH` rows at a time, so memory use doesn't grow with the archive.
+
+        :param limit: stop after this many searches.
+        """
+
+        clauses, values = self._filters(**filters)
+        # Resume each batch after the last search read (segment, offset), rather than skipping rows.
+        query = (
+            "SELECT id, segment, offset, length FROM searches WHERE "
+            + " AND ".join(clauses + ["(segment > ? OR (segment = ? AND offset > ?))"])
+            + " ORDER BY segment, offset LIMIT ?"
+        )
+
+        segment, offset = 0, -1
+        while limit is None or limit > 0:
+            batch = self.REPLAY_BATCH if limit is None else min(self.REPLAY_BATCH, limit)
+            with self._lock:
+                rows = self._db.execute(query, values + [segment, segment, offset, batch]).fetchall()
+
+            for _, segment, offset, length in rows:
+                with self._lock:
+                    content = self._read(segment, offset, length)
+                yield SerpResults.from_cache(content, client=client)
+
+            if limit is not None:
+                limit -= len(rows)
+            if len(rows) < batch:
+                break
+
+    def close(self):
+        """Close the segment files and the index."""
+
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self._db.close()
@@ -0,0 +1,204 @@
+import functools
+import os
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .exceptions import QuotaExceeded
+from .models import SerpResults
+
+
+class BatchResult:
+    """The outcome of a single search issued by :meth:`Client.search_many <serpapi.Client.search_many>`.
+
+    Exactly one of ``result`` and ``exception`` is set.
+
+    :param index: the position of the search in the input iterable.
+    :param params: the parameters the search was issued with.
+    :param result: the :class:`SerpResults <serpapi.SerpResults>` (or text) returned, on success; with
+        :meth:`Client.search_many_processes <serpapi.Client.search_many_processes>`, what ``process`` returned.
+    :param exception: the exception raised, on failure.
+    """
+
+    __slots__ = ("index", "params", "result", "exception")
+
+    def __init__(self, index, params, *, result=None, exception=None):
+        self.index = index
+        self.params = params
+        self.result = result
+        self.exception = exception
+
+    def __repr__(self):
+        outcome = "ok" if self.ok else repr(self.exception)
+        return f"<BatchResult #{ self.index } { outcome }>"
+
+    @property
+    def ok(self):
+        """``True`` if the search succeeded."""
+
+        return self.exception is None
+
+    def unwrap(self):
+        """Return the result, or re-raise the exception the search failed with."""
+
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+def _search_one(client, index, params, kwargs):
+    # Don't send searches the account's quota can't cover.
+    quota = getattr(client, "quota", None)
+    if quota is not None and not quota.try_reserve():
+        return BatchResult(index, params, exception=QuotaExceeded("The account has no searches left (on the plan, or for this hour)."))
+
+    try:
+        result = client.search(dict(params), **kwargs)
+    except Exception as e:
+        return BatchResult(index, params, exception=e)
+    finally:
+        if quota is not None:
+            quota.release()
+
+    return BatchResult(index, params, result=result)
+
+
+def search_many(client, params_iterable, *, max_workers=8, ordered=False, **kwargs):
+    """Issue many searches through ``client`` on a bounded thread pool, yielding a
+    :class:`BatchResult` for each one.
+
+    At most ``2 * max_workers`` searches are pending (in flight, or completed but
+    not yet yielded) at any time, so ``params_iterable`` may be a lazy generator of
+    any length.
+    """
+
+    def task(index, params):
+        return _search_one(client, index, params, kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from _run_windowed(executor, task, params_iterable, max_workers * 2, ordered)
+
+
+# The client used by a process pool worker; see search_many_processes.
+_process_client = None
+
+
+def _init_process(client):
+    global _process_client
+    # A client inherited through fork() drops its parent's connections on first use.
+    _process_client = client if hasattr(client, "search") else client()
+
+
+def _search_in_process(index, params, process, kwargs):
+    outcome = _search_one(_process_client, index, params, kwargs)
+    if outcome.ok and process is not None:
+        try:
+            outcome.result = process(outcome.result)
+        except Exception as e:
+            outcome.result, outcome.exception = None, e
+    return outcome
+
+
+def search_many_processes(client, params_iterable, process=None, *, processes=None, ordered=False, **kwargs):
+    """Issue many searches on a pool of worker processes, running ``process`` on each result in the
+    worker that fetched it, and yielding a :class:`BatchResult` (whose ``result`` is what ``process``
+    returned) for each one.
+
+    ``client`` is either a :class:`Client <serpapi.Client>`, which workers inherit through ``fork()``
+    (each then keeps its own connection pool, for every search it runs), or a picklable callable
+    returning one, *e.g.* ``functools.partial(serpapi.Client, api_key=...)``, which each worker calls
+    once; the latter also works where processes are spawned rather than forked (Windows, macOS).
+
+    ``process``, the parameters and the results must be picklable. :class:`SerpResults <serpapi.SerpResults>`
+    come back with ``client`` as their client, or, with a factory, with none: set ``results.client`` to fetch
+    further pages with :meth:`next_page <serpapi.SerpResults.next_page>`. Errors such as
+    :class:`HTTPError <serpapi.HTTPError>` come back without their ``response``, but with its ``response_text``.
+
+    Each worker would get its own copy of a :class:`RateLimiter <serpapi.RateLimiter>` or
+    :class:`QuotaTracker <serpapi.QuotaTracker>`, multiplying the rate (and the quota) by the number of
+    processes, so a client with either is refused with ``ValueError``. A factory should give each
+    worker's client its share instead, *e.g.* ``RateLimiter(rate / processes)``.
+    """
+
+    # Imported here: multiprocessing is only needed by process pools.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    processes = processes or os.cpu_count() or 1
+
+    if hasattr(client, "search"):
+        if getattr(client, "rate_limiter", None) is not None or getattr(client, "quota", None) is not None:
+            raise ValueError(
+                "Worker processes can't share a client's rate limiter or quota tracker; "
+                "pass a function that creates a client with its share of the rate instead."
+            )
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError(
+                "Worker processes can't inherit a client on this platform; pass a function that creates one instead."
+            )
+        context = multiprocessing.get_context("fork")
+    else:
+        context = None
+
+    task = functools.partial(_search_in_process, process=process, kwargs=kwargs)
+
+    # Results are pickled back without their client: give them the parent's, so that they can fetch further pages.
+    parent = client if hasattr(client, "search") else None
+
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=context, initializer=_init_process, initargs=(client,)
+    ) as executor:
+        for outcome in _run_windowed(executor, task, params_iterable, processes * 2, ordered):
+            if parent is not None and isinstance(outcome.result, SerpResults):
+                outcome.result.client = parent
+            yield outcome
+
+
+def _run_windowed(executor, task, params_iterable, window, ordered):
+    """Submit ``task(index, params)`` to ``executor`` for each item of ``params_iterable``, with at most
+    ``window`` pending at a time, and yield the :class:`BatchResult` each returns.
+    """
+
+    params_iter = enumerate(params_iterable)
+
+    pending = {}
+    completed = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            # Keep the pool saturated, without reading the input faster than it's consumed.
+            while not exhausted and len(pending) + len(completed) < window:
+                try:
+                    index, params = next(params_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = executor.submit(task, index, params)
+                pending[future] = (index, params)
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, params = pending.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    # e.g. a result that couldn't be sent back from a worker process.
+                    outcome = BatchResult(index, params, exception=e)
+
+                if ordered:
+                    completed[outcome.index] = outcome
+                else:
+                    yield outcome
+
+            # Release results in input order, as soon as the head of the line is ready.
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+    finally:
+        # If the caller stops iterating early, don't start searches nobody will read.
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,232 @@
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+from .utils import DEFAULT_ENGINE, params_digest
+
+
+class CacheStats:
+    """Counters describing how effective a :class:`ResponseCache` has been.
+
+    :param hits: lookups answered from the cache.
+    :param misses: lookups that had to go to SerpApi.com.
+    :param evictions: entries removed, either to make room or because they expired.
+    """
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self, hits=0, misses=0, evictions=0):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+
+    def __repr__(self):
+        return f"<CacheStats hits={ self.hits } misses={ self.misses } evictions={ self.evictions }>"
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups answered from the cache."""
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Base class for :class:`Client <serpapi.Client>` response caches.
+
+    Subclasses store raw response bodies by implementing :meth:`get` and :meth:`set`;
+    key derivation, per-engine TTLs and statistics are handled here. Subclass this to
+    plug in your own backend (*e.g.* Redis or memcached).
+
+    :param ttl: how long, in seconds, a response stays fresh. ``None`` means forever.
+    :param engine_ttls: per-engine overrides of ``ttl``, *e.g.* ``{"google_news": 300}``.
+    """
+
+    def __init__(self, *, ttl=3600, engine_ttls=None):
+        self.ttl = ttl
+        self.engine_ttls = engine_ttls or {}
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, key):
+        """Return the body stored under ``key``, or ``None`` if absent or expired."""
+
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        """Store the body ``value`` under ``key`` for ``ttl`` seconds (``None`` for no expiry)."""
+
+        raise NotImplementedError
+
+    def key_for(self, params):
+        """Return the cache key for a search's ``params``. The ``api_key`` is never part of it."""
+
+        return params_digest(params)
+
+    def ttl_for(self, params):
+        """Return the TTL for a search's ``params``, honouring ``engine_ttls``."""
+
+        engine = params.get("engine") or DEFAULT_ENGINE
+        return self.engine_ttls.get(engine, self.ttl)
+
+    def lookup(self, params):
+        """Return the cached body for ``params``, or ``None``. Updates :attr:`stats`."""
+
+        value = self.get(self.key_for(params))
+
+        with self._stats_lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+
+        return value
+
+    def store(self, params, value):
+        """Cache the body ``value`` of a successful search for ``params``."""
+
+        ttl = self.ttl_for(params)
+        if ttl is not None and ttl <= 0:
+            return
+
+        self.set(self.key_for(params), value, ttl)
+
+    def _evicted(self, count=1):
+        with self._stats_lock:
+            self.stats.evictions += count
+
+
+class MemoryCache(ResponseCache):
+    """An in-memory LRU cache, bounded by entry count and total body size.
+
+    :param max_entries: the maximum number of responses kept.
+    :param max_bytes: the maximum total size, in bytes, of the responses kept.
+    :param ttl: how long, in seconds, a response stays fresh. ``None`` means forever.
+    :param engine_ttls: per-engine overrides of ``ttl``.
+    """
+
+    def __init__(self, *, max_entries=1024, max_bytes=64 * 1024 * 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                self._remove(key)
+                self._evicted()
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        # A response larger than the whole cache would only flush everything else.
+        if len(value) > self.max_bytes:
+            return
+
+        expires = None if ttl is None else time.monotonic() + ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, expires)
+            self.size += len(value)
+
+            evicted = 0
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+
+        if evicted:
+            self._evicted(evicted)
+
+    def clear(self):
+        """Remove every entry."""
+
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        value, _ = self._entries.pop(key)
+        self.size -= len(value)
+
+
+class SQLiteCache(ResponseCache):
+    """An on-disk cache stored in a SQLite database, shared across processes and restarts.
+
+    :param path: the path of the database file.
+    :param ttl: how long, in seconds, a response stays fresh. ``None`` means forever.
+    :param engine_ttls: per-engine overrides of ``ttl``.
+    """
+
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+        )
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires = row
+            if expires is not None and expires <= time.time():
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._evicted()
+                return None
+
+            return value
+
+    def set(self, key, value, ttl):
+        expires = None if ttl is None else time.time() + ttl
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                (key, value, expires),
+            )
+
+    def purge(self):
+        """Delete every expired entry, and return how many were removed."""
+
+        with self._lock:
+            removed = self._db.execute(
+                "DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?",
+                (time.time(),),
+            ).rowcount
+
+        if removed:
+            self._evicted(removed)
+        return removed
+
+    def close(self):
+        """Close the database connection."""
+
+        with self._lock:
+            self._db.close()
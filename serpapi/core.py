@@ -1,12 +1,39 @@
-from .http import HTTPClient
+import threading
+import time
+
+from .http import HTTPClient, wire_bytes
 from .exceptions import SearchIDNotProvided
 from .models import SerpResults
+from .projection import Projection
+from .plan import QueryPlan
+from .batch import search_many as _search_many, search_many_processes as _search_many_processes
+from .streaming import iter_array as _iter_array
+from .singleflight import SingleFlight
+from .utils import REQUEST_OPTIONS, canonical_params, normalize_params
+from . import jsonlib
 
 
 class Client(HTTPClient):
     """A class that handles API requests to SerpApi in a user–friendly manner.
 
     :param api_key: The API Key to use for SerpApi.com.
+    :param timeout: the default timeout, in seconds, applied to every request.
+    :param pool_connections: the number of per-host connection pools to cache.
+    :param pool_maxsize: the maximum number of connections kept open per host. Set this to at least the number of threads sharing the client.
+    :param pool_block: if ``True``, wait for a free connection when the pool is exhausted, rather than opening (and later discarding) an extra one.
+    :param max_retries: the number of connection-level retries (an ``int`` or ``urllib3.util.Retry``) performed by the adapter.
+    :param keep_alive: if ``False``, send ``Connection: close`` and open a new connection for every request.
+    :param tcp_keepalive: if ``True``, enable ``SO_KEEPALIVE`` on pooled sockets, so idle connections survive NATs and load balancers.
+    :param compression: ``True`` (default) to accept every content coding the transport can decode (gzip, deflate, and br and zstd when their decoders are installed), ``False`` to disable compression, or an explicit ``Accept-Encoding`` value. Bytes received before and after decompression are reported by :meth:`transfer_stats`.
+    :param transport: an optional :class:`Transport <serpapi.transport.Transport>` to send requests with, *e.g.* :class:`HTTPXTransport <serpapi.HTTPXTransport>` for HTTP/2. Defaults to ``requests``; the connection pool options above apply to the default only, and passing them with another transport raises ``TypeError``.
+    :param retry: an optional :class:`RetryPolicy <serpapi.RetryPolicy>` for transient failures (timeouts, connection errors, 429s and 5xx). It can be overridden per call with ``retry=...`` (or ``retry=False``).
+    :param rate_limiter: an optional :class:`RateLimiter <serpapi.RateLimiter>` that paces searches (and retries) before they are sent. It is thread-safe, so one limiter can be shared by every thread using the client.
+    :param cache: an optional :class:`ResponseCache <serpapi.ResponseCache>` (*e.g.* :class:`MemoryCache <serpapi.MemoryCache>`) that :meth:`search` consults before going to SerpApi.com.
+    :param coalesce: if ``True``, concurrent identical searches (same parameters, in any order) share a single request, and all receive the same :class:`SerpResults <serpapi.SerpResults>` object, or the same exception.
+    :param hooks: callables that receive an :class:`Event <serpapi.instrumentation.Event>` for every request attempt, retry, cache lookup and decoded response (*e.g.* a :class:`MetricsRegistry <serpapi.MetricsRegistry>`). More can be added with :meth:`add_hook`. When there are none, nothing is measured.
+    :param location_index: an optional :class:`LocationIndex <serpapi.LocationIndex>`. If given, :meth:`search` normalises the ``location`` parameter to its canonical name, and raises :class:`InvalidLocation <serpapi.InvalidLocation>` for an unknown one, without an HTTP call.
+    :param archive: an optional :class:`ArchiveStore <serpapi.ArchiveStore>`. If given, every successful search is stored in it, and :meth:`search_archive` reads from it before going to SerpApi.com.
+    :param lazy_results: if ``True``, :class:`SerpResults <serpapi.SerpResults>` keep the raw response and decode each top-level section (*e.g.* ``organic_results``) only when it is first accessed.
 
     Please provide ``api_key`` when instantiating this class. We recommend storing this in an environment variable, like so:
 
@@ -25,8 +52,26 @@ class Client(HTTPClient):
 
     DASHBOARD_URL = "https://serpapi.com/dashboard"
 
-    def __init__(self, *, api_key=None, timeout=None):
-        super().__init__(api_key=api_key, timeout=timeout)
+    def __init__(
+        self,
+        *,
+        api_key=None,
+        timeout=None,
+        cache=None,
+        lazy_results=False,
+        coalesce=False,
+        location_index=None,
+        archive=None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, timeout=timeout, **kwargs)
+        self.cache = cache
+        self.archive = archive
+        self.location_index = location_index
+        # Set by QuotaTracker, which attaches itself to the client it tracks.
+        self.quota = None
+        self.lazy_results = lazy_results
+        self.in_flight = SingleFlight() if coalesce else None
 
     def __repr__(self):
         return "<SerpApi Client>"
@@ -55,30 +100,208 @@ class Client(HTTPClient):
         :param engine: the search engine to use. Defaults to ``google``.
         :param output: the output format desired (``html`` or ``json``). Defaults to ``json``.
         :param api_key: the API Key to use for SerpApi.com.
+        :param no_cache: if ``true``, bypass both SerpApi's cache and the client's :class:`ResponseCache <serpapi.ResponseCache>`, if any.
+        :param projection: keep only some fields of the results: a :class:`Projection <serpapi.Projection>`, or selectors
+            such as ``["search_metadata.id", "organic_results[*].{title,link}"]``. It is sent as ``json_restrictor``, too.
         :param **: any additional parameters to pass to the API.
 
 
         **Learn more**: https://serpapi.com/search-api
         """
-        if params is None:
-            params = {}
+        projection = Projection.coerce(kwargs.pop("projection", None))
+        params, request_kwargs = self._search_params(params, kwargs)
+
+        if projection is not None:
+            params = projection.restrict(params)
+
+        # Honour SerpApi's own ``no_cache`` parameter for the local cache, too.
+        use_cache = (
+            self.cache is not None
+            and str(params.get("no_cache", "")).lower() != "true"
+            and not request_kwargs.get("stream")
+        )
+
+        if use_cache:
+            content = self.cache.lookup(params)
+            if self.hooks:
+                self.emit("cache_hit" if content is not None else "cache_miss", engine=params.get("engine"))
+            if content is not None:
+                return SerpResults.from_cache(content, client=self, projection=projection)
+
+        def fetch():
+            r = self.request("GET", "/search", params=params, **request_kwargs)
+
+            if self.hooks:
+                results = self._decode_observed(r, params, projection)
+            else:
+                results = SerpResults.from_http_response(r, client=self, projection=projection)
+
+            failed = isinstance(results, SerpResults) and "error" in results
+
+            # Only successful JSON results are worth keeping.
+            if use_cache and isinstance(results, SerpResults) and not failed:
+                self.cache.store(params, r.content)
+
+            # A json_restrictor'ed body is only part of the search, and mustn't stand in for it.
+            if (
+                self.archive is not None
+                and isinstance(results, SerpResults)
+                and not failed
+                and "json_restrictor" not in params
+            ):
+                self.archive.store(r.content, None if projection is not None else results)
+
+            # SerpApi doesn't charge for searches that return an error.
+            if self.quota is not None and not failed:
+                self.quota.record()
+
+            return results
+
+        if self.in_flight is not None and not request_kwargs.get("stream"):
+            # Searches only share a result if they keep the same fields of it.
+            return self.in_flight.do((canonical_params(params), projection), fetch)
+
+        return fetch()
+
+    def _search_params(self, params, kwargs):
+        """Return a search's API parameters, normalised as they are sent, and the arguments meant for the HTTP request itself."""
+
+        # Work on a copy: the caller's dict is never modified.
+        params = dict(params or {})
 
         # These are arguments that should be passed to the underlying requests.request call.
         request_kwargs = {}
-        for key in ["timeout", "proxies", "verify", "stream", "cert"]:
+        for key in REQUEST_OPTIONS:
             if key in kwargs:
                 request_kwargs[key] = kwargs.pop(key)
 
         if kwargs:
             params.update(kwargs)
 
-        r = self.request("GET", "/search", params=params, **request_kwargs)
+        return normalize_params(params, location_index=self.location_index), request_kwargs
+
+    def _decode_observed(self, r, params, projection=None):
+        """Decode a search response, and emit a ``decoded`` event with the time it took."""
+
+        started = time.perf_counter()
+        results = SerpResults.from_http_response(r, client=self, projection=projection)
+        decode_time = time.perf_counter() - started
+
+        total_time_taken = None
+        if isinstance(results, SerpResults):
+            total_time_taken = (results.get("search_metadata") or {}).get("total_time_taken")
+
+        self.emit(
+            "decoded",
+            request_id=getattr(r, "request_id", None),
+            path="/search",
+            engine=params.get("engine"),
+            decode_time=decode_time,
+            total_time_taken=total_time_taken,
+        )
+        return results
+
+    def search_stream(self, key, params: dict = None, *, chunk_size=65536, **kwargs):
+        """Run a search, and iterate over the items of one of its top-level arrays as the response arrives.
+
+        The response body is parsed incrementally: only one item is decoded and held in memory
+        at a time, and other sections of the response are skipped without being decoded. This
+        keeps memory flat for large responses (*e.g.* Google Maps ``local_results``).
+
+        .. code-block:: python
+
+            >>> for place in client.search_stream("local_results", engine="google_maps", q="Coffee"):
+            ...     print(place["title"])
+
+        :param key: the top-level array to iterate over, *e.g.* ``organic_results``.
+        :param chunk_size: the number of bytes read from the connection at a time.
+        :param **: any additional parameters to pass to the API, as with :meth:`search`.
+
+        The request is sent (and HTTP errors raised) immediately; the body is read as the returned generator is consumed.
+        If the body has a top-level ``error`` instead of results (*e.g.* "Google hasn't returned any results for this query."),
+        iterating raises :class:`SearchError <serpapi.SearchError>`.
+        """
+        params, request_kwargs = self._search_params(params, kwargs)
+        request_kwargs.pop("stream", None)
+
+        r = self.request("GET", "/search", params=params, stream=True, **request_kwargs)
+
+        # The body hasn't been read yet, so an ``error`` in it can't be told apart: count the search
+        # as soon as it is answered, erring on the side of fewer searches left.
+        if self.quota is not None:
+            self.quota.record()
+
+        return _stream_array(self, r, key, chunk_size)
+
+    def search_many(self, params_iterable, *, max_workers=8, ordered=False, dedupe=False, **kwargs):
+        """Run many searches concurrently on a bounded thread pool. Returns a generator of
+        :class:`BatchResult <serpapi.BatchResult>` records, one per search.
 
-        return SerpResults.from_http_response(r, client=self)
+        A failed search does not abort the batch: its exception (*e.g.* :class:`HTTPError <serpapi.HTTPError>`)
+        is recorded on its ``BatchResult`` instead.
+
+        .. code-block:: python
+
+            >>> keywords = ["coffee", "tea", "matcha"]
+            >>> for item in client.search_many(({"q": q} for q in keywords), timeout=10):
+            ...     if item.ok:
+            ...         print(item.params["q"], item.result["search_metadata"]["id"])
+            ...     else:
+            ...         print(item.params["q"], "failed:", item.exception)
+
+        :param params_iterable: an iterable of parameter dictionaries, one per search. It is consumed lazily.
+        :param max_workers: the maximum number of searches in flight at once.
+        :param ordered: if ``True``, yield results in input order; otherwise (default), yield each as soon as it completes.
+        :param dedupe: if ``True``, send each distinct search once, and yield its result for every duplicate too (see
+            :class:`QueryPlan <serpapi.QueryPlan>`, which also reports how many searches were saved). The input is then read in full up front.
+        :param **: any additional arguments to pass to every :meth:`search` call, *e.g.* ``timeout``.
+        """
+
+        if dedupe:
+            plan = QueryPlan(params_iterable, location_index=self.location_index)
+            return plan.run(self, max_workers=max_workers, ordered=ordered, **kwargs)
+
+        return _search_many(
+            self, params_iterable, max_workers=max_workers, ordered=ordered, **kwargs
+        )
+
+    def search_many_processes(self, params_iterable, process=None, *, processes=None, ordered=False, **kwargs):
+        """Run many searches on a pool of worker processes, for batches whose post-processing is CPU-bound.
+        Returns a generator of :class:`BatchResult <serpapi.BatchResult>` records, one per search.
+
+        Each worker process inherits this client, and with it a connection pool of its own that
+        it reuses for every search it runs. ``process`` is called on each result in the worker
+        that fetched it, and its return value becomes the record's ``result``.
+
+        .. code-block:: python
+
+            >>> def titles(results):
+            ...     return [r["title"] for r in results.get("organic_results", [])]
+            >>> for item in client.search_many_processes(({"q": q} for q in keywords), titles, processes=4):
+            ...     print(item.params["q"], item.result)
+
+        :param params_iterable: an iterable of parameter dictionaries, one per search. It is consumed lazily.
+        :param process: a picklable, module-level function to apply to each :class:`SerpResults <serpapi.SerpResults>`.
+        :param processes: the number of worker processes. Defaults to the number of CPUs.
+        :param ordered: if ``True``, yield results in input order; otherwise (default), yield each as soon as it completes.
+        :param **: any additional arguments to pass to every :meth:`search` call, *e.g.* ``timeout``.
+
+        Workers are started with ``fork()``, which isn't available on Windows; see
+        :func:`serpapi.batch.search_many_processes` to pass a client factory instead. A client with a
+        ``rate_limiter`` or a :class:`QuotaTracker <serpapi.QuotaTracker>` is refused with ``ValueError``, as
+        each worker would get its own copy of them.
+        """
+
+        return _search_many_processes(
+            self, params_iterable, process, processes=processes, ordered=ordered, **kwargs
+        )
 
     def search_archive(self, params: dict = None, **kwargs):
         """Get a result from the SerpApi Search Archive API.
 
+        If the client has an :class:`ArchiveStore <serpapi.ArchiveStore>`, the search is read from it when
+        present, without an HTTP call; otherwise it is fetched, and stored there.
+
         :param search_id: the Search ID of the search to retrieve from the archive.
         :param api_key: the API Key to use for SerpApi.com.
         :param output: the output format desired (``html`` or ``json``). Defaults to ``json``.
@@ -86,12 +309,12 @@ class Client(HTTPClient):
 
         **Learn more**: https://serpapi.com/search-archive-api
         """
-        if params is None:
-            params = {}
+        # Work on a copy: the caller's dict is never modified.
+        params = dict(params or {})
 
         # These are arguments that should be passed to the underlying requests.request call.
         request_kwargs = {}
-        for key in ["timeout", "proxies", "verify", "stream", "cert"]:
+        for key in REQUEST_OPTIONS:
             if key in kwargs:
                 request_kwargs[key] = kwargs.pop(key)
 
@@ -105,8 +328,26 @@ class Client(HTTPClient):
                 f"Please provide 'search_id', found here: { self.DASHBOARD_URL }"
             )
 
-        r = self.request("GET", f"/searches/{ search_id }", params=params, **request_kwargs)
-        return SerpResults.from_http_response(r, client=self)
+        use_archive = (
+            self.archive is not None
+            and params.get("output", "json") == "json"
+            and not request_kwargs.get("stream")
+        )
+
+        if use_archive:
+            results = self.archive.load(search_id, client=self)
+            if results is not None:
+                return results
+
+        r = self.request(
+            "GET", f"/searches/{ search_id }", params=params, throttle=False, **request_kwargs
+        )
+        results = SerpResults.from_http_response(r, client=self)
+
+        if use_archive and isinstance(results, SerpResults) and "error" not in results:
+            self.archive.store(r.content, results)
+
+        return results
 
     def locations(self, params: dict = None, **kwargs):
         """Get a list of supported Google locations.
@@ -118,12 +359,12 @@ class Client(HTTPClient):
 
         **Learn more**: https://serpapi.com/locations-api
         """
-        if params is None:
-            params = {}
+        # Work on a copy: the caller's dict is never modified.
+        params = dict(params or {})
 
         # These are arguments that should be passed to the underlying requests.request call.
         request_kwargs = {}
-        for key in ["timeout", "proxies", "verify", "stream", "cert"]:
+        for key in REQUEST_OPTIONS:
             if key in kwargs:
                 request_kwargs[key] = kwargs.pop(key)
 
@@ -135,6 +376,7 @@ class Client(HTTPClient):
             "/locations.json",
             params=params,
             assert_200=True,
+            throttle=False,
             **request_kwargs,
         )
         return r.json()
@@ -148,25 +390,53 @@ class Client(HTTPClient):
         **Learn more**: https://serpapi.com/account-api
         """
 
-        if params is None:
-            params = {}
+        # Work on a copy: the caller's dict is never modified.
+        params = dict(params or {})
 
         # These are arguments that should be passed to the underlying requests.request call.
         request_kwargs = {}
-        for key in ["timeout", "proxies", "verify", "stream", "cert"]:
+        for key in REQUEST_OPTIONS:
             if key in kwargs:
                 request_kwargs[key] = kwargs.pop(key)
 
         if kwargs:
             params.update(kwargs)
 
-        r = self.request("GET", "/account.json", params=params, assert_200=True, **request_kwargs)
+        r = self.request(
+            "GET", "/account.json", params=params, assert_200=True, throttle=False, **request_kwargs
+        )
         return r.json()
 
 
-# An un-authenticated client instance.
-_client = Client()
-search = _client.search
-search_archive = _client.search_archive
-locations = _client.locations
-account = _client.account
+def _stream_array(client, r, key, chunk_size):
+    content = 0
+
+    def chunks():
+        nonlocal content
+        for chunk in r.iter_content(chunk_size=chunk_size):
+            content += len(chunk)
+            yield chunk
+
+    try:
+        yield from _iter_array(chunks(), key, loads=jsonlib.loads, raise_errors=True)
+    finally:
+        # Count what was read, then release the connection, even if the caller stops iterating early.
+        client.record_transfer(wire_bytes(r), content)
+        r.close()
+
+
+# An un-authenticated client instance, created (with its connection pool) on first use.
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def __getattr__(name):
+    global _default_client
+
+    if name == "_client" or name in ("search", "search_archive", "locations", "account"):
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+        return _default_client if name == "_client" else getattr(_default_client, name)
+
+    raise AttributeError(f"module { repr(__name__) } has no attribute { repr(name) }")
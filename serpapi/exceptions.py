@@ -4,7 +4,8 @@ import requests
 class SerpApiError(Exception):
     """Base class for exceptions in this module."""
 
-    pass
+    #: The number of attempts made before giving up, when a :class:`RetryPolicy <serpapi.RetryPolicy>` is in use.
+    attempts = 1
 
 
 class APIKeyNotProvided(ValueError, SerpApiError):
@@ -19,17 +20,44 @@ class SearchIDNotProvided(ValueError, SerpApiError):
     pass
 
 
+class InvalidLocation(ValueError, SerpApiError):
+    """The ``location`` parameter doesn't match a known location."""
+
+    def __init__(self, message, *, suggestions=()):
+        super().__init__(message)
+        #: The canonical names of the closest known locations.
+        self.suggestions = list(suggestions)
+
+
+class QuotaExceeded(SerpApiError):
+    """The account's searches, for the plan or for this hour, are used up."""
+
+    pass
+
+
+class SearchError(SerpApiError):
+    """SerpApi.com answered a search with an ``error`` message instead of results, *e.g.* because there were none."""
+
+    def __init__(self, error):
+        super().__init__(error)
+        #: The ``error`` message from the response.
+        self.error = error
+
+
 class HTTPError(requests.exceptions.HTTPError, SerpApiError):
     """HTTP Error."""
 
-    def __init__(self, original_exception):
-        if (isinstance(original_exception, requests.exceptions.HTTPError)):
-            http_error_exception: requests.exceptions.HTTPError = original_exception
+    #: The body of the response, for errors that were pickled (which drops ``response``).
+    response_text = None
 
-            self.status_code = http_error_exception.response.status_code
+    def __init__(self, original_exception):
+        # Both requests' and httpx's status errors carry the offending response.
+        response = getattr(original_exception, "response", None)
+        if response is not None:
+            self.status_code = response.status_code
             try:
-                self.error = http_error_exception.response.json().get("error", None)
-            except requests.exceptions.JSONDecodeError:
+                self.error = response.json().get("error", None)
+            except ValueError:
                 self.error = None
         else:
             self.status_code = -1
@@ -37,6 +65,22 @@ class HTTPError(requests.exceptions.HTTPError, SerpApiError):
                 
         super().__init__(*original_exception.args, response=getattr(original_exception, 'response', None), request=getattr(original_exception, 'request', None))
 
+    def __reduce__(self):
+        # The response (and the exception it came from) can't always be pickled, e.g. to be sent back from a
+        # worker process: pickle a summary instead, without them.
+        state = {key: value for key, value in self.__dict__.items() if key not in ("response", "request")}
+        if self.response is not None:
+            state["response_text"] = self.response.text
+        return (_restore_http_error, (type(self), tuple(str(arg) for arg in self.args), state))
+
+
+def _restore_http_error(cls, args, state):
+    error = cls.__new__(cls)
+    Exception.__init__(error, *args)
+    error.response = error.request = None
+    error.__dict__.update(state)
+    return error
+
 
 
 class HTTPConnectionError(HTTPError, requests.exceptions.ConnectionError, SerpApiError):
@@ -0,0 +1,155 @@
+from . import jsonlib
+from .batch import BatchResult
+from .models import SerpResults
+
+
+def iter_pages(source, *, max_pages=1):
+    """Yield every page of results in ``source``, one at a time, so that memory stays
+    bounded no matter how many pages are exported.
+
+    :param source: a :class:`SerpResults <serpapi.SerpResults>`, or an iterable of them
+        (or of :class:`BatchResult <serpapi.BatchResult>` records, as yielded by
+        :meth:`Client.search_many <serpapi.Client.search_many>`; failed searches are skipped).
+    :param max_pages: the number of pages to pull for each search, via ``yield_pages``.
+    """
+
+    if isinstance(source, SerpResults):
+        source = [source]
+
+    for results in source:
+        if isinstance(results, BatchResult):
+            if not results.ok:
+                continue
+            results = results.result
+
+        if isinstance(results, SerpResults):
+            yield from results.yield_pages(max_pages=max_pages)
+
+
+def flatten_record(record, *, separator="."):
+    """Flatten nested dictionaries into a single level of ``separator``-joined column names.
+
+    Lists of scalars are kept as they are; lists containing objects are encoded as JSON
+    strings, so that every column has a consistent, Arrow/Parquet-friendly type.
+    """
+
+    flat = {}
+
+    def walk(value, prefix):
+        if isinstance(value, dict):
+            for key, child in value.items():
+                walk(child, f"{ prefix }{ separator }{ key }" if prefix else key)
+        elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+            flat[prefix] = jsonlib.dumps(value).decode("utf-8")
+        else:
+            flat[prefix] = value
+
+    walk(record, "")
+    return flat
+
+
+def iter_records(source, keys, *, max_pages=1, annotate=False, flatten=False):
+    """Yield the items of the result arrays ``keys`` (*e.g.* ``organic_results``) across all pages of ``source``.
+
+    :param source: see :func:`iter_pages`.
+    :param keys: the names of the result arrays to export.
+    :param max_pages: the number of pages to pull for each search.
+    :param annotate: if ``True``, add ``_search_id`` and ``_result_type`` to every record.
+    :param flatten: if ``True``, flatten each record with :func:`flatten_record`.
+    """
+
+    if isinstance(keys, str):
+        keys = [keys]
+
+    for page in iter_pages(source, max_pages=max_pages):
+        search_id = (page.get("search_metadata") or {}).get("id")
+
+        for key in keys:
+            for item in page.get(key) or []:
+                if annotate:
+                    item = dict(item, _search_id=search_id, _result_type=key)
+                if flatten:
+                    item = flatten_record(item)
+                yield item
+
+
+def export_ndjson(source, fp, keys, *, max_pages=1, annotate=True, flatten=False, buffer_size=1 << 20):
+    """Write the items of the result arrays ``keys`` to ``fp`` as newline-delimited JSON.
+
+    .. code-block:: python
+
+        >>> results = client.search(q="Coffee")
+        >>> with open("organic.ndjson", "wb") as f:
+        ...     serpapi.export.export_ndjson(results, f, ["organic_results"], max_pages=10)
+        97
+
+    :param fp: a file object opened in binary mode, or a path to write to.
+    :param buffer_size: the number of bytes gathered in memory between writes.
+
+    See :func:`iter_records` for the other parameters. Returns the number of records written.
+    """
+
+    if isinstance(fp, str):
+        with open(fp, "wb") as f:
+            return export_ndjson(
+                source, f, keys,
+                max_pages=max_pages, annotate=annotate, flatten=flatten, buffer_size=buffer_size,
+            )
+
+    count = 0
+    buffered = 0
+    lines = []
+
+    for record in iter_records(source, keys, max_pages=max_pages, annotate=annotate, flatten=flatten):
+        line = jsonlib.dumps(record) + b"\n"
+        lines.append(line)
+        buffered += len(line)
+        count += 1
+
+        if buffered >= buffer_size:
+            fp.write(b"".join(lines))
+            lines.clear()
+            buffered = 0
+
+    if lines:
+        fp.write(b"".join(lines))
+
+    return count
+
+
+def iter_column_batches(source, keys, *, batch_size=10_000, max_pages=1, annotate=True):
+    """Yield flattened records in columnar batches: ``{column: [values...]}`` dictionaries
+    of at most ``batch_size`` rows, ready for ``pyarrow.RecordBatch.from_pydict`` or
+    ``pandas.DataFrame``.
+
+    Every column in a batch has one value per row; columns a record lacks are filled with ``None``.
+
+    .. code-block:: python
+
+        >>> import pyarrow as pa, pyarrow.parquet as pq
+        >>> batches = serpapi.export.iter_column_batches(results, ["organic_results"], max_pages=10)
+        >>> with pq.ParquetWriter("organic.parquet", schema) as writer:
+        ...     for batch in batches:
+        ...         writer.write_batch(pa.RecordBatch.from_pydict(batch, schema=schema))
+
+    See :func:`iter_records` for the other parameters.
+    """
+
+    columns = {}
+    rows = 0
+
+    for record in iter_records(source, keys, max_pages=max_pages, annotate=annotate, flatten=True):
+        for column in record:
+            if column not in columns:
+                columns[column] = [None] * rows
+        for column, values in columns.items():
+            values.append(record.get(column))
+        rows += 1
+
+        if rows >= batch_size:
+            yield columns
+            columns = {}
+            rows = 0
+
+    if rows:
+        yield columns
@@ -1,11 +1,151 @@
+import os
+import socket
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 from .exceptions import (
     HTTPError,
-    HTTPConnectionError,
     TimeoutError,
 )
 from .__version__ import __version__
+from .instrumentation import Event, next_request_id, path_of
+from .transport import RequestsTransport
+
+# The time spent opening the connection used by the current thread's request, if it opened one.
+_connect_timing = threading.local()
+
+
+class PoolStats:
+    """A snapshot of connection reuse in an :class:`HTTPClient`'s connection pools.
+
+    :param connections_created: the number of connections opened (each one paying a TCP and TLS handshake).
+    :param requests: the number of requests sent over those connections.
+    """
+
+    __slots__ = ("connections_created", "requests")
+
+    def __init__(self, connections_created=0, requests=0):
+        self.connections_created = connections_created
+        self.requests = requests
+
+    def __repr__(self):
+        return (
+            f"<PoolStats created={ self.connections_created } reused={ self.connections_reused }>"
+        )
+
+    @property
+    def connections_reused(self):
+        """The number of requests that were sent over an already-open connection."""
+
+        return max(self.requests - self.connections_created, 0)
+
+
+class TransferStats:
+    """A snapshot of the bytes an :class:`HTTPClient` has received, before and after decompression.
+
+    :param responses: the number of response bodies counted.
+    :param wire_bytes: the bytes received over the wire (compressed, if the server compressed them).
+    :param content_bytes: the bytes of the decompressed bodies.
+    """
+
+    __slots__ = ("responses", "wire_bytes", "content_bytes")
+
+    def __init__(self, responses=0, wire_bytes=0, content_bytes=0):
+        self.responses = responses
+        self.wire_bytes = wire_bytes
+        self.content_bytes = content_bytes
+
+    def __repr__(self):
+        return (
+            f"<TransferStats responses={ self.responses } wire={ self.wire_bytes } content={ self.content_bytes }>"
+        )
+
+    @property
+    def saved_bytes(self):
+        """The number of bytes compression saved."""
+
+        return self.content_bytes - self.wire_bytes
+
+    @property
+    def ratio(self):
+        """The compression ratio (decompressed size over transferred size), or ``None`` before any transfer."""
+
+        return self.content_bytes / self.wire_bytes if self.wire_bytes else None
+
+
+def wire_bytes(r):
+    """Return the number of body bytes ``r`` has received over the wire so far, or ``None`` if unknown."""
+
+    tell = getattr(r.raw, "tell", None)
+    return tell() if tell is not None else None
+
+
+def _counting_pool(pool_cls, adapter):
+    """Return a subclass of ``pool_cls`` whose connections count each socket they open."""
+
+    class CountingConnection(pool_cls.ConnectionCls):
+        def connect(self):
+            started = time.perf_counter()
+            super().connect()
+            _connect_timing.seconds = time.perf_counter() - started
+            with adapter.stats_lock:
+                adapter.stats.connections_created += 1
+
+    return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": CountingConnection})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """An ``HTTPAdapter`` that counts the connections it opens and the requests it sends.
+
+    :param socket_options: extra socket options applied to every new connection.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options", "stats"]
+
+    def __init__(self, *, socket_options=None, **kwargs):
+        self.socket_options = socket_options
+        self.stats = PoolStats()
+        self.stats_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def __setstate__(self, state):
+        self.stats_lock = threading.Lock()
+        super().__setstate__(state)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        # Kept, so that the pools can be rebuilt with the same sizes (see RequestsTransport.after_fork).
+        self.pool_connections = connections
+        self.pool_maxsize = maxsize
+        self.pool_block = block
+
+        if self.socket_options:
+            pool_kwargs.setdefault(
+                "socket_options", HTTPConnection.default_socket_options + self.socket_options
+            )
+
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+        # Counting at connect() time also catches stale keep-alive connections
+        # that urllib3 silently re-opens, not just brand new ones.
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool(pool_cls, self)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, request, **kwargs):
+        with self.stats_lock:
+            self.stats.requests += 1
+        return super().send(request, **kwargs)
+
+    def pool_stats(self):
+        """Return a snapshot of this adapter's :class:`PoolStats`."""
+
+        with self.stats_lock:
+            return PoolStats(self.stats.connections_created, self.stats.requests)
 
 
 class HTTPClient:
@@ -14,17 +154,165 @@ class HTTPClient:
     BASE_DOMAIN = "https://serpapi.com"
     USER_AGENT = f"serpapi-python, v{__version__}"
 
-    def __init__(self, *, api_key=None, timeout=None):
+    def __init__(
+        self,
+        *,
+        api_key=None,
+        timeout=None,
+        pool_connections=None,
+        pool_maxsize=None,
+        pool_block=None,
+        max_retries=None,
+        keep_alive=None,
+        tcp_keepalive=None,
+        retry=None,
+        rate_limiter=None,
+        hooks=None,
+        transport=None,
+        compression=True,
+    ):
         # Used to authenticate requests.
         # TODO: do we want to support the environment variable? Seems like a security risk.
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks or [])
 
-    def request(self, method, path, params, *, assert_200=True, **kwargs):
-        # Inject the API Key into the params.
+        self.transport = transport if transport is not None else RequestsTransport()
+
+        # The connection pool options only apply to the default, requests-based transport.
+        pool_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "max_retries": max_retries,
+            "keep_alive": keep_alive,
+            "tcp_keepalive": tcp_keepalive,
+        }
+        if isinstance(self.transport, RequestsTransport):
+            self.adapter = PooledHTTPAdapter(
+                pool_connections=10 if pool_connections is None else pool_connections,
+                pool_maxsize=10 if pool_maxsize is None else pool_maxsize,
+                pool_block=bool(pool_block),
+                max_retries=max_retries or 0,
+                socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] if tcp_keepalive else None,
+            )
+        else:
+            given = [name for name, value in pool_options.items() if value is not None]
+            if given:
+                raise TypeError(
+                    f"{ type(self.transport).__name__ } doesn't support { ', '.join(given) }; configure the transport instead."
+                )
+            self.adapter = None
+
+        # Ask for every content coding the transport can decode, unless told otherwise.
+        if compression is True:
+            self.accept_encoding = self.transport.accept_encoding
+        elif not compression:
+            self.accept_encoding = "identity"
+        else:
+            self.accept_encoding = compression
+
+        self.transfer = TransferStats()
+        self._transfer_lock = threading.Lock()
+
+        # The process the client's connections were opened in; see _ensure_own_connections.
+        self._pid = os.getpid()
+        self._fork_lock = threading.Lock()
+
+        if isinstance(self.transport, RequestsTransport):
+            self.session.mount("https://", self.adapter)
+            self.session.mount("http://", self.adapter)
+
+            # Without keep-alive, every request is sent over a fresh connection.
+            if keep_alive is False:
+                self.session.headers["Connection"] = "close"
+
+    @property
+    def session(self):
+        """The transport's session: a ``requests.Session``, unless another :class:`Transport <serpapi.transport.Transport>` is in use."""
+
+        return self.transport.session
+
+    @session.setter
+    def session(self, session):
+        self.transport.session = session
+
+    def close(self):
+        """Close the transport's connections."""
+
+        self.transport.close()
+
+    def _ensure_own_connections(self):
+        """After ``os.fork()`` (*e.g.* in a prefork server's or a process pool's workers), have the
+        transport drop the connections inherited from the parent, before this process sends anything.
+        The client can therefore be created once, before forking, and reused in every child.
+        """
+
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        with self._fork_lock:
+            if self._pid == pid:
+                return
+            self.transport.after_fork()
+            # Counts and locks inherited from the parent describe (and may be held by) its threads.
+            if self.adapter is not None:
+                self.adapter.stats = PoolStats()
+                self.adapter.stats_lock = threading.Lock()
+            self.transfer = TransferStats()
+            self._transfer_lock = threading.Lock()
+            self._pid = pid
+
+    def pool_stats(self):
+        """Return a :class:`PoolStats <serpapi.http.PoolStats>` snapshot of connections created vs. reused,
+        or ``None`` if the transport doesn't use the pooled adapter.
+        """
+
+        if self.adapter is None:
+            return None
+        return self.adapter.pool_stats()
+
+    def transfer_stats(self):
+        """Return a :class:`TransferStats <serpapi.http.TransferStats>` snapshot of bytes received, compressed vs. decompressed."""
+
+        with self._transfer_lock:
+            return TransferStats(self.transfer.responses, self.transfer.wire_bytes, self.transfer.content_bytes)
+
+    def record_transfer(self, wire, content):
+        """Count a response body of ``content`` bytes, of which ``wire`` were received over the wire."""
+
+        with self._transfer_lock:
+            self.transfer.responses += 1
+            self.transfer.wire_bytes += content if wire is None else wire
+            self.transfer.content_bytes += content
+
+    def add_hook(self, hook):
+        """Register ``hook``, a callable that receives every :class:`Event <serpapi.instrumentation.Event>` this client emits."""
+
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Unregister a hook added with :meth:`add_hook`."""
+
+        self.hooks.remove(hook)
+
+    def emit(self, name, **fields):
+        """Send an :class:`Event <serpapi.instrumentation.Event>` to every registered hook.
+
+        Callers check ``self.hooks`` first, so that nothing is measured or built when there are none.
+        """
+
+        event = Event(name, **fields)
+        for hook in self.hooks:
+            hook(event)
+
+    def request(self, method, path, params, *, assert_200=True, throttle=True, **kwargs):
+        # Inject the API Key into (a copy of) the params.
         if "api_key" not in params:
-            params["api_key"] = self.api_key
+            params = dict(params, api_key=self.api_key)
 
         # Build the URL, as needed.
         if not path.startswith("http"):
@@ -32,22 +320,103 @@ class HTTPClient:
         else:
             url = path
 
-        # Make the HTTP request.
-        try:
-            headers = {"User-Agent": self.USER_AGENT}
+        # Use the default retry policy, unless one (or False) was given for this call.
+        retry = kwargs.pop("retry", self.retry)
 
-            # Use the default timeout if one was provided to the client.
-            if self.timeout and "timeout" not in kwargs:
-                kwargs["timeout"] = self.timeout
+        attempt = 0
+        while True:
+            attempt += 1
 
-            r = self.session.request(
-                method=method, url=url, params=params, headers=headers, **kwargs
+            # Searches wait for the rate limiter; free endpoints (account, archive, locations) don't.
+            if throttle and self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                if self.hooks:
+                    r = self._send_observed(method, url, params, attempt, assert_200=assert_200, **kwargs)
+                else:
+                    r = self._send(method, url, params, assert_200=assert_200, **kwargs)
+            except (HTTPError, TimeoutError) as e:
+                e.attempts = attempt
+                delay = retry.next_delay(e, attempt) if retry else None
+                if delay is None:
+                    raise
+                # Release the failed attempt's connection, which a streamed response would otherwise keep.
+                response = getattr(e, "response", None)
+                if response is not None:
+                    response.close()
+                if self.hooks:
+                    self.emit(
+                        "retry",
+                        request_id=getattr(e, "request_id", None),
+                        path=path_of(url),
+                        engine=params.get("engine"),
+                        attempt=attempt,
+                        delay=delay,
+                        error=e,
+                    )
+                time.sleep(delay)
+                continue
+
+            r.attempts = attempt
+            return r
+
+    def _send_observed(self, method, url, params, attempt, **kwargs):
+        """Like :meth:`_send`, but emit ``request_start`` and ``request_end`` events around it."""
+
+        fields = dict(
+            request_id=next_request_id(),
+            method=method,
+            path=path_of(url),
+            engine=params.get("engine"),
+            attempt=attempt,
+        )
+        self.emit("request_start", **fields)
+
+        _connect_timing.seconds = None
+        started = time.perf_counter()
+        r = error = None
+        try:
+            r = self._send(method, url, params, **kwargs)
+            return r
+        except Exception as e:
+            error = e
+            e.request_id = fields["request_id"]
+            r = getattr(e, "response", None)
+            raise
+        finally:
+            self.emit(
+                "request_end",
+                elapsed=time.perf_counter() - started,
+                status_code=r.status_code if r is not None else None,
+                server_time=r.elapsed.total_seconds() if r is not None else None,
+                connect_time=_connect_timing.seconds,
+                # A streamed body hasn't been read yet.
+                response_bytes=len(r.content) if r is not None and not kwargs.get("stream") else None,
+                wire_bytes=wire_bytes(r) if r is not None and not kwargs.get("stream") else None,
+                error=error,
+                **fields,
             )
+            if r is not None:
+                r.request_id = fields["request_id"]
+
+    def _send(self, method, url, params, *, assert_200=True, **kwargs):
+        """Make a single attempt at an HTTP request, translating errors into SerpApi exceptions."""
+
+        headers = {"User-Agent": self.USER_AGENT, "Accept-Encoding": self.accept_encoding}
+
+        # Use the default timeout if one was provided to the client.
+        if self.timeout and "timeout" not in kwargs:
+            kwargs["timeout"] = self.timeout
+
+        self._ensure_own_connections()
+
+        # Transports raise HTTPConnectionError and TimeoutError themselves.
+        r = self.transport.request(method, url, params=params, headers=headers, **kwargs)
 
-        except requests.exceptions.ConnectionError as e:
-            raise HTTPConnectionError(e)
-        except requests.exceptions.Timeout as e:
-            raise TimeoutError(e)
+        # A streamed body is counted once it has been read.
+        if not kwargs.get("stream"):
+            self.record_transfer(wire_bytes(r), len(r.content))
 
         # Raise an exception if the status code is not 200.
         if assert_200:
@@ -0,0 +1,273 @@
+import bisect
+import itertools
+import logging
+import threading
+
+from urllib.parse import urlsplit
+
+
+# Request ids are drawn from one counter shared by every client, so that a hook registered on
+# several clients can tell their requests apart.
+_request_ids = itertools.count(1)
+
+
+def next_request_id():
+    """Return a new request id, unique within this process."""
+
+    return next(_request_ids)
+
+
+class Event:
+    """A structured event emitted to the hooks registered on a :class:`Client <serpapi.Client>`.
+
+    Every event has a ``name``; the other attributes are set where they apply, and are ``None`` otherwise.
+    ``request_id`` is unique within the process, across every client:
+
+    - ``request_start``: ``request_id``, ``method``, ``path``, ``engine``, ``attempt``.
+    - ``request_end``: as above, plus ``status_code``, ``elapsed`` (the whole attempt, in seconds),
+      ``server_time`` (from sending the request until the response headers arrived),
+      ``connect_time`` (DNS, TCP and TLS, when a new connection was opened), ``response_bytes``
+      (decompressed), ``wire_bytes`` (as received, possibly compressed) and ``error`` (the exception raised, if the attempt failed).
+    - ``retry``: ``request_id``, ``path``, ``engine``, ``attempt`` (the one that failed), ``delay`` and ``error``.
+    - ``cache_hit`` and ``cache_miss``: ``engine``.
+    - ``decoded``: ``request_id``, ``path``, ``engine``, ``decode_time`` and ``total_time_taken``
+      (SerpApi's own ``search_metadata.total_time_taken``).
+    """
+
+    __slots__ = (
+        "name",
+        "request_id",
+        "method",
+        "path",
+        "engine",
+        "attempt",
+        "status_code",
+        "elapsed",
+        "server_time",
+        "connect_time",
+        "response_bytes",
+        "wire_bytes",
+        "decode_time",
+        "total_time_taken",
+        "delay",
+        "error",
+    )
+
+    def __init__(self, name, **fields):
+        self.name = name
+        for field in self.__slots__[1:]:
+            setattr(self, field, fields.pop(field, None))
+        if fields:
+            raise TypeError(f"Unknown event fields: { ', '.join(fields) }")
+
+    def __repr__(self):
+        fields = " ".join(
+            f"{ field }={ repr(getattr(self, field)) }"
+            for field in self.__slots__[1:]
+            if getattr(self, field) is not None
+        )
+        return f"<Event { self.name } { fields }>"
+
+    def as_dict(self):
+        """Return the event's attributes that are set, as a ``dict``."""
+
+        return {
+            field: getattr(self, field)
+            for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+
+
+def path_of(url):
+    """Return the path of ``url`` (*e.g.* ``/search``), which is free of the query string and API key."""
+
+    return urlsplit(url).path
+
+
+class LoggingHook:
+    """A hook that logs every event, one line each.
+
+    :param logger: the logger to write to. Defaults to ``logging.getLogger("serpapi")``.
+    :param level: the level to log at.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger or logging.getLogger("serpapi")
+        self.level = level
+
+    def __call__(self, event):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                "%s %s",
+                event.name,
+                " ".join(f"{ k }={ v }" for k, v in event.as_dict().items() if k != "name"),
+            )
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, bounds):
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{ k }="{ v }"' for k, v in labels) + "}"
+
+
+class MetricsRegistry:
+    """A hook that aggregates events into Prometheus-style counters and histograms, in process.
+
+    Metrics are labelled by ``engine`` and ``path`` (and ``status`` for request counts), so
+    slow or failing engines stand out. :meth:`render` returns them in the Prometheus text
+    exposition format, ready to be served from a ``/metrics`` endpoint.
+
+    .. code-block:: python
+
+        >>> metrics = serpapi.MetricsRegistry()
+        >>> client = serpapi.Client(api_key="secret_api_key", hooks=[metrics])
+        >>> client.search(q="Coffee")
+        >>> print(metrics.render())
+
+    :param buckets: the upper bounds, in seconds, of the latency histogram buckets.
+    """
+
+    DEFAULT_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 30.0, 60.0)
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        labels = (("engine", event.engine or ""), ("path", event.path or ""))
+
+        if event.name == "request_end":
+            status = str(event.status_code) if event.status_code is not None else type(event.error).__name__
+            self.inc("serpapi_requests_total", labels + (("status", status),))
+            self.observe("serpapi_request_duration_seconds", labels, event.elapsed)
+            if event.server_time is not None:
+                self.observe("serpapi_server_time_seconds", labels, event.server_time)
+            if event.connect_time:
+                self.observe("serpapi_connect_time_seconds", labels, event.connect_time)
+            if event.response_bytes is not None:
+                self.inc("serpapi_response_bytes_total", labels, event.response_bytes)
+            if event.wire_bytes is not None:
+                self.inc("serpapi_wire_bytes_total", labels, event.wire_bytes)
+        elif event.name == "retry":
+            self.inc("serpapi_retries_total", labels)
+        elif event.name == "cache_hit":
+            self.inc("serpapi_cache_hits_total", labels)
+        elif event.name == "cache_miss":
+            self.inc("serpapi_cache_misses_total", labels)
+        elif event.name == "decoded":
+            self.observe("serpapi_decode_seconds", labels, event.decode_time)
+            if event.total_time_taken is not None:
+                self.observe("serpapi_total_time_taken_seconds", labels, event.total_time_taken)
+
+    def inc(self, name, labels=(), value=1):
+        """Add ``value`` to the counter ``name`` with ``labels`` (a tuple of ``(label, value)`` pairs)."""
+
+        with self._lock:
+            key = (name, labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        """Record ``value`` in the histogram ``name`` with ``labels``."""
+
+        with self._lock:
+            histogram = self.histograms.get((name, labels))
+            if histogram is None:
+                histogram = self.histograms[(name, labels)] = _Histogram(self.bounds)
+            histogram.buckets[bisect.bisect_left(self.bounds, value)] += 1
+            histogram.count += 1
+            histogram.sum += value
+
+    def value(self, name, **labels):
+        """Return the sum of the counter ``name`` over every series matching ``labels``."""
+
+        with self._lock:
+            return sum(
+                count
+                for (metric, series), count in self.counters.items()
+                if metric == name and labels.items() <= dict(series).items()
+            )
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format."""
+
+        lines = []
+        with self._lock:
+            for (name, labels), count in sorted(self.counters.items(), key=lambda item: item[0]):
+                lines.append(f"{ name }{ _format_labels(labels) } { count }")
+
+            for (name, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+                cumulative = 0
+                for bound, count in zip(self.bounds + ("+Inf",), histogram.buckets):
+                    cumulative += count
+                    bucket_labels = labels + (("le", bound),)
+                    lines.append(f"{ name }_bucket{ _format_labels(bucket_labels) } { cumulative }")
+                lines.append(f"{ name }_sum{ _format_labels(labels) } { histogram.sum }")
+                lines.append(f"{ name }_count{ _format_labels(labels) } { histogram.count }")
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook:
+    """A hook that records every request attempt as an OpenTelemetry span.
+
+    Requires the ``opentelemetry-api`` package; spans go wherever the configured tracer provider sends them.
+
+    :param tracer: the tracer to use. Defaults to ``opentelemetry.trace.get_tracer("serpapi")``.
+    """
+
+    def __init__(self, tracer=None):
+        # Imported here, so that importing serpapi doesn't import OpenTelemetry.
+        try:
+            from opentelemetry import trace as otel_trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api. Install it with: pip install opentelemetry-api"
+            ) from None
+
+        self._trace = otel_trace
+        self.tracer = tracer or otel_trace.get_tracer("serpapi")
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        if event.name == "request_start":
+            span = self.tracer.start_span(
+                f"serpapi { event.method } { event.path }",
+                kind=self._trace.SpanKind.CLIENT,
+                attributes={
+                    "http.request.method": event.method,
+                    "url.path": event.path,
+                    "serpapi.engine": event.engine or "",
+                    "serpapi.attempt": event.attempt,
+                },
+            )
+            with self._lock:
+                self._spans[(event.request_id, event.attempt)] = span
+
+        elif event.name == "request_end":
+            with self._lock:
+                span = self._spans.pop((event.request_id, event.attempt), None)
+            if span is None:
+                return
+
+            if event.status_code is not None:
+                span.set_attribute("http.response.status_code", event.status_code)
+            for field in ("server_time", "connect_time", "response_bytes", "wire_bytes"):
+                if getattr(event, field) is not None:
+                    span.set_attribute(f"serpapi.{ field }", getattr(event, field))
+            if event.error is not None:
+                span.record_exception(event.error)
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+            span.end()
@@ -0,0 +1,47 @@
+import json
+
+# Faster decoders are used when installed (``pip install serpapi[fast]``).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+if orjson:
+    BACKEND = "orjson"
+elif ujson:
+    BACKEND = "ujson"
+else:
+    BACKEND = "json"
+
+
+def loads(data):
+    """Decode a JSON document from ``str``, ``bytes`` or a ``memoryview`` of UTF-8 bytes."""
+
+    if orjson:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    if ujson:
+        return ujson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Encode ``obj`` as compact JSON, returned as UTF-8 ``bytes``."""
+
+    if orjson:
+        return orjson.dumps(obj)
+
+    if ujson:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,120 @@
+import re
+import threading
+
+from collections.abc import MutableMapping
+
+from . import jsonlib
+
+# SerpApi.com pretty-prints its JSON with two-space indentation, so every top-level key
+# (and only a top-level key) starts a line with exactly two spaces and a quote: JSON
+# strings can't contain a raw newline, and nested keys are indented further.
+_TOP_LEVEL_KEY = re.compile(rb'\n  ("(?:[^"\\\n]|\\.)*"): ')
+
+_PENDING = object()
+
+
+def index_sections(content):
+    """Return a ``{key: (start, end)}`` dict locating each top-level value in a pretty-printed
+    JSON object, or ``None`` if ``content`` isn't laid out the way SerpApi.com lays it out.
+    """
+
+    if not content.startswith(b'{\n  "'):
+        return None
+
+    end_of_object = content.rstrip().rfind(b"\n}")
+    if end_of_object == -1 or content.rstrip()[end_of_object:] != b"\n}":
+        return None
+
+    matches = list(_TOP_LEVEL_KEY.finditer(content, 0, end_of_object))
+    if not matches or matches[0].start() != 1:
+        return None
+
+    spans = {}
+    for m, following in zip(matches, matches[1:] + [None]):
+        if following is None:
+            end = end_of_object
+        else:
+            end = following.start()
+            if content[end - 1:end] != b",":
+                return None
+            end -= 1
+
+        spans[jsonlib.loads(m.group(1))] = (m.end(), end)
+
+    return spans
+
+
+class LazySections(MutableMapping):
+    """The top-level members of a JSON object, each decoded from the raw response bytes
+    the first time it is accessed.
+    """
+
+    __slots__ = ("_content", "_spans", "_values", "_modified", "_lock")
+
+    def __init__(self, content, spans):
+        self._content = memoryview(content)
+        self._spans = spans
+        self._values = dict.fromkeys(spans, _PENDING)
+        self._modified = False
+        # Results may be shared between threads (e.g. by coalesced searches): each section is decoded once, under the lock.
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Ship the raw bytes, rather than the decoded tree, unless it has been changed.
+        if self._modified:
+            return (dict, (self.copy(),))
+        return (decode_lazily, (self._content.tobytes(),))
+
+    def __getitem__(self, key):
+        value = self._values[key]
+        if value is _PENDING:
+            with self._lock:
+                value = self._values[key]
+                if value is _PENDING:
+                    start, end = self._spans.pop(key)
+                    value = self._values[key] = jsonlib.loads(self._content[start:end])
+        return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._spans.pop(key, None)
+            self._values[key] = value
+            self._modified = True
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._spans.pop(key, None)
+            del self._values[key]
+            self._modified = True
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    @property
+    def decoded(self):
+        """The keys that have been decoded so far."""
+
+        return [key for key, value in self._values.items() if value is not _PENDING]
+
+    def copy(self):
+        """Decode every section, and return them as a plain ``dict``."""
+
+        return {key: self[key] for key in self}
+
+
+def decode_lazily(content):
+    """Return a :class:`LazySections` for ``content`` where possible, or a fully decoded ``dict``."""
+
+    spans = index_sections(content)
+    if spans is None:
+        return jsonlib.loads(content)
+    return LazySections(content, spans)
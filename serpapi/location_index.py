@@ -0,0 +1,254 @@
+import bisect
+import gzip
+import heapq
+import os
+import re
+import time
+import unicodedata
+
+from collections import Counter
+
+from . import jsonlib
+from .exceptions import InvalidLocation
+
+# The fields of each location kept in the index (and on disk), in this order.
+FIELDS = (
+    "id",
+    "google_id",
+    "google_parent_id",
+    "name",
+    "canonical_name",
+    "country_code",
+    "target_type",
+    "reach",
+    "gps",
+)
+
+_SEPARATORS = re.compile(r"\s*,\s*")
+_SPACES = re.compile(r"\s+")
+# str.isascii() needs Python 3.7.
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def normalize_name(text):
+    """Fold ``text`` for comparison: case, accents, and spacing around commas and words are ignored."""
+
+    if _NON_ASCII.search(text):
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    text = _SPACES.sub(" ", _SEPARATORS.sub(",", text.casefold())).strip()
+    return text
+
+
+def _trigrams(text):
+    padded = f"  { text } "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class LocationIndex:
+    """An in-memory index of the Locations API dataset, for resolving free-text place names to
+    canonical ``location`` strings without a round trip to SerpApi.com.
+
+    .. code-block:: python
+
+        >>> index = serpapi.LocationIndex.open(client, "locations.json.gz", max_age=7 * 86400)
+        >>> index.prefix("austin", target_type="City")[0]["canonical_name"]
+        'Austin,Texas,United States'
+        >>> index.normalize("austin, texas, united states")
+        'Austin,Texas,United States'
+
+    Lookups compare names case- and accent-insensitively; results are ranked by ``reach``.
+
+    :param locations: the location dictionaries, as returned by :meth:`Client.locations <serpapi.Client.locations>`.
+    :param fetched_at: when the locations were downloaded, as a Unix timestamp.
+    """
+
+    def __init__(self, locations, *, fetched_at=None):
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.locations = [{field: location.get(field) for field in FIELDS} for location in locations]
+
+        self._by_canonical = {}
+        self._by_name = {}
+        self._trigram_postings = {}
+        self._trigram_counts = [0] * len(self.locations)
+        keys = []
+
+        # Index the most popular locations first, so that they win exact-name lookups.
+        order = sorted(range(len(self.locations)), key=lambda i: -(self.locations[i]["reach"] or 0))
+        for i in order:
+            location = self.locations[i]
+            canonical = normalize_name(location["canonical_name"] or "")
+            name = normalize_name(location["name"] or "")
+
+            self._by_canonical.setdefault(canonical, i)
+            self._by_name.setdefault(name, []).append(i)
+            keys.append((canonical, i))
+            if name != canonical:
+                keys.append((name, i))
+            trigrams = _trigrams(name)
+            self._trigram_counts[i] = len(trigrams)
+            for trigram in trigrams:
+                self._trigram_postings.setdefault(trigram, []).append(i)
+
+        keys.sort()
+        self._keys = [key for key, _ in keys]
+        self._key_ids = [i for _, i in keys]
+
+    def __repr__(self):
+        return f"<LocationIndex locations={ len(self) }>"
+
+    def __len__(self):
+        return len(self.locations)
+
+    @classmethod
+    def download(cls, client, **params):
+        """Download the full locations dataset with ``client``, and index it.
+
+        :param **: any additional parameters to pass to :meth:`Client.locations <serpapi.Client.locations>`.
+        """
+
+        return cls(client.locations(params), fetched_at=time.time())
+
+    @classmethod
+    def load(cls, path):
+        """Load an index saved with :meth:`save`."""
+
+        with gzip.open(path, "rb") as f:
+            data = jsonlib.loads(f.read())
+
+        fields = data["fields"]
+        return cls(
+            [dict(zip(fields, row)) for row in data["rows"]],
+            fetched_at=data["fetched_at"],
+        )
+
+    def save(self, path):
+        """Save the index to ``path`` as gzipped JSON rows, atomically."""
+
+        data = {
+            "fetched_at": self.fetched_at,
+            "fields": FIELDS,
+            "rows": [[location[field] for field in FIELDS] for location in self.locations],
+        }
+
+        tmp_path = f"{ path }.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(jsonlib.dumps(data))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, client, path, *, max_age=7 * 86400):
+        """Load the index saved at ``path``, downloading (and saving) a fresh one first if it is
+        missing or older than ``max_age`` seconds.
+
+        If the download fails, a stale index on disk is used rather than raising.
+        """
+
+        index = cls.load(path) if os.path.exists(path) else None
+        if index is not None and not index.is_stale(max_age):
+            return index
+
+        try:
+            fresh = cls.download(client)
+        except Exception:
+            if index is None:
+                raise
+            return index
+
+        fresh.save(path)
+        return fresh
+
+    def is_stale(self, max_age):
+        """Return ``True`` if the locations were downloaded more than ``max_age`` seconds ago."""
+
+        return time.time() - self.fetched_at > max_age
+
+    def _filtered(self, ids, country_code, target_type):
+        for i in ids:
+            location = self.locations[i]
+            if country_code is not None and (location["country_code"] or "").upper() != country_code.upper():
+                continue
+            if target_type is not None and location["target_type"] != target_type:
+                continue
+            yield i
+
+    def get(self, canonical_name):
+        """Return the location whose ``canonical_name`` matches, or ``None``."""
+
+        i = self._by_canonical.get(normalize_name(canonical_name))
+        return None if i is None else self.locations[i]
+
+    def exact(self, name, *, country_code=None, target_type=None):
+        """Return the locations whose ``canonical_name`` or ``name`` matches ``name``, most popular first."""
+
+        key = normalize_name(name)
+        ids = []
+        if key in self._by_canonical:
+            ids.append(self._by_canonical[key])
+        ids.extend(i for i in self._by_name.get(key, ()) if i not in ids)
+
+        return [self.locations[i] for i in self._filtered(ids, country_code, target_type)]
+
+    def prefix(self, text, *, limit=10, country_code=None, target_type=None):
+        """Return up to ``limit`` locations whose ``canonical_name`` or ``name`` starts with ``text``, most popular first."""
+
+        key = normalize_name(text)
+        start = bisect.bisect_left(self._keys, key)
+        end = bisect.bisect_left(self._keys, key + "\uffff", start)
+
+        ids = dict.fromkeys(self._key_ids[start:end])
+        return self._top(self._filtered(ids, country_code, target_type), limit)
+
+    def fuzzy(self, text, *, limit=10, cutoff=0.4, country_code=None, target_type=None):
+        """Return up to ``limit`` locations whose ``name`` is most similar to ``text``, tolerating typos.
+
+        Similarity is the Dice coefficient of the names' character trigrams; matches scoring below ``cutoff`` are dropped.
+        """
+
+        trigrams = _trigrams(normalize_name(text))
+        overlaps = Counter()
+        for trigram in trigrams:
+            overlaps.update(self._trigram_postings.get(trigram, ()))
+
+        # A name sharing fewer trigrams than this can't reach the cutoff, whatever its length.
+        minimum = cutoff * len(trigrams) / 2
+        candidates = (i for i, overlap in overlaps.items() if overlap >= minimum)
+
+        scores = {}
+        for i in self._filtered(candidates, country_code, target_type):
+            score = 2 * overlaps[i] / (len(trigrams) + self._trigram_counts[i])
+            if score >= cutoff:
+                scores[i] = score
+
+        best = heapq.nlargest(limit, scores, key=lambda i: (scores[i], self.locations[i]["reach"] or 0))
+        return [self.locations[i] for i in best]
+
+    def search(self, text, *, limit=10, country_code=None, target_type=None):
+        """Return the best matches for ``text``: exact matches, else prefix matches, else fuzzy matches."""
+
+        filters = dict(country_code=country_code, target_type=target_type)
+        return (
+            self.exact(text, **filters)[:limit]
+            or self.prefix(text, limit=limit, **filters)
+            or self.fuzzy(text, limit=limit, **filters)
+        )
+
+    def normalize(self, location):
+        """Return the canonical ``location`` string for ``location`` (a ``canonical_name`` or an exact ``name``).
+
+        Raises :class:`InvalidLocation <serpapi.InvalidLocation>`, with suggestions, if it doesn't match a known location.
+        """
+
+        matches = self.exact(location)
+        if matches:
+            return matches[0]["canonical_name"]
+
+        suggestions = [match["canonical_name"] for match in self.search(location, limit=3)]
+        message = f"Unknown location: { repr(location) }."
+        if suggestions:
+            message += f" Did you mean: { '; '.join(suggestions) }?"
+        raise InvalidLocation(message, suggestions=suggestions)
+
+    def _top(self, ids, limit):
+        best = heapq.nlargest(limit, ids, key=lambda i: self.locations[i]["reach"] or 0)
+        return [self.locations[i] for i in best]
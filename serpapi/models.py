@@ -2,7 +2,12 @@ import json
 
 from pprint import pformat
 from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
 
+from . import jsonlib
+from .lazy import LazySections, decode_lazily
+from .projection import Projection
+from .records import RECORD_TYPES, RecordList
 from .textui import prettify_json
 from .exceptions import HTTPError
 
@@ -21,8 +26,25 @@ class SerpResults(UserDict):
     It can be used like a dictionary, but also has some additional methods.
     """
 
+    #: ``True`` if these results were served from the client's response cache.
+    cached = False
+
+    #: The number of attempts it took to fetch these results.
+    attempts = 1
+
+    #: The :class:`Projection <serpapi.Projection>` these results (and their next pages) were reduced to, if any.
+    projection = None
+
+    #: The client further pages are fetched with. Pickling drops it: unpickled results have none, until one is set.
+    client = None
+
     def __init__(self, data, *, client):
-        super().__init__(data)
+        if isinstance(data, LazySections):
+            # Adopt the sections as they are; copying them would decode them all.
+            super().__init__()
+            self.data = data
+        else:
+            super().__init__(data)
         self.client = client
 
     def __getstate__(self):
@@ -36,7 +58,7 @@ class SerpResults(UserDict):
         ease of use.
         """
 
-        return prettify_json(json.dumps(self.data, indent=4))
+        return prettify_json(json.dumps(self.as_dict(), indent=4))
 
     def as_dict(self):
         """Returns the data as a standard Python dictionary.
@@ -44,6 +66,26 @@ class SerpResults(UserDict):
 
         return self.data.copy()
 
+    def records(self, key, record_type=None):
+        """Return the items of the result array ``key`` as compact :class:`Record <serpapi.records.Record>` objects,
+        built as they are accessed (see :class:`RecordList <serpapi.records.RecordList>`).
+
+        .. code-block:: python
+
+            >>> ranks = [(r.position, r.link) for r in results.records("organic_results")]
+
+        :param key: the result array, *e.g.* ``organic_results``, ``local_results``, ``shopping_results``, ``news_results`` or ``jobs_results``.
+        :param record_type: the :class:`Record <serpapi.records.Record>` subclass to use; required for other arrays.
+        """
+
+        if record_type is None:
+            try:
+                record_type = RECORD_TYPES[key]
+            except KeyError:
+                raise ValueError(f"No record type for { repr(key) }; pass record_type.")
+
+        return RecordList(self.data.get(key) or [], record_type)
+
     @property
     def next_page_url(self):
         """The URL of the next page of results, if any."""
@@ -57,18 +99,55 @@ class SerpResults(UserDict):
         """Return the next page of results, if any."""
 
         if self.next_page_url:
-            # Include support for the API key, as it is not included in the next page URL.
-            params = {"api_key": self.client.api_key}
+            return self._fetch_page(self.next_page_url)
+
+    def _page_params(self, url):
+        if self.client is None:
+            raise ValueError("These results have no client to fetch pages with (they were unpickled); set their client first.")
+
+        # Include support for the API key, as it is not included in the next page URL.
+        params = {"api_key": self.client.api_key}
+
+        # Next page URLs may or may not carry the json_restrictor a projection added.
+        if self.projection is not None and "json_restrictor=" not in url:
+            params = self.projection.restrict(params)
+
+        return params
+
+    def _fetch_page(self, url):
+        r = self.client.request("GET", path=url, params=self._page_params(url))
+        return SerpResults.from_http_response(r, client=self.client, projection=self.projection)
+
+    def project(self, projection):
+        """Return a new results object holding only the fields selected by ``projection``
+        (a :class:`Projection <serpapi.Projection>`, or selectors), whose next pages are projected too.
+        """
 
-            r = self.client.request("GET", path=self.next_page_url, params=params)
-            return SerpResults.from_http_response(r, client=self.client)
+        projection = Projection.coerce(projection)
+        projected = type(self)(projection.apply(self.data), client=self.client)
+        projected.projection = projection
+        projected.attempts = self.attempts
+        projected.cached = self.cached
+        return projected
 
-    def yield_pages(self, max_pages=1_000):
+    def yield_pages(self, max_pages=1_000, prefetch=0, projection=None):
         """A generator that ``yield`` s the next ``n`` pages of search results, if any.
 
         :param max_pages: limit the number of pages yielded to ``n``.
+        :param prefetch: fetch up to this many upcoming pages in background threads while
+            the current page is being processed. Where the pagination block lists
+            ``other_pages``, those are fetched concurrently; pages are still yielded in order.
+        :param projection: a :class:`Projection <serpapi.Projection>` (or selectors) to apply to every page; see :meth:`project`.
         """
 
+        if projection is not None:
+            yield from self.project(projection).yield_pages(max_pages, prefetch)
+            return
+
+        if prefetch:
+            yield from self._yield_pages_prefetched(max_pages, prefetch)
+            return
+
         current_page_count = 0
               
         current_page = self
@@ -79,23 +158,154 @@ class SerpResults(UserDict):
                 current_page = current_page.next_page()
             else:
                 break
-            
+
+    def _upcoming_pages(self, number):
+        """Return this page's number, and a ``{page number: URL}`` dict of the pages after it."""
+
+        serpapi_pagination = self.data.get("serpapi_pagination") or {}
+
+        try:
+            number = int(serpapi_pagination.get("current", number))
+        except (TypeError, ValueError):
+            pass
+
+        upcoming = {}
+        for key, url in (serpapi_pagination.get("other_pages") or {}).items():
+            try:
+                page_number = int(key)
+            except (TypeError, ValueError):
+                continue
+            if page_number > number:
+                upcoming[page_number] = url
+
+        if self.next_page_url:
+            upcoming[number + 1] = self.next_page_url
+
+        return number, upcoming
+
+    def _yield_pages_prefetched(self, max_pages, prefetch):
+        known = {}
+        pending = {}
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            try:
+                number = 1
+                current_page = self
+                current_page_count = 0
+
+                while current_page and current_page_count < max_pages:
+                    yield current_page
+                    current_page_count += 1
+
+                    if not current_page.next_page_url or current_page_count >= max_pages:
+                        break
+
+                    number, upcoming = current_page._upcoming_pages(number)
+                    for page_number in [n for n in pending if n <= number]:
+                        pending.pop(page_number).cancel()
+
+                    for page_number, url in upcoming.items():
+                        if page_number not in pending:
+                            known.setdefault(page_number, url)
+
+                    # Fetch ahead, in page order, without going past max_pages.
+                    last_wanted = number + max_pages - current_page_count
+                    for page_number in sorted(known):
+                        if page_number <= number:
+                            del known[page_number]
+                        elif len(pending) < prefetch and page_number <= last_wanted:
+                            url = known.pop(page_number)
+                            pending[page_number] = executor.submit(self._fetch_page, url)
+
+                    if number + 1 in pending:
+                        current_page = pending.pop(number + 1).result()
+                    else:
+                        current_page = current_page.next_page()
+                    number += 1
+            finally:
+                # If the caller stops iterating early, don't fetch pages nobody will read.
+                for future in pending.values():
+                    future.cancel()
 
     @classmethod
-    def from_http_response(cls, r, *, client=None):
+    def from_http_response(cls, r, *, client=None, projection=None):
         """Construct a SerpResults object from an HTTP response.
 
         :param assert_200: if ``True`` (default), raise an exception if the status code is not 200.
         :param client: the Client instance which was used to send this request.
+        :param projection: if given, a :class:`Projection <serpapi.Projection>` selecting the fields to keep.
 
         An instance of this class is returned if the response is a valid JSON object.
         Otherwise, the raw text (as a properly decoded unicode string) is returned.
         """
 
         try:
-            cls = cls(r.json(), client=client)
+            cls = cls(cls._decode(r.content, client, projection), client=client)
+            cls.attempts = getattr(r, "attempts", 1)
+            cls.projection = projection
 
             return cls
         except ValueError:
             # If the response is not JSON, return the raw text.
             return r.text
+
+    @classmethod
+    def from_cache(cls, content, *, client=None, projection=None):
+        """Construct a SerpResults object from a response body stored in a :class:`ResponseCache <serpapi.ResponseCache>`.
+
+        :param content: the raw JSON body, as ``bytes``.
+        :param client: the Client instance which owns the cache.
+        :param projection: if given, a :class:`Projection <serpapi.Projection>` selecting the fields to keep.
+        """
+
+        results = cls(cls._decode(content, client, projection), client=client)
+        results.cached = True
+        results.projection = projection
+        return results
+
+    @staticmethod
+    def _decode(content, client, projection=None):
+        """Decode a response body: projected, if a projection is given, or lazily if the client asked for ``lazy_results``."""
+
+        if projection is not None:
+            return projection.decode(content)
+        if getattr(client, "lazy_results", False):
+            return decode_lazily(content)
+        return jsonlib.loads(content)
+
+
+class AsyncSerpResults(SerpResults):
+    """The :class:`SerpResults` counterpart returned by :class:`AsyncClient <serpapi.AsyncClient>`.
+
+    Pagination methods are coroutines, and ``yield_pages`` is an asynchronous generator:
+
+    .. code-block:: python
+
+        >>> async for page in results.yield_pages(max_pages=5):
+        ...     print(page["search_metadata"]["id"])
+    """
+
+    async def next_page(self):
+        """Return the next page of results, if any."""
+
+        if self.next_page_url:
+            r = await self.client.request("GET", path=self.next_page_url, params=self._page_params(self.next_page_url))
+            return AsyncSerpResults.from_http_response(r, client=self.client, projection=self.projection)
+
+    async def yield_pages(self, max_pages=1_000, projection=None):
+        """An asynchronous generator that ``yield`` s the next ``n`` pages of search results, if any.
+
+        :param max_pages: limit the number of pages yielded to ``n``.
+        :param projection: a :class:`Projection <serpapi.Projection>` (or selectors) to apply to every page.
+        """
+
+        current_page_count = 0
+
+        current_page = self if projection is None else self.project(projection)
+        while current_page and current_page_count < max_pages:
+            yield current_page
+            current_page_count += 1
+            if current_page.next_page_url:
+                current_page = await current_page.next_page()
+            else:
+                break
@@ -0,0 +1,228 @@
+import json
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .models import SerpResults
+from .exceptions import TimeoutError
+from .utils import REQUEST_OPTIONS
+
+
+class _PendingSearch:
+    __slots__ = ("params", "interval", "next_poll", "submitted_at")
+
+    def __init__(self, params, interval):
+        self.params = params
+        self.interval = interval
+        self.next_poll = time.monotonic() + interval
+        self.submitted_at = time.monotonic()
+
+
+class SearchPipeline:
+    """Submits searches with ``async=true``, then polls the Search Archive API until they are done.
+
+    Submitting returns as soon as SerpApi.com has queued a search, so searches can be
+    submitted much faster than blocking :meth:`Client.search <serpapi.Client.search>`
+    calls complete; :meth:`results` then collects them as they finish.
+
+    .. code-block:: python
+
+        >>> pipeline = serpapi.SearchPipeline(client, state_path="pending.json")
+        >>> pipeline.submit_many({"q": q} for q in keywords)
+        >>> for results in pipeline.results():
+        ...     store(results)
+
+    :param client: the :class:`Client <serpapi.Client>` to submit and poll with.
+    :param state_path: if given, the ids of pending searches are persisted to this JSON file,
+        and a pipeline created with the same path after a crash resumes polling them.
+    :param max_workers: the number of concurrent submissions and polls.
+    :param poll_interval: the delay, in seconds, before a search is first polled.
+    :param max_poll_interval: the maximum delay, in seconds, between polls of the same search.
+    :param backoff: the factor by which a search's polling interval grows while it is still processing.
+    :param max_wait: give up on a search that hasn't finished after this many seconds.
+    """
+
+    #: The ``search_metadata.status`` values of a search that is finished.
+    FINISHED_STATUSES = ("Success", "Error")
+
+    def __init__(
+        self,
+        client,
+        *,
+        state_path=None,
+        max_workers=8,
+        poll_interval=1.0,
+        max_poll_interval=30.0,
+        backoff=1.5,
+        max_wait=None,
+    ):
+        self.client = client
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.max_wait = max_wait
+
+        #: Searches that could not be retrieved, as a ``{search_id: exception}`` dict.
+        self.failed = {}
+
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        if state_path and os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+
+            # Resume polling right away: these searches may well have finished meanwhile.
+            for search_id, params in state["pending"].items():
+                self._pending[search_id] = _PendingSearch(params, 0)
+
+    def __repr__(self):
+        return f"<SearchPipeline pending={ len(self._pending) }>"
+
+    @property
+    def pending(self):
+        """The ids of the searches submitted but not yet retrieved."""
+
+        with self._lock:
+            return list(self._pending)
+
+    def submit(self, params: dict = None, **kwargs):
+        """Submit a search with ``async=true``, and return its search id.
+
+        Accepts the same arguments as :meth:`Client.search <serpapi.Client.search>`.
+        """
+
+        # Request options (e.g. ``timeout``) are passed on to the request, not sent to SerpApi, nor saved.
+        request_kwargs = {key: kwargs.pop(key) for key in REQUEST_OPTIONS if key in kwargs}
+
+        search_id = self._submit(dict(params or {}, **kwargs), request_kwargs)
+        self.save()
+        return search_id
+
+    def submit_many(self, params_iterable, **kwargs):
+        """Submit many searches concurrently. Returns a list of :class:`BatchResult <serpapi.BatchResult>`
+        records whose ``result`` is the search id, or whose ``exception`` is the reason it wasn't submitted.
+
+        Accepts the same arguments as :meth:`Client.search_many <serpapi.Client.search_many>`.
+        """
+
+        kwargs.setdefault("max_workers", self.max_workers)
+        records = []
+
+        for record in self.client.search_many(
+            (dict(params, **{"async": "true"}) for params in params_iterable), **kwargs
+        ):
+            if record.ok:
+                try:
+                    record.result = self._track(record.result, record.params)
+                except (KeyError, TypeError) as e:
+                    record.result, record.exception = None, e
+            records.append(record)
+
+        self.save()
+        return records
+
+    def _submit(self, params, request_kwargs=None):
+        params["async"] = "true"
+        return self._track(self.client.search(dict(params), **(request_kwargs or {})), params)
+
+    def _track(self, submission, params):
+        search_id = submission["search_metadata"]["id"]
+        params = {k: v for k, v in params.items() if k not in ("api_key", "async")}
+
+        with self._lock:
+            self._pending[search_id] = _PendingSearch(params, self.poll_interval)
+        return search_id
+
+    def save(self):
+        """Persist the pending search ids to ``state_path``, if one was given."""
+
+        if not self.state_path:
+            return
+
+        with self._lock:
+            state = {
+                "pending": {search_id: entry.params for search_id, entry in self._pending.items()}
+            }
+
+        # Write atomically, so a crash mid-write can't lose the pending ids.
+        tmp_path = f"{ self.state_path }.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _poll(self, search_id):
+        try:
+            return self.client.search_archive(search_id=search_id)
+        except Exception as e:
+            return e
+
+    def results(self):
+        """A generator that ``yield`` s :class:`SerpResults <serpapi.SerpResults>` for each pending search
+        as it finishes, until none are left.
+
+        Searches whose ``search_metadata.status`` is ``Error`` are yielded too; check them for an ``error`` key.
+        Searches that can't be retrieved are recorded in :attr:`failed` instead.
+        """
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        return
+
+                    now = time.monotonic()
+                    due = [
+                        search_id
+                        for search_id, entry in self._pending.items()
+                        if entry.next_poll <= now
+                    ]
+                    next_poll = min(entry.next_poll for entry in self._pending.values())
+
+                if not due:
+                    time.sleep(max(next_poll - time.monotonic(), 0))
+                    continue
+
+                finished = []
+                for search_id, outcome in zip(due, executor.map(self._poll, due)):
+                    if self._update(search_id, outcome):
+                        finished.append(outcome)
+
+                # Save only once the finished results have been handed over, so that a
+                # crash in between re-delivers them rather than losing them.
+                yield from finished
+                self.save()
+
+    def _update(self, search_id, outcome):
+        """Record the outcome of polling ``search_id``. Returns ``True`` if it's a finished search."""
+
+        with self._lock:
+            entry = self._pending[search_id]
+
+            if isinstance(outcome, SerpResults):
+                status = (outcome.get("search_metadata") or {}).get("status")
+                if status in self.FINISHED_STATUSES:
+                    del self._pending[search_id]
+                    return True
+            elif isinstance(outcome, Exception) and getattr(outcome, "status_code", None) in (400, 401, 404):
+                # The search id is unknown, or we aren't allowed to see it: polling again won't help.
+                del self._pending[search_id]
+                self.failed[search_id] = outcome
+                return False
+
+            if self.max_wait is not None and time.monotonic() - entry.submitted_at > self.max_wait:
+                del self._pending[search_id]
+                self.failed[search_id] = (
+                    outcome
+                    if isinstance(outcome, Exception)
+                    else TimeoutError(f"Search { search_id } did not finish within { self.max_wait } seconds")
+                )
+                return False
+
+            entry.interval = min(max(entry.interval, self.poll_interval) * self.backoff, self.max_poll_interval)
+            entry.next_poll = time.monotonic() + entry.interval
+            return False
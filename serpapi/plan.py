@@ -0,0 +1,127 @@
+import itertools
+
+from .batch import BatchResult, search_many as _search_many
+from .exceptions import InvalidLocation
+from .utils import canonical_params, normalize_params
+
+
+class QueryPlan:
+    """Deduplicates a batch of searches before any is sent, so that equivalent searches are paid for once.
+
+    Searches are equivalent when their :func:`canonical_params <serpapi.canonical_params>` match: parameter
+    order, ``None`` values, the ``api_key``, an explicit default ``engine=google``, boolean spelling and the
+    spacing in ``location`` don't matter (and, with a :class:`LocationIndex <serpapi.LocationIndex>`,
+    neither does how the location is spelled). Each distinct search is run once, and its result (or
+    exception) is fanned back out to every request that asked for it.
+
+    .. code-block:: python
+
+        >>> plan = serpapi.QueryPlan(({"q": q, "location": city} for q, city in keywords), location_index=index)
+        >>> plan
+        <QueryPlan requests=10000 unique=8312 saved=1688>
+        >>> for item in plan.run(client, max_workers=16):
+        ...     print(item.index, item.params, item.ok)
+
+    The input dictionaries are never modified.
+
+    :param params_iterable: the searches' parameter dictionaries. It is read in full.
+    :param location_index: an optional :class:`LocationIndex <serpapi.LocationIndex>` used to normalise ``location``.
+    """
+
+    def __init__(self, params_iterable=(), *, location_index=None):
+        self.location_index = location_index
+
+        #: Every search added, as given.
+        self.requests = []
+        #: The distinct searches, normalised, in order of first appearance.
+        self.unique = []
+        #: A failed :class:`BatchResult <serpapi.BatchResult>` for each search that can't be sent (*e.g.* for an unknown ``location``).
+        self.failed = []
+
+        self._positions = {}
+        self._groups = []
+
+        for params in params_iterable:
+            self.add(params)
+
+    def __repr__(self):
+        return f"<QueryPlan requests={ self.total } unique={ len(self.unique) } saved={ self.saved }>"
+
+    def __len__(self):
+        return len(self.unique)
+
+    @property
+    def total(self):
+        """The number of searches added."""
+
+        return len(self.requests)
+
+    @property
+    def saved(self):
+        """The number of searches that duplicate an earlier one, and so won't be sent."""
+
+        return len(self.requests) - len(self.unique) - len(self.failed)
+
+    def add(self, params):
+        """Add a search, and return the position of the distinct search that will answer it in :attr:`unique`.
+
+        A search that can't be sent (with a ``location_index``, one for an unknown ``location``) is added to
+        :attr:`failed` instead, with its :class:`InvalidLocation <serpapi.InvalidLocation>`, and ``None`` is returned.
+        """
+
+        index = len(self.requests)
+        self.requests.append(params)
+
+        try:
+            normalized = normalize_params(params, location_index=self.location_index)
+        except InvalidLocation as e:
+            self.failed.append(BatchResult(index, params, exception=e))
+            return None
+
+        key = canonical_params(normalized)
+
+        position = self._positions.get(key)
+        if position is None:
+            position = self._positions[key] = len(self.unique)
+            self.unique.append(normalized)
+            self._groups.append([])
+
+        self._groups[position].append(index)
+        return position
+
+    def fan_out(self, outcomes, *, ordered=False):
+        """Turn the :class:`BatchResult <serpapi.BatchResult>` of each distinct search (indexed by its position
+        in :attr:`unique`) into one for each search added, with its original index and parameters, along with
+        those in :attr:`failed`.
+
+        Duplicates share the same result object.
+        """
+
+        items = itertools.chain(self.failed, self._fanned(outcomes))
+        if not ordered:
+            yield from items
+            return
+
+        completed = {}
+        next_index = 0
+
+        for item in items:
+            completed[item.index] = item
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+
+    def _fanned(self, outcomes):
+        for outcome in outcomes:
+            for index in self._groups[outcome.index]:
+                yield BatchResult(index, self.requests[index], result=outcome.result, exception=outcome.exception)
+
+    def run(self, client, *, max_workers=8, ordered=False, **kwargs):
+        """Run the distinct searches with :meth:`client.search_many <serpapi.Client.search_many>`, and yield a
+        :class:`BatchResult <serpapi.BatchResult>` for every search added.
+
+        :param **: any additional arguments to pass to every search, *e.g.* ``timeout``.
+        """
+
+        outcomes = _search_many(client, self.unique, max_workers=max_workers, ordered=ordered, **kwargs)
+        return self.fan_out(outcomes, ordered=ordered)
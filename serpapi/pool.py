@@ -0,0 +1,191 @@
+import itertools
+import threading
+import time
+
+from .core import Client
+from .batch import search_many as _search_many
+from .exceptions import HTTPError, QuotaExceeded
+from .models import SerpResults
+from .quota import QuotaTracker
+from .retry import retry_after_seconds
+
+
+class _Key:
+    __slots__ = ("api_key", "quota", "disabled", "cool_until")
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.quota = None
+        self.disabled = None
+        self.cool_until = 0.0
+
+    @property
+    def masked(self):
+        return f"…{ self.api_key[-4:] }"
+
+
+class ClientPool:
+    """Spreads searches across several SerpApi accounts' API keys, through one shared :class:`Client <serpapi.Client>`
+    (and so one connection pool).
+
+    Each search goes to the key with the most searches available (on its plan, and for this hour),
+    as seeded from the Account API and counted locally by a :class:`QuotaTracker <serpapi.QuotaTracker>`
+    per key. A key is taken out of rotation when SerpApi.com rejects it (``401``), and rested for a
+    while when it is throttled (``429``); the search is then retried with another key.
+
+    .. code-block:: python
+
+        >>> pool = serpapi.ClientPool(["key_a", "key_b", "key_c"], timeout=10)
+        >>> results = pool.search(q="Coffee")
+        >>> for item in pool.search_many({"q": q} for q in keywords):
+        ...     print(item.ok)
+
+    :param api_keys: the API keys to use.
+    :param track_quota: if ``True`` (default), seed each key's quota from the Account API, and
+        balance by it; if ``False``, rotate between keys in turn.
+    :param resync_interval: if given, re-sync each key's quota every this many seconds, on background threads.
+    :param cooldown: how long, in seconds, to rest a throttled key when the response has no ``Retry-After`` header.
+    :param **: any additional arguments to pass to the shared :class:`Client <serpapi.Client>`, *e.g.* ``timeout`` or ``cache``.
+    """
+
+    def __init__(self, api_keys, *, track_quota=True, resync_interval=None, cooldown=60.0, **kwargs):
+        self.keys = [_Key(api_key) for api_key in dict.fromkeys(api_keys)]
+        if not self.keys:
+            raise ValueError("ClientPool requires at least one API key")
+
+        self.client = Client(**kwargs)
+        self.cooldown = cooldown
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+        if track_quota:
+            for key in self.keys:
+                try:
+                    key.quota = QuotaTracker(self.client, api_key=key.api_key, resync_interval=resync_interval)
+                except HTTPError as e:
+                    if e.status_code not in (401, 403):
+                        raise
+                    key.disabled = e
+
+    def __repr__(self):
+        return f"<ClientPool keys={ len(self.keys) } active={ len(self.active_keys()) }>"
+
+    def active_keys(self):
+        """The (masked) API keys currently in rotation."""
+
+        now = time.monotonic()
+        return [key.masked for key in self.keys if key.disabled is None and key.cool_until <= now]
+
+    def available(self):
+        """The number of searches available across every key in rotation, or ``None`` if quotas aren't tracked."""
+
+        now = time.monotonic()
+        total = 0
+        for key in self.keys:
+            if key.disabled is not None or key.cool_until > now:
+                continue
+            if key.quota is None:
+                return None
+            total += key.quota.available()
+        return total
+
+    def status(self):
+        """Return a list with the state of each key: its masked value, searches available, and whether it is disabled or resting."""
+
+        now = time.monotonic()
+        return [
+            {
+                "api_key": key.masked,
+                "available": key.quota.available() if key.quota is not None else None,
+                "disabled": key.disabled is not None,
+                "resting_for": max(key.cool_until - now, 0.0),
+            }
+            for key in self.keys
+        ]
+
+    def _acquire(self, exclude):
+        """Pick the key with the most searches available, and reserve one search on it."""
+
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                key
+                for key in self.keys
+                if key.disabled is None and key.cool_until <= now and key.api_key not in exclude
+            ]
+            # Rotate the starting point, so that keys with equal quotas take turns.
+            if candidates:
+                start = next(self._turn) % len(candidates)
+                candidates = candidates[start:] + candidates[:start]
+
+        candidates.sort(
+            key=lambda key: key.quota.available() if key.quota is not None else 0,
+            reverse=True,
+        )
+        for key in candidates:
+            if key.quota is None or key.quota.try_reserve():
+                return key
+
+        raise QuotaExceeded("No API key in the pool has searches left (on its plan, or for this hour).")
+
+    def search(self, params: dict = None, **kwargs):
+        """Fetch a page of results with one of the pool's keys. Accepts the same arguments as
+        :meth:`Client.search <serpapi.Client.search>`.
+
+        Raises :class:`QuotaExceeded <serpapi.QuotaExceeded>` when no key has searches left, or
+        the last key's :class:`HTTPError <serpapi.HTTPError>` when every key was rejected or throttled.
+        """
+
+        params = dict(params or {})
+        tried = set()
+        last_error = None
+
+        while True:
+            try:
+                key = self._acquire(tried)
+            except QuotaExceeded:
+                if last_error is not None:
+                    raise last_error
+                raise
+            tried.add(key.api_key)
+
+            try:
+                results = self.client.search(dict(params, api_key=key.api_key), **kwargs)
+            except HTTPError as e:
+                if e.status_code in (401, 403):
+                    # The key is invalid, or its account is disabled: stop using it.
+                    key.disabled = last_error = e
+                    continue
+                if e.status_code == 429:
+                    delay = retry_after_seconds(e.response)
+                    key.cool_until = time.monotonic() + (delay if delay is not None else self.cooldown)
+                    last_error = e
+                    continue
+                raise
+            finally:
+                if key.quota is not None:
+                    key.quota.release()
+
+            # Searches served from the local cache, or that return an error, aren't charged.
+            charged = not (isinstance(results, SerpResults) and (results.cached or "error" in results))
+            if charged and key.quota is not None:
+                key.quota.record()
+
+            return results
+
+    def search_many(self, params_iterable, *, max_workers=8, ordered=False, **kwargs):
+        """Run many searches concurrently, spread across the pool's keys. Accepts the same arguments as
+        :meth:`Client.search_many <serpapi.Client.search_many>`.
+
+        Searches that find no key with searches left are recorded with :class:`QuotaExceeded <serpapi.QuotaExceeded>`.
+        """
+
+        return _search_many(self, params_iterable, max_workers=max_workers, ordered=ordered, **kwargs)
+
+    def close(self):
+        """Stop every background quota re-sync, and close the shared connection pool."""
+
+        for key in self.keys:
+            if key.quota is not None:
+                key.quota.stop()
+        self.client.close()
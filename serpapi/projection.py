@@ -0,0 +1,202 @@
+import re
+
+from . import jsonlib
+from .lazy import index_sections
+
+# A selector is a dotted path of keys, each optionally marked as an array with ``[*]`` (or ``[]``),
+# and may end with a group of paths in braces: ``organic_results[*].{title,link}``.
+_PATH = re.compile(r"^\w+(?:\[\*?\])?(?:\.\w+(?:\[\*?\])?)*$")
+_STEP = re.compile(r"(\w+)(\[\*?\])?")
+_GROUP = re.compile(r"^(.*?)\.?\{([^{}]*)\}$")
+
+# The marker, in a selector tree, for "each item of an array".
+_EACH = "[*]"
+
+
+def _expand(selector):
+    """Return the plain paths a selector stands for, expanding a trailing ``{...}`` group."""
+
+    selector = selector.strip()
+    if selector.startswith("$."):
+        selector = selector[2:]
+
+    match = _GROUP.match(selector)
+    if match is None:
+        paths = [selector]
+    else:
+        prefix, members = match.groups()
+        paths = [f"{ prefix }.{ member.strip() }" if prefix else member.strip() for member in members.split(",")]
+
+    for path in paths:
+        if not _PATH.match(path):
+            raise ValueError(f"Invalid selector: { repr(selector) }")
+    return paths
+
+
+def _merge(tree, path):
+    steps = _STEP.findall(path)
+    node = tree
+    for i, (key, each) in enumerate(steps):
+        last = i == len(steps) - 1
+        if key in node and node[key] is None:
+            # The whole value is already selected.
+            return
+        if last and not each:
+            node[key] = None
+            return
+        node = node.setdefault(key, {})
+        if each:
+            if last:
+                node[_EACH] = None
+                return
+            if node.get(_EACH, {}) is None:
+                return
+            node = node.setdefault(_EACH, {})
+
+
+def _freeze(node):
+    if node is None:
+        return None
+    return frozenset((key, _freeze(sub)) for key, sub in node.items())
+
+
+def _prune(value, node):
+    if node is None:
+        return value
+
+    if isinstance(value, list):
+        each = node.get(_EACH, node)
+        return [_prune(item, each) for item in value]
+
+    if isinstance(value, dict):
+        return {key: _prune(value[key], sub) for key, sub in node.items() if key != _EACH and key in value}
+
+    return value
+
+
+def _restrictor(key, node):
+    if node is None:
+        return key
+
+    if _EACH in node and len(node) == 1:
+        key, node = f"{ key }[]", node[_EACH]
+        if node is None:
+            return key
+    elif _EACH in node:
+        # An array selected both as a whole and by member; keep it all.
+        return key
+
+    members = [_restrictor(member, sub) for member, sub in node.items()]
+    if len(members) == 1:
+        return f"{ key }.{ members[0] }"
+    return f"{ key }.{{{ ','.join(members) }}}"
+
+
+class Projection:
+    """Selects a few fields from search results, for pipelines that keep only those.
+
+    Selectors are JSONPath-like dotted paths; ``[*]`` (or ``[]``) marks an array, whose items
+    are each projected, and a trailing ``{...}`` group selects several members at once:
+
+    .. code-block:: python
+
+        >>> projection = serpapi.Projection("search_metadata.id", "organic_results[*].{position,title,link}")
+        >>> results = client.search(q="coffee", projection=projection)
+        >>> results.data
+        {'search_metadata': {'id': '...'}, 'organic_results': [{'position': 1, 'title': '...', 'link': '...'}, ...]}
+
+    The projection is pushed to SerpApi.com as the ``json_restrictor`` parameter, so that
+    less is sent over the wire, and is applied again while decoding: only the top-level
+    sections selected are decoded, and everything else is dropped as soon as it is.
+    ``error`` and ``serpapi_pagination`` are always kept, so that failed searches are still
+    detected, and :meth:`SerpResults.yield_pages <serpapi.SerpResults.yield_pages>` still works.
+
+    :param selectors: the paths to keep.
+    :param pushdown: if ``True`` (default), send the projection as ``json_restrictor``. Set it to
+        ``False`` to fetch (and cache) whole responses, and project them locally.
+    """
+
+    #: Top-level keys kept whatever the selectors.
+    ALWAYS_KEPT = ("error", "serpapi_pagination")
+
+    def __init__(self, *selectors, pushdown=True):
+        if not selectors:
+            raise ValueError("Projection requires at least one selector")
+
+        self.selectors = tuple(path for selector in selectors for path in _expand(selector))
+        self.pushdown = pushdown
+
+        self._tree = {}
+        for path in self.selectors:
+            _merge(self._tree, path)
+        for key in self.ALWAYS_KEPT:
+            self._tree.setdefault(key, None)
+
+    def __repr__(self):
+        return f"<Projection { repr(self.json_restrictor) }>"
+
+    def __eq__(self, other):
+        if not isinstance(other, Projection):
+            return NotImplemented
+        return (self._key(), self.pushdown) == (other._key(), other.pushdown)
+
+    def __hash__(self):
+        return hash((self._key(), self.pushdown))
+
+    def _key(self):
+        return _freeze(self._tree)
+
+    @classmethod
+    def coerce(cls, projection):
+        """Return ``projection`` as a :class:`Projection`: it may already be one, a selector string, or an iterable of them."""
+
+        if projection is None or isinstance(projection, cls):
+            return projection
+        if isinstance(projection, str):
+            return cls(projection)
+        return cls(*projection)
+
+    @property
+    def json_restrictor(self):
+        """The projection, as a value for SerpApi's ``json_restrictor`` parameter."""
+
+        return ",".join(_restrictor(key, node) for key, node in self._tree.items())
+
+    def restrict(self, params):
+        """Return a copy of ``params`` with the projection pushed down as ``json_restrictor``, where it applies.
+
+        It doesn't apply to HTML output, to searches that already set ``json_restrictor``, or if ``pushdown`` is off.
+        """
+
+        if (
+            not self.pushdown
+            or "json_restrictor" in params
+            or str(params.get("output", "json")).lower() != "json"
+        ):
+            return params
+        return dict(params, json_restrictor=self.json_restrictor)
+
+    def apply(self, data):
+        """Return the projection of decoded results (a ``dict``, or a :class:`SerpResults <serpapi.SerpResults>`)."""
+
+        return {key: _prune(data[key], node) for key, node in self._tree.items() if key in data}
+
+    def decode(self, content):
+        """Decode a raw JSON response body, keeping only the selected fields.
+
+        Only the top-level sections the selectors touch are decoded, when the body is laid out as
+        SerpApi.com lays it out. Raises ``ValueError`` if ``content`` isn't JSON.
+        """
+
+        spans = index_sections(content)
+        if spans is None:
+            data = jsonlib.loads(content)
+            return self.apply(data) if isinstance(data, dict) else data
+
+        content = memoryview(content)
+        projected = {}
+        for key, node in self._tree.items():
+            if key in spans:
+                start, end = spans[key]
+                projected[key] = _prune(jsonlib.loads(content[start:end]), node)
+        return projected
@@ -0,0 +1,181 @@
+import threading
+import time
+
+
+class QuotaTracker:
+    """Keeps a local, running count of a SerpApi account's remaining searches, so that
+    callers can check their quota without calling :meth:`Client.account <serpapi.Client.account>`.
+
+    The tracker is seeded from the Account API, attaches itself to ``client`` (as ``client.quota``),
+    and from then on counts every successful search the client sends. Searches answered from a
+    local :class:`ResponseCache <serpapi.ResponseCache>`, and searches that return an ``error``,
+    aren't counted, as SerpApi doesn't charge for them. :meth:`Client.search_many <serpapi.Client.search_many>`
+    stops submitting searches once the quota is used up.
+
+    .. code-block:: python
+
+        >>> quota = serpapi.QuotaTracker(client, resync_interval=300)
+        >>> quota.available()
+        4821
+
+    :param client: the :class:`Client <serpapi.Client>` whose searches are counted.
+    :param api_key: track this API key's account, rather than the client's own. The tracker then doesn't attach
+        itself to ``client``, and searches must be counted with :meth:`record` (as :class:`ClientPool <serpapi.ClientPool>` does).
+    :param resync_interval: if given, re-sync with the Account API every this many seconds, on a background thread.
+    :param reserve: the number of searches to hold back from :meth:`available`, *e.g.* for other workers sharing the account.
+    """
+
+    def __init__(self, client, *, api_key=None, resync_interval=None, reserve=0):
+        self.client = client
+        self.api_key = api_key
+        self.resync_interval = resync_interval
+        self.reserve = reserve
+
+        #: The searches left on the plan (including extra credits), as of the last sync, less those counted since.
+        self.searches_left = None
+        #: The searches made in the current hour, as of the last sync, plus those counted since. It is reset
+        #: when the clock moves into the next hour, whether or not the tracker has re-synced since.
+        self.this_hour_searches = 0
+        #: The plan's hourly throughput limit.
+        self.hourly_limit = None
+        #: When the tracker was last synced, as a Unix timestamp.
+        self.synced_at = None
+        #: The exception raised by the last failed background sync, if any.
+        self.last_error = None
+
+        self._recorded = 0
+        self._reserved = 0
+        self._hour = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.sync()
+        if api_key is None:
+            client.quota = self
+
+        if resync_interval:
+            self.start()
+
+    def __repr__(self):
+        return f"<QuotaTracker left={ self.searches_left } this_hour={ self.this_hour_searches }/{ self.hourly_limit }>"
+
+    def sync(self):
+        """Re-seed the counts from :meth:`Client.account <serpapi.Client.account>`."""
+
+        with self._lock:
+            recorded_before = self._recorded
+
+        if self.api_key is not None:
+            account = self.client.account(api_key=self.api_key)
+        else:
+            account = self.client.account()
+
+        with self._lock:
+            # Searches counted while the account request was in flight may or may not be
+            # reflected in it; assume they aren't, erring on the side of fewer searches left.
+            in_flight = self._recorded - recorded_before
+
+            self.searches_left = account.get("total_searches_left", account.get("plan_searches_left"))
+            if self.searches_left is not None:
+                self.searches_left -= in_flight
+            self.this_hour_searches = account.get("this_hour_searches", 0) + in_flight
+            self.hourly_limit = account.get("account_rate_limit_per_hour")
+            self.synced_at = time.time()
+            self._hour = self._current_hour()
+
+    def record(self, searches=1):
+        """Count ``searches`` successful searches against the quota."""
+
+        with self._lock:
+            self._roll_over()
+            self._recorded += searches
+            if self.searches_left is not None:
+                self.searches_left -= searches
+            self.this_hour_searches += searches
+
+    @staticmethod
+    def _current_hour():
+        return int(time.time() // 3600)
+
+    def _roll_over(self):
+        # Without a re-sync, the hourly count would otherwise stay at the limit for good.
+        hour = self._current_hour()
+        if hour != self._hour:
+            self._hour = hour
+            self.this_hour_searches = 0
+
+    def remaining_this_hour(self):
+        """The number of searches that can still be made this hour, or ``None`` if the plan has no hourly limit."""
+
+        with self._lock:
+            self._roll_over()
+            if self.hourly_limit is None:
+                return None
+            return max(self.hourly_limit - self.this_hour_searches, 0)
+
+    def available(self):
+        """The number of searches that can be made right now: the lesser of the searches left on
+        the plan and this hour, less ``reserve`` and any searches reserved by in-flight batches.
+        """
+
+        with self._lock:
+            return self._available()
+
+    def _available(self):
+        self._roll_over()
+        limits = []
+        if self.searches_left is not None:
+            limits.append(self.searches_left)
+        if self.hourly_limit is not None:
+            limits.append(self.hourly_limit - self.this_hour_searches)
+        if not limits:
+            return None
+        return max(min(limits) - self.reserve - self._reserved, 0)
+
+    def try_reserve(self, searches=1):
+        """Reserve ``searches`` if they are available right now. Returns ``True`` on success.
+
+        Reserved searches are excluded from :meth:`available` until they are :meth:`release` d.
+        """
+
+        with self._lock:
+            available = self._available()
+            if available is not None and available < searches:
+                return False
+            self._reserved += searches
+            return True
+
+    def release(self, searches=1):
+        """Release searches reserved with :meth:`try_reserve`, once they have been sent (and :meth:`record` ed) or abandoned."""
+
+        with self._lock:
+            self._reserved = max(self._reserved - searches, 0)
+
+    def start(self):
+        """Start re-syncing every ``resync_interval`` seconds on a background (daemon) thread."""
+
+        if self._thread is not None:
+            return self
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._resync_forever, name="serpapi-quota", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background re-sync thread, if it's running."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _resync_forever(self):
+        while not self._stop.wait(self.resync_interval):
+            try:
+                self.sync()
+                self.last_error = None
+            except Exception as e:
+                # Keep counting locally; the next sync may well succeed.
+                self.last_error = e
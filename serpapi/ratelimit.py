@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """A token bucket that paces searches to a sustained rate, allowing short bursts.
+
+    One instance may be shared by every thread (and every asyncio task) using a client:
+    each caller reserves a token under a lock, then sleeps outside of it until its
+    token is due, so waiting callers are served in the order they arrived.
+
+    :param rate: the sustained number of requests per second.
+    :param burst: the number of requests that may be issued back-to-back after a quiet period.
+    """
+
+    def __init__(self, rate, *, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<RateLimiter rate={ self.rate }/s burst={ self.burst }>"
+
+    @classmethod
+    def from_account(cls, account, *, burst=None):
+        """Build a limiter that paces searches to a SerpApi plan's hourly throughput limit.
+
+        :param account: the information returned by :meth:`Client.account <serpapi.Client.account>`.
+        :param burst: the bucket size; defaults to one minute's worth of searches.
+
+        The bucket starts with no more tokens than there are searches left this hour
+        (and on the plan), so a freshly started worker can't trip the limit.
+        """
+
+        per_hour = account["account_rate_limit_per_hour"]
+        if burst is None:
+            burst = max(1, per_hour // 60)
+
+        limiter = cls(per_hour / 3600, burst=burst)
+
+        remaining = per_hour - account.get("this_hour_searches", 0)
+        if "plan_searches_left" in account:
+            remaining = min(remaining, account["plan_searches_left"])
+        limiter._tokens = float(max(min(limiter._tokens, remaining), 0))
+
+        return limiter
+
+    @property
+    def available(self):
+        """The number of tokens available right now."""
+
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, tokens):
+        """Take ``tokens``, going into debt if needed, and return how long to wait for them."""
+
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return max(-self._tokens / self.rate, 0.0)
+
+    def try_acquire(self, tokens=1):
+        """Take ``tokens`` if they are available right now, without waiting. Returns ``True`` on success."""
+
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens=1):
+        """Block the calling thread until ``tokens`` are available, and take them."""
+
+        delay = self._reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens=1):
+        """Wait, without blocking the event loop, until ``tokens`` are available, and take them."""
+
+        delay = self._reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
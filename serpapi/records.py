@@ -0,0 +1,261 @@
+from collections.abc import Sequence
+
+
+class Record:
+    """A compact, typed view of one result (*e.g.* one of ``organic_results``), for holding
+    results by the million.
+
+    Each known field is stored in a slot rather than in a per-result dictionary, which takes
+    several times less memory, and is read as a plain attribute. Known fields the result didn't
+    have read as ``None``; other keys are kept aside (and can be read with ``record[key]``), so
+    that :meth:`as_dict` returns the result exactly as it was received.
+
+    .. code-block:: python
+
+        >>> for result in results.records("organic_results"):
+        ...     print(result.position, result.title, result.link)
+
+    :param **: the result's fields.
+    """
+
+    __slots__ = ("_present", "_extra")
+
+    #: The fields stored in slots; subclasses list those of their result type.
+    FIELDS = ()
+    _bits = {}
+
+    def __init__(self, **fields):
+        self._fill(fields)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._bits = {name: 1 << i for i, name in enumerate(cls.FIELDS)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a result dictionary."""
+
+        record = cls.__new__(cls)
+        record._fill(data)
+        return record
+
+    def _fill(self, data):
+        bits = self._bits
+        present = 0
+        extra = None
+        for key, value in data.items():
+            bit = bits.get(key)
+            if bit is not None:
+                setattr(self, key, value)
+                present |= bit
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+
+        # Every slot is set, so that reading a field never needs a fallback (which would slow down every read).
+        if present != (1 << len(bits)) - 1:
+            for name, bit in bits.items():
+                if not present & bit:
+                    setattr(self, name, None)
+
+        # Results of one type mostly share the same fields: share their masks, too.
+        self._present = _masks.setdefault(present, present)
+        self._extra = extra
+
+    def __getitem__(self, key):
+        bit = self._bits.get(key)
+        if bit is not None and self._present & bit:
+            return getattr(self, key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        bit = self._bits.get(key)
+        if bit is not None:
+            return bool(self._present & bit)
+        return bool(self._extra) and key in self._extra
+
+    def get(self, key, default=None):
+        """Return the field ``key``, or ``default`` if the result didn't have it, as ``dict.get`` does."""
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def as_dict(self):
+        """Return the result as a dictionary again, with the same keys and values it was built from."""
+
+        present = self._present
+        data = {name: getattr(self, name) for name, bit in self._bits.items() if present & bit}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return NotImplemented
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{ key }={ repr(value) }" for key, value in self.as_dict().items())
+        return f"{ type(self).__name__ }({ fields })"
+
+    def __reduce__(self):
+        return (type(self).from_dict, (self.as_dict(),))
+
+
+_masks = {}
+
+
+class OrganicResult(Record):
+    """An item of ``organic_results``."""
+
+    __slots__ = FIELDS = (
+        "position",
+        "title",
+        "link",
+        "redirect_link",
+        "displayed_link",
+        "favicon",
+        "thumbnail",
+        "date",
+        "snippet",
+        "snippet_highlighted_words",
+        "sitelinks",
+        "rich_snippet",
+        "about_this_result",
+        "cached_page_link",
+        "source",
+    )
+
+
+class LocalResult(Record):
+    """An item of ``local_results`` (*e.g.* from Google Maps)."""
+
+    __slots__ = FIELDS = (
+        "position",
+        "title",
+        "place_id",
+        "data_id",
+        "data_cid",
+        "gps_coordinates",
+        "rating",
+        "reviews",
+        "price",
+        "type",
+        "types",
+        "address",
+        "phone",
+        "website",
+        "description",
+        "open_state",
+        "hours",
+        "operating_hours",
+        "service_options",
+        "thumbnail",
+    )
+
+
+class ShoppingResult(Record):
+    """An item of ``shopping_results``."""
+
+    __slots__ = FIELDS = (
+        "position",
+        "title",
+        "link",
+        "product_link",
+        "product_id",
+        "source",
+        "price",
+        "extracted_price",
+        "old_price",
+        "extracted_old_price",
+        "rating",
+        "reviews",
+        "delivery",
+        "extensions",
+        "tag",
+        "thumbnail",
+    )
+
+
+class NewsResult(Record):
+    """An item of ``news_results``."""
+
+    __slots__ = FIELDS = (
+        "position",
+        "title",
+        "link",
+        "source",
+        "date",
+        "iso_date",
+        "snippet",
+        "thumbnail",
+        "highlight",
+        "stories",
+    )
+
+
+class JobResult(Record):
+    """An item of ``jobs_results``."""
+
+    __slots__ = FIELDS = (
+        "title",
+        "company_name",
+        "location",
+        "via",
+        "description",
+        "job_highlights",
+        "related_links",
+        "thumbnail",
+        "extensions",
+        "detected_extensions",
+        "job_id",
+        "apply_options",
+        "share_link",
+    )
+
+
+#: The record class for each result array.
+RECORD_TYPES = {
+    "organic_results": OrganicResult,
+    "local_results": LocalResult,
+    "shopping_results": ShoppingResult,
+    "news_results": NewsResult,
+    "jobs_results": JobResult,
+}
+
+
+class RecordList(Sequence):
+    """A read-only sequence of :class:`Record` objects over a list of result dictionaries.
+
+    Each record is built when it is accessed, and isn't kept: to hold the records in place
+    of the dictionaries, make a ``list`` of them, and drop the results.
+    """
+
+    __slots__ = ("items", "record_type")
+
+    def __init__(self, items, record_type):
+        self.items = items
+        self.record_type = record_type
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordList(self.items[index], self.record_type)
+        return self.record_type.from_dict(self.items[index])
+
+    def __iter__(self):
+        from_dict = self.record_type.from_dict
+        for item in self.items:
+            yield from_dict(item)
+
+    def __repr__(self):
+        return f"<RecordList { self.record_type.__name__ } x { len(self) }>"
@@ -0,0 +1,112 @@
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+
+from .exceptions import HTTPError, HTTPConnectionError, TimeoutError
+
+
+class RetryPolicy:
+    """Decides whether, and when, a failed request to SerpApi.com is retried.
+
+    Delays grow exponentially (``backoff_base * 2 ** (attempt - 1)``, capped at ``backoff_cap``)
+    and, with ``jitter``, are drawn uniformly from ``[0, delay]`` so that many clients
+    failing at once don't retry in lockstep. A ``Retry-After`` header sent with the
+    response takes precedence, as long as it's no longer than ``max_retry_after``.
+
+    :param max_attempts: the total number of attempts, including the first one.
+    :param backoff_base: the delay, in seconds, before the first retry.
+    :param backoff_cap: the maximum delay, in seconds, between attempts.
+    :param jitter: if ``True`` (default), randomize each delay.
+    :param retry_statuses: the HTTP status codes that are worth retrying.
+    :param retry_on_timeout: if ``True`` (default), retry :class:`TimeoutError <serpapi.TimeoutError>`.
+    :param retry_on_connection_error: if ``True`` (default), retry :class:`HTTPConnectionError <serpapi.HTTPConnectionError>`.
+    :param respect_retry_after: if ``True`` (default), wait as long as the ``Retry-After`` header asks.
+    :param max_retry_after: give up, rather than wait, if ``Retry-After`` asks for more seconds than this.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_cap=30.0,
+        jitter=True,
+        retry_statuses=(429, 500, 502, 503, 504),
+        retry_on_timeout=True,
+        retry_on_connection_error=True,
+        respect_retry_after=True,
+        max_retry_after=60.0,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_timeout = retry_on_timeout
+        self.retry_on_connection_error = retry_on_connection_error
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self):
+        return f"<RetryPolicy max_attempts={ self.max_attempts }>"
+
+    def is_retryable(self, exception):
+        """Return ``True`` if ``exception`` represents a transient failure."""
+
+        if isinstance(exception, TimeoutError):
+            return self.retry_on_timeout
+        if isinstance(exception, HTTPConnectionError):
+            return self.retry_on_connection_error
+        if isinstance(exception, HTTPError):
+            return exception.status_code in self.retry_statuses
+        return False
+
+    def backoff(self, attempt):
+        """Return the delay, in seconds, before retrying after failed attempt number ``attempt``."""
+
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(self, exception, attempt):
+        """Return how many seconds to wait before retrying after ``exception`` was raised
+        by attempt number ``attempt``, or ``None`` if the request should not be retried.
+        """
+
+        if attempt >= self.max_attempts or not self.is_retryable(exception):
+            return None
+
+        delay = self.backoff(attempt)
+
+        if self.respect_retry_after:
+            retry_after = retry_after_seconds(getattr(exception, "response", None))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+
+        return delay
+
+
+def retry_after_seconds(response):
+    """Return the delay requested by a response's ``Retry-After`` header, in seconds, if any."""
+
+    if response is None:
+        return None
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+
+    # Otherwise, it's an HTTP date.
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
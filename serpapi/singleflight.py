@@ -0,0 +1,86 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into a single call.
+
+    While a call for a key is in flight, other threads asking for the same key wait for
+    it and receive its result (the very same object) or its exception, instead of
+    making their own call.
+    """
+
+    def __init__(self):
+        #: The number of calls that were answered by another caller's in-flight call.
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """Return ``fn()``, or the result of an identical call already in flight for ``key``."""
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """The asyncio counterpart to :class:`SingleFlight`, for tasks sharing one event loop."""
+
+    def __init__(self):
+        #: The number of calls that were answered by another caller's in-flight call.
+        self.shared = 0
+        self._calls = {}
+
+    async def do(self, key, fn):
+        """Return ``await fn()``, or the result of an identical call already in flight for ``key``."""
+
+        # Imported here, so that synchronous clients don't pay for importing asyncio.
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            # The call runs as a task of its own, so that cancelling any caller (even the first) leaves it
+            # running for the others.
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda task: self._finished(key, task))
+
+        return await asyncio.shield(task)
+
+    def _finished(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved: every caller may have been cancelled.
+        if not task.cancelled():
+            task.exception()
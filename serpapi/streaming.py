@@ -0,0 +1,198 @@
+import json
+import re
+
+from .exceptions import SearchError
+
+# The bytes that matter when skipping over a JSON container or string. Everything in
+# between is jumped over by the regex engine, rather than inspected in Python.
+_STRUCTURAL = re.compile(rb'[][{}"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+_SCALAR_END = b",]} \t\r\n"
+
+
+class _Reader:
+    """A cursor over a JSON document arriving as a sequence of byte chunks.
+
+    Only the bytes from ``mark`` (or the cursor, if unset) onwards are kept in memory.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.buf = bytearray()
+        self.pos = 0
+        self.mark = None
+        self.discarded = 0
+
+    def more(self):
+        """Read the next chunk into the buffer. Returns ``False`` at the end of the stream."""
+
+        for chunk in self._chunks:
+            if chunk:
+                keep = self.pos if self.mark is None else self.mark
+                del self.buf[:keep]
+                self.discarded += keep
+                self.pos -= keep
+                if self.mark is not None:
+                    self.mark -= keep
+                self.buf += chunk
+                return True
+        return False
+
+    def tell(self):
+        """Return the cursor's offset from the start of the stream."""
+
+        return self.discarded + self.pos
+
+    def peek(self):
+        """Skip whitespace and return the next byte, or ``None`` at the end of the stream."""
+
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                return None
+
+    def expect(self, char):
+        if self.peek() != ord(char):
+            raise ValueError(f"Malformed JSON: expected { repr(char) } at offset { self.pos }")
+        self.pos += 1
+
+    def _need_more(self):
+        if not self.more():
+            raise ValueError("Malformed JSON: unexpected end of stream")
+
+    def skip_string(self):
+        self.pos += 1
+        while True:
+            m = _STRING_SPECIAL.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                self._need_more()
+            elif m.group() == b'"':
+                self.pos = m.end()
+                return
+            elif m.end() < len(self.buf):
+                # Skip the backslash and the character it escapes.
+                self.pos = m.end() + 1
+            else:
+                self.pos = m.start()
+                self._need_more()
+
+    def skip_container(self):
+        depth = 0
+        while True:
+            m = _STRUCTURAL.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                self._need_more()
+                continue
+
+            char = m.group()
+            if char == b'"':
+                self.pos = m.start()
+                self.skip_string()
+                continue
+
+            depth += 1 if char in b"[{" else -1
+            self.pos = m.end()
+            if depth == 0:
+                return
+
+    def skip_scalar(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] not in _SCALAR_END:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self.more():
+                return
+
+    def skip_value(self):
+        char = self.peek()
+        if char is None:
+            raise ValueError("Malformed JSON: unexpected end of stream")
+        if char in b"[{":
+            self.skip_container()
+        elif char == ord('"'):
+            self.skip_string()
+        else:
+            self.skip_scalar()
+
+    def read_value(self, loads=json.loads):
+        """Decode the value at the cursor, reading only as much of the stream as it spans."""
+
+        self.peek()
+        self.mark = self.pos
+        try:
+            self.skip_value()
+            return loads(bytes(self.buf[self.mark:self.pos]))
+        finally:
+            self.mark = None
+
+
+def iter_top_level(chunks, loads=json.loads):
+    """Yield ``(key, reader)`` for each member of the top-level JSON object in ``chunks``.
+
+    The consumer must either decode or skip the value at the reader's cursor before
+    resuming iteration; unconsumed values are skipped automatically.
+    """
+
+    reader = _Reader(chunks)
+    reader.expect("{")
+
+    while True:
+        char = reader.peek()
+        if char == ord("}"):
+            return
+        if char == ord(","):
+            reader.pos += 1
+            continue
+        if char is None:
+            raise ValueError("Malformed JSON: unexpected end of stream")
+
+        key = reader.read_value(loads)
+        reader.expect(":")
+
+        reader.peek()
+        start = reader.tell()
+        yield key, reader
+        if reader.tell() == start:
+            reader.skip_value()
+
+
+def iter_array(chunks, key, loads=json.loads, *, raise_errors=False):
+    """Yield the items of the top-level array ``key`` from a JSON object arriving in byte ``chunks``.
+
+    Only one item is decoded and held in memory at a time, and other top-level members
+    are skipped without being decoded. Reading stops as soon as the array ends.
+
+    If ``raise_errors`` is true, a top-level ``error`` member (as in SerpApi's error responses)
+    raises :class:`SearchError <serpapi.SearchError>` when it is reached.
+
+    .. code-block:: python
+
+        >>> with open("results.json", "rb") as f:
+        ...     for result in iter_array(iter(lambda: f.read(65536), b""), "organic_results"):
+        ...         print(result["link"])
+    """
+
+    for name, reader in iter_top_level(chunks, loads):
+        if raise_errors and name == "error":
+            raise SearchError(reader.read_value(loads))
+        if name != key:
+            continue
+
+        if reader.peek() != ord("["):
+            # Not an array (e.g. an error message); there's nothing to iterate.
+            return
+
+        reader.pos += 1
+        while True:
+            char = reader.peek()
+            if char == ord("]"):
+                return
+            if char == ord(","):
+                reader.pos += 1
+                continue
+            yield reader.read_value(loads)
@@ -1,16 +1,12 @@
-try:
-    import pygments
-    from pygments import highlight, lexers, formatters
-except ImportError:
-    pygments = None
-
-
 def prettify_json(s):
-    if pygments:
-        return highlight(
-            s,
-            lexers.JsonLexer(),
-            formatters.TerminalFormatter(),
-        )
-    else:
+    # pygments is slow to import, and only needed when results are printed.
+    try:
+        from pygments import highlight, lexers, formatters
+    except ImportError:
         return s
+
+    return highlight(
+        s,
+        lexers.JsonLexer(),
+        formatters.TerminalFormatter(),
+    )
@@ -0,0 +1,237 @@
+import time
+
+from datetime import timedelta
+
+import requests
+
+from urllib3.util.request import ACCEPT_ENCODING
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .exceptions import HTTPConnectionError, TimeoutError
+
+
+class Transport:
+    """The interface between :class:`HTTPClient <serpapi.http.HTTPClient>` and an HTTP library.
+
+    A transport sends a single request, and returns a ``requests.Response`` (or an object
+    with the same interface), whatever its status code. Failures to get a response at all
+    must be raised as :class:`TimeoutError <serpapi.TimeoutError>` or
+    :class:`HTTPConnectionError <serpapi.HTTPConnectionError>`; status codes are checked by the client.
+    """
+
+    #: The underlying session object, *e.g.* a ``requests.Session``.
+    session = None
+
+    #: The content codings this transport can decode, as an ``Accept-Encoding`` header value.
+    accept_encoding = "gzip, deflate"
+
+    def request(self, method, url, *, params=None, headers=None, **kwargs):
+        """Send a request, and return its response.
+
+        :param params: query parameters, merged into any query string ``url`` already has. ``None`` values are dropped.
+        :param **: ``timeout`` and ``stream``, and any other arguments the transport supports.
+        """
+
+        raise NotImplementedError
+
+    def close(self):
+        """Close the transport's connections."""
+
+        self.session.close()
+
+    def after_fork(self):
+        """Called in a child process, before its first request, when the transport was created in its parent.
+
+        The connections inherited from the parent are still in use there, so they must be dropped
+        (but not closed, which could disturb the parent's use of them) and new ones opened as needed.
+        """
+
+
+class RequestsTransport(Transport):
+    """The default transport, built on a ``requests.Session`` (HTTP/1.1, one request per connection at a time)."""
+
+    # urllib3 adds br and zstd when their decoders are installed.
+    accept_encoding = ", ".join(ACCEPT_ENCODING.split(","))
+
+    def __init__(self, session=None):
+        self.session = session if session is not None else requests.Session()
+
+    def request(self, method, url, *, params=None, headers=None, **kwargs):
+        try:
+            return self.session.request(method=method, url=url, params=params, headers=headers, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            raise HTTPConnectionError(e)
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(e)
+
+    def after_fork(self):
+        # Replace each adapter's pools in place, so the session's other state (and adapters' stats) carry over.
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                # PooledHTTPAdapter keeps its pool sizes; other adapters get requests' defaults.
+                adapter.init_poolmanager(
+                    getattr(adapter, "pool_connections", DEFAULT_POOLSIZE),
+                    getattr(adapter, "pool_maxsize", DEFAULT_POOLSIZE),
+                    block=getattr(adapter, "pool_block", DEFAULT_POOLBLOCK),
+                )
+                adapter.proxy_manager = {}
+
+
+class _StreamedBody:
+    """A file-like view of an ``httpx.Response``, as ``requests.Response.raw`` expects.
+
+    Like urllib3's responses, :meth:`tell` counts the bytes received over the wire, before decompression.
+    """
+
+    def __init__(self, response, chunk_size=65536):
+        self._response = response
+        self._chunks = response.iter_bytes(chunk_size)
+        self._buffer = b""
+
+    def read(self, size=-1):
+        import httpx
+
+        try:
+            while size < 0 or len(self._buffer) < size:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer += chunk
+        except httpx.TimeoutException as e:
+            raise TimeoutError(e)
+        except httpx.TransportError as e:
+            raise HTTPConnectionError(e)
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def tell(self):
+        return self._response.num_bytes_downloaded
+
+    def close(self):
+        self._response.close()
+
+
+class HTTPXTransport(Transport):
+    """A transport built on ``httpx``, which can multiplex many concurrent requests over a few HTTP/2 connections.
+
+    Requires the optional ``httpx`` dependency, plus ``h2`` for HTTP/2 (``pip install serpapi[http2]``).
+
+    .. code-block:: python
+
+        >>> client = serpapi.Client(api_key="secret_api_key", transport=serpapi.HTTPXTransport(http2=True))
+
+    :param http2: if ``True`` (default), negotiate HTTP/2 with SerpApi.com.
+    :param max_connections: the maximum number of concurrent connections.
+    :param max_keepalive_connections: the number of idle connections kept open for reuse.
+    :param verify: verify TLS certificates (or the path to a CA bundle). Unlike with ``requests``, this can't be set per request.
+    :param cert: a client certificate. Unlike with ``requests``, this can't be set per request.
+    :param proxy: a proxy URL for every request.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2=True,
+        max_connections=100,
+        max_keepalive_connections=20,
+        verify=True,
+        cert=None,
+        proxy=None,
+    ):
+        # httpx is about as slow to import as requests, so it's only imported once a transport needs it.
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "HTTPXTransport requires httpx. Install it with: pip install serpapi[http2]"
+            )
+
+        client_kwargs = {}
+        if proxy:
+            client_kwargs["proxy"] = proxy
+        if cert:
+            client_kwargs["cert"] = cert
+
+        self._client_kwargs = dict(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            verify=verify,
+            # Timeouts are applied per request, mirroring requests' defaults.
+            timeout=None,
+            follow_redirects=True,
+            **client_kwargs,
+        )
+        self.session = httpx.Client(**self._client_kwargs)
+
+    @property
+    def accept_encoding(self):
+        # httpx adds br and zstd when their decoders are installed.
+        return self.session.headers.get("Accept-Encoding", "gzip, deflate")
+
+    def after_fork(self):
+        import httpx
+
+        # Closing the inherited client would send an HTTP/2 GOAWAY on the parent's connections.
+        self.session = httpx.Client(**self._client_kwargs)
+
+    def request(self, method, url, *, params=None, headers=None, timeout=None, stream=False, **kwargs):
+        if kwargs:
+            raise TypeError(
+                f"HTTPXTransport doesn't support per-request { ', '.join(sorted(kwargs)) }; configure the transport instead."
+            )
+
+        import httpx
+
+        # Unlike requests, httpx replaces an existing query string (e.g. in a
+        # next page URL) and sends None values as empty strings.
+        url = httpx.URL(url).copy_merge_params(
+            {k: v for k, v in (params or {}).items() if v is not None}
+        )
+
+        started = time.perf_counter()
+        try:
+            request = self.session.build_request(method, url, headers=headers, timeout=timeout)
+            r = self.session.send(request, stream=True)
+            # Like requests, report the time until the response headers arrived.
+            elapsed = time.perf_counter() - started
+            if not stream:
+                try:
+                    r.read()
+                finally:
+                    r.close()
+        except httpx.TimeoutException as e:
+            raise TimeoutError(e)
+        except httpx.TransportError as e:
+            raise HTTPConnectionError(e)
+
+        return self._to_requests_response(r, stream, elapsed=elapsed)
+
+    @staticmethod
+    def _to_requests_response(r, stream, *, elapsed):
+        """Present an ``httpx.Response`` as a ``requests.Response``, so the rest of the client can't tell them apart."""
+
+        response = requests.Response()
+        response.status_code = r.status_code
+        response.reason = r.reason_phrase
+        response.url = str(r.url)
+        response.headers = CaseInsensitiveDict(r.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(seconds=elapsed)
+        # The HTTP version the response was received over, e.g. HTTP/2.
+        response.http_version = r.http_version
+
+        response.raw = _StreamedBody(r)
+        if not stream:
+            response._content = r.content
+            response._content_consumed = True
+
+        return response
@@ -1,5 +1,67 @@
 import os
+import re
+import json
+import hashlib
 
 
 def api_key_from_environment():
     return os.getenv("SERP_API_KEY")
+
+
+# Arguments of Client.search (and friends) that go to the HTTP request, rather than to SerpApi.
+REQUEST_OPTIONS = ("timeout", "proxies", "verify", "stream", "cert", "retry")
+
+# The engine SerpApi uses when a search doesn't name one.
+DEFAULT_ENGINE = "google"
+
+_COMMA_SPACES = re.compile(r"\s*,\s*")
+
+
+def _param_value(value):
+    # requests would send True as "True"; SerpApi's own spelling is "true".
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def normalize_params(params, *, location_index=None):
+    """Return a normalised copy of a search's ``params``, as it is sent: ``None`` values are dropped,
+    booleans are spelled ``true`` and ``false``, and, with a :class:`LocationIndex <serpapi.LocationIndex>`,
+    ``location`` is replaced by its canonical name. ``params`` itself is never modified.
+    """
+
+    normalized = {key: _param_value(value) for key, value in params.items() if value is not None}
+
+    if location_index is not None and normalized.get("location"):
+        normalized["location"] = location_index.normalize(normalized["location"])
+
+    return normalized
+
+
+def canonical_params(params):
+    """Return a canonical, hashable form of a search's ``params``.
+
+    Parameter order, ``None`` values and the ``api_key`` are ignored, and values are
+    compared as the strings they are sent as, so ``{"num": 10}`` and ``{"num": "10"}``
+    are equivalent. So are a missing ``engine`` and ``engine=google``, ``True`` and
+    ``"true"``, and ``location`` spellings that differ only in the spacing around commas.
+    """
+
+    items = {}
+    for key, value in params.items():
+        if key == "api_key" or value is None:
+            continue
+        value = str(_param_value(value))
+        if key == "location":
+            value = _COMMA_SPACES.sub(",", value.strip())
+        items[key] = value
+
+    items.setdefault("engine", DEFAULT_ENGINE)
+    return tuple(sorted(items.items()))
+
+
+def params_digest(params):
+    """Return a stable hex digest of :func:`canonical_params`, suitable as a storage key."""
+
+    encoded = json.dumps(canonical_params(params), separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
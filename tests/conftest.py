@@ -1,6 +1,9 @@
+import io
+import json
 import os
 
 import pytest
+import requests
 
 import serpapi
 
@@ -38,3 +41,50 @@ def coffee_search_html(client, coffee_params):
     params["output"] = "html"
 
     return client.search(**params)
+
+
+def mock_response(status_code=200, content=b'{"search_metadata": {"id": "123"}}', headers=None):
+    """Build a ``requests.Response``, as a client's session would return it.
+
+    ``content`` is the body, as bytes, or anything JSON-serialisable. It can be read whole or streamed.
+    """
+
+    if not isinstance(content, bytes):
+        content = json.dumps(content).encode()
+
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.raw = io.BytesIO(content)
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def mock_requests(monkeypatch):
+    """Route a client's HTTP requests to a handler, rather than to SerpApi.com.
+
+    ``mock_requests(client, handler)`` calls ``handler(url, params, **kwargs)`` for each request, which
+    returns a ``requests.Response`` (see :func:`mock_response`), or a body to send with a 200 status.
+    Without a handler, each search gets its number (``"1"``, ``"2"``, ...) as its id. It returns the
+    list of parameters sent so far, copied as they were sent.
+    """
+
+    def install(client, handler=None):
+        sent = []
+
+        def request(method, url, params, headers, **kwargs):
+            sent.append(dict(params))
+            if handler is None:
+                response = {"search_metadata": {"id": str(len(sent))}}
+            else:
+                response = handler(url, params, **kwargs)
+            if not isinstance(response, requests.Response):
+                response = mock_response(content=response)
+            response.url = url
+            return response
+
+        monkeypatch.setattr(client.session, "request", request)
+        return sent
+
+    return install
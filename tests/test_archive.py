@@ -0,0 +1,125 @@
+import json
+import os
+
+import serpapi
+from serpapi import ArchiveStore, Client
+
+
+def body(search_id, q="coffee", engine="google", created_at="2026-01-01 10:00:00 UTC", status="Success"):
+    return json.dumps(
+        {
+            "search_metadata": {"id": search_id, "status": status, "created_at": created_at},
+            "search_parameters": {"engine": engine, "q": q, "location_used": "Austin,Texas,United States"},
+            "organic_results": [{"title": f"{ q } { i }"} for i in range(20)],
+        }
+    ).encode()
+
+
+def make_client(mock_requests, archive):
+    client = Client(api_key="test_key", archive=archive)
+
+    def handler(url, params, **kwargs):
+        if "/searches/" in url:
+            return body(url.rsplit("/", 1)[-1])
+        return body(f"search-{ len(calls) }", q=params["q"])
+
+    calls = mock_requests(client, handler)
+    return client, calls
+
+
+def test_store_and_get(tmp_path):
+    archive = ArchiveStore(str(tmp_path))
+    content = body("abc")
+
+    assert archive.store(content) == "abc"
+    assert archive.store(content) == "abc"
+    assert len(archive) == 1
+    assert "abc" in archive
+    assert archive.get("abc") == content
+    assert archive.get("missing") is None
+
+    results = archive.load("abc")
+    assert isinstance(results, serpapi.SerpResults)
+    assert results.cached
+    assert len(results["organic_results"]) == 20
+
+    # Pending (async) searches have nothing worth keeping yet.
+    assert archive.store(body("pending", status="Processing")) is None
+    archive.close()
+
+
+def test_segments_roll_over_and_reopen(tmp_path):
+    archive = ArchiveStore(str(tmp_path), segment_size=512)
+    contents = {f"id-{ i }": body(f"id-{ i }", q=f"query { i }") for i in range(10)}
+    for content in contents.values():
+        archive.store(content)
+        # Reads interleaved with writes must see a segment's latest appends.
+        assert archive.get(archive.find()[-1]) is not None
+    archive.close()
+
+    segments = [name for name in os.listdir(tmp_path) if name.endswith(".seg")]
+    assert len(segments) > 1
+    # Compressed, the bodies take far less room than they would raw.
+    stored = sum(os.path.getsize(tmp_path / name) for name in segments)
+    assert stored < sum(map(len, contents.values())) / 2
+
+    archive = ArchiveStore(str(tmp_path), segment_size=512)
+    assert len(archive) == 10
+    for search_id, content in contents.items():
+        assert archive.get(search_id) == content
+
+    archive.store(body("id-10"))
+    assert archive.get("id-10") == body("id-10")
+    archive.close()
+
+
+def test_find_and_replay(tmp_path):
+    archive = ArchiveStore(str(tmp_path))
+    archive.store(body("a", q="coffee", created_at="2026-01-01 10:00:00 UTC"))
+    archive.store(body("b", q="tea", created_at="2026-02-01 10:00:00 UTC"))
+    archive.store(body("c", q="coffee", engine="bing", created_at="2026-03-01 10:00:00 UTC"))
+
+    assert archive.find() == ["a", "b", "c"]
+    assert archive.find(q="coffee") == ["a", "c"]
+    assert archive.find(engine="google", q="coffee") == ["a"]
+    assert archive.find(location="Austin,Texas,United States", limit=2) == ["a", "b"]
+    assert archive.find(since="2026-02-01", until="2026-03-01") == ["b"]
+
+    replayed = [results["search_metadata"]["id"] for results in archive.replay(q="coffee")]
+    assert replayed == ["a", "c"]
+    archive.close()
+
+
+def test_replay_in_batches(tmp_path):
+    archive = ArchiveStore(str(tmp_path), segment_size=1024)
+    archive.REPLAY_BATCH = 3
+    ids = [f"id-{ i }" for i in range(10)]
+    for search_id in ids:
+        archive.store(body(search_id))
+
+    assert [results["search_metadata"]["id"] for results in archive.replay()] == ids
+    assert [results["search_metadata"]["id"] for results in archive.replay(limit=4)] == ids[:4]
+    assert [results["search_metadata"]["id"] for results in archive.replay(q="tea")] == []
+    archive.close()
+
+
+def test_client_archives_searches(mock_requests, tmp_path):
+    """Ensure that searches are archived, and search_archive reads them back without an HTTP call."""
+    archive = ArchiveStore(str(tmp_path))
+    client, calls = make_client(mock_requests, archive)
+
+    results = client.search(q="coffee")
+    search_id = results["search_metadata"]["id"]
+    assert search_id in archive
+
+    archived = client.search_archive(search_id=search_id)
+    assert len(calls) == 1
+    assert archived.cached
+    assert archived["organic_results"] == results["organic_results"]
+
+    # Searches missing from the archive are fetched, and stored for next time.
+    client.search_archive(search_id="elsewhere")
+    client.search_archive(search_id="elsewhere")
+    assert len(calls) == 2
+    assert "elsewhere" in archive
+    archive.close()
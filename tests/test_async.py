@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import pytest
+
+import serpapi
+
+httpx = pytest.importorskip("httpx")
+
+
+def make_client(handler, **kwargs):
+    client = serpapi.AsyncClient(api_key="test_key", **kwargs)
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_async_search():
+    """Ensure that searches are awaitable and return AsyncSerpResults."""
+
+    def handler(request):
+        assert request.url.path == "/search"
+        assert request.url.params["q"] == "coffee"
+        assert request.url.params["api_key"] == "test_key"
+        return httpx.Response(200, json={"search_metadata": {"id": "123"}})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.search(q="coffee")
+
+    results = asyncio.run(main())
+    assert isinstance(results, serpapi.AsyncSerpResults)
+    assert results["search_metadata"]["id"] == "123"
+
+
+def test_async_yield_pages():
+    """Ensure that pages are fetched through the async generator."""
+
+    def handler(request):
+        page = int(request.url.params.get("page", 1))
+        body = {"search_metadata": {"id": str(page)}}
+        if page < 3:
+            body["serpapi_pagination"] = {"next": f"https://serpapi.com/search?page={ page + 1 }"}
+        return httpx.Response(200, content=json.dumps(body))
+
+    async def main():
+        async with make_client(handler) as client:
+            results = await client.search(q="coffee")
+            return [page["search_metadata"]["id"] async for page in results.yield_pages()]
+
+    assert asyncio.run(main()) == ["1", "2", "3"]
+
+
+def test_async_http_error():
+    """Ensure that error responses raise serpapi.HTTPError."""
+
+    def handler(request):
+        return httpx.Response(401, json={"error": "Invalid API key"})
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.account()
+
+    with pytest.raises(serpapi.HTTPError) as exc_info:
+        asyncio.run(main())
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.error == "Invalid API key"
+
+
+def test_async_timeout():
+    """Ensure that httpx timeouts are raised as serpapi.TimeoutError."""
+
+    def handler(request):
+        assert request.extensions["timeout"]["read"] == 5
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async def main():
+        async with make_client(handler, timeout=10) as client:
+            await client.search(q="coffee", timeout=5)
+
+    with pytest.raises(serpapi.TimeoutError):
+        asyncio.run(main())
+
+
+def test_async_search_archive_requires_id():
+    async def main():
+        async with make_client(lambda request: None) as client:
+            await client.search_archive()
+
+    with pytest.raises(serpapi.SearchIDNotProvided):
+        asyncio.run(main())
+
+
+def test_async_unsupported_request_options():
+    """Ensure that requests' per-call options aren't sent to SerpApi as parameters."""
+
+    def handler(request):
+        raise AssertionError("no request should be sent")
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.search(q="coffee", verify=False)
+
+    with pytest.raises(TypeError, match="verify"):
+        asyncio.run(main())
+
+
+def test_async_retry_closes_failed_responses(monkeypatch):
+    """Ensure that a retried attempt's response is closed before the next attempt."""
+    statuses = [503, 200]
+    closed = []
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"search_metadata": {"id": "123"}})
+
+    async def aclose(response):
+        closed.append(response.status_code)
+
+    monkeypatch.setattr(httpx.Response, "aclose", aclose)
+
+    async def main():
+        retry = serpapi.RetryPolicy(backoff_base=0, jitter=False)
+        async with make_client(handler, retry=retry) as client:
+            return await client.search(q="coffee")
+
+    results = asyncio.run(main())
+
+    assert results.attempts == 2
+    assert closed == [503]
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import serpapi
+from serpapi import Client
+
+from tests.conftest import mock_response
+
+
+def test_search_many_records_failures(mock_requests):
+    """Ensure that a failing search is recorded rather than aborting the batch."""
+    client = Client(api_key="test_key")
+
+    def handler(url, params, **kwargs):
+        if params["q"] == "bad":
+            return mock_response(400, b'{"error": "Invalid query"}')
+        return {"search_metadata": {"id": params["q"]}}
+
+    mock_requests(client, handler)
+
+    queries = ["a", "bad", "c"]
+    results = list(client.search_many(({"q": q} for q in queries), ordered=True))
+
+    assert [item.index for item in results] == [0, 1, 2]
+    assert results[0].ok and results[0].unwrap()["search_metadata"]["id"] == "a"
+    assert not results[1].ok
+    assert isinstance(results[1].exception, serpapi.HTTPError)
+    assert results[1].exception.error == "Invalid query"
+    assert results[2].result["search_metadata"]["id"] == "c"
+
+
+def test_search_many_passes_timeout(mock_requests):
+    """Ensure that request arguments such as timeout reach every request, without mutating the input."""
+    client = Client(api_key="test_key")
+
+    def handler(url, params, timeout, **kwargs):
+        assert timeout == 3
+        return b"{}"
+
+    mock_requests(client, handler)
+
+    params = [{"q": "coffee"}]
+    assert all(item.ok for item in client.search_many(params, timeout=3))
+    assert params == [{"q": "coffee"}]
+
+
+def test_search_many_bounded_concurrency(mock_requests):
+    """Ensure that no more than max_workers requests are in flight at once."""
+    client = Client(api_key="test_key")
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def handler(url, params, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return b"{}"
+
+    mock_requests(client, handler)
+
+    results = list(client.search_many(({"q": str(i)} for i in range(20)), max_workers=3))
+
+    assert len(results) == 20
+    assert sorted(item.index for item in results) == list(range(20))
+    assert peak <= 3
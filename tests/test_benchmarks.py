@@ -0,0 +1,72 @@
+import argparse
+
+import pytest
+
+import serpapi
+from benchmarks.mock_server import MockSerpApi
+from benchmarks.run import measure, percentile
+
+
+@pytest.fixture
+def mock_serpapi():
+    with MockSerpApi(pages=3) as server:
+        yield server
+
+
+@pytest.fixture
+def client(mock_serpapi):
+    client = serpapi.Client(api_key="test_key")
+    client.BASE_DOMAIN = mock_serpapi.url
+    return client
+
+
+def test_mock_server_endpoints(client):
+    results = client.search(q="coffee", num=25)
+    assert len(results["organic_results"]) == 25
+    assert results["search_metadata"]["status"] == "Success"
+
+    archived = client.search_archive(search_id=results["search_metadata"]["id"])
+    assert archived.data == results.data
+
+    assert len(client.locations(q="Austin", limit=3)) == 3
+    assert client.account()["plan_searches_left"] > 0
+
+    maps = client.search(engine="google_maps", q="coffee", num=5)
+    assert len(maps["local_results"]) == 5
+
+
+def test_mock_server_pagination(client):
+    pages = list(client.search(q="coffee", num=5).yield_pages(max_pages=10))
+
+    assert len(pages) == 3
+    assert [page["organic_results"][0]["position"] for page in pages] == [1, 6, 11]
+
+
+def test_mock_server_errors():
+    with MockSerpApi(error_rate=1.0) as server:
+        client = serpapi.Client(api_key="test_key")
+        client.BASE_DOMAIN = server.url
+
+        with pytest.raises(serpapi.HTTPError) as excinfo:
+            client.search(q="coffee")
+        assert excinfo.value.status_code == 503
+
+
+def test_measure(mock_serpapi):
+    args = argparse.Namespace(
+        searches=6, num=10, engine="google", pages=3, prefetch=0, workers=2, retries=1, lazy=False
+    )
+
+    for scenario in ("sync", "batch", "paginate", "archive"):
+        result = measure(scenario, mock_serpapi.url, args)
+        # The archive scenario first runs the search it then retrieves.
+        assert result["requests"] == (7 if scenario == "archive" else 6)
+        assert result["errors"] == 0
+        assert result["p50_ms"] <= result["p99_ms"]
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) is None
@@ -0,0 +1,87 @@
+import time
+
+import serpapi
+from serpapi import Client, MemoryCache, SQLiteCache
+
+
+def make_client(mock_requests, cache):
+    client = Client(api_key="test_key", cache=cache)
+    return client, mock_requests(client)
+
+
+def test_cache_hit_ignores_order_and_api_key(mock_requests):
+    """Ensure that equivalent params are served from the cache."""
+    cache = MemoryCache()
+    client, calls = make_client(mock_requests, cache)
+
+    first = client.search({"q": "coffee", "location": "Austin", "num": 10})
+    second = client.search({"num": "10", "location": "Austin", "q": "coffee", "api_key": "other"})
+
+    assert len(calls) == 1
+    assert not first.cached
+    assert second.cached
+    assert isinstance(second, serpapi.SerpResults)
+    assert second["search_metadata"]["id"] == first["search_metadata"]["id"]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_cache_no_cache_bypasses(mock_requests):
+    client, calls = make_client(mock_requests, MemoryCache())
+
+    client.search(q="coffee")
+    client.search(q="coffee", no_cache=True)
+
+    assert len(calls) == 2
+
+
+def test_cache_engine_ttls(mock_requests):
+    """Ensure that per-engine TTLs apply, and a TTL of 0 disables caching."""
+    cache = MemoryCache(ttl=3600, engine_ttls={"google_news": 0})
+    client, calls = make_client(mock_requests, cache)
+
+    for _ in range(2):
+        client.search(q="coffee", engine="google_news")
+
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", b"1", None)
+    cache.set("b", b"2", None)
+    cache.get("a")
+    cache.set("c", b"3", None)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_byte_bound_and_expiry():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"123456", None)
+    cache.set("b", b"123456", None)
+
+    assert cache.get("a") is None
+    assert cache.size == 6
+
+    cache.set("c", b"1", 0.01)
+    time.sleep(0.02)
+    assert cache.get("c") is None
+    assert cache.stats.evictions == 2
+
+
+def test_sqlite_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache(path)
+    cache.store({"q": "coffee"}, b'{"a": 1}')
+    cache.close()
+
+    reopened = SQLiteCache(path)
+    assert reopened.lookup({"q": "coffee"}) == b'{"a": 1}'
+    assert reopened.lookup({"q": "tea"}) is None
+    assert (reopened.stats.hits, reopened.stats.misses) == (1, 1)
+
+    reopened.set("expired", b"{}", -1)
+    assert reopened.purge() == 1
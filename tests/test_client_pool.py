@@ -0,0 +1,124 @@
+import collections
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+import serpapi
+from serpapi import ClientPool
+
+from tests.conftest import mock_response
+
+ACCOUNTS = {
+    "key_a": {"total_searches_left": 100, "this_hour_searches": 0, "account_rate_limit_per_hour": 1000},
+    "key_b": {"total_searches_left": 5, "this_hour_searches": 0, "account_rate_limit_per_hour": 1000},
+    "key_c": {"total_searches_left": 100, "this_hour_searches": 0, "account_rate_limit_per_hour": 1000},
+}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Answer every session's requests locally; returns the searches sent per API key, and per-key status overrides."""
+
+    sent = collections.Counter()
+    statuses = {}
+
+    def mock_request(session, method, url, params, headers, **kwargs):
+        api_key = params["api_key"]
+        if urlsplit(url).path == "/search":
+            sent[api_key] += 1
+            status = statuses.get(api_key, 200)
+            if status != 200:
+                return mock_response(status, {"error": "Nope."}, {"Retry-After": "120"})
+            return mock_response(200, {"search_metadata": {"id": "123"}})
+        if api_key not in ACCOUNTS:
+            return mock_response(401, {"error": "Invalid API key."})
+        return mock_response(200, ACCOUNTS[api_key])
+
+    monkeypatch.setattr(requests.Session, "request", mock_request)
+    return sent, statuses
+
+
+def test_balances_by_available_quota(server):
+    sent, statuses = server
+    pool = ClientPool(["key_a", "key_b", "key_c"])
+
+    for i in range(20):
+        pool.search(q=f"coffee { i }")
+
+    # key_b has only 5 searches left, so the others take all of the traffic.
+    assert sent["key_b"] == 0
+    assert abs(sent["key_a"] - sent["key_c"]) <= 1
+    assert pool.available() == 205 - 20
+
+
+def test_rejected_key_is_taken_out_of_rotation(server):
+    sent, statuses = server
+    statuses["key_a"] = 401
+    pool = ClientPool(["key_a", "key_b", "key_c"])
+
+    for i in range(6):
+        assert pool.search(q=f"coffee { i }")["search_metadata"]["id"] == "123"
+
+    assert sent["key_a"] == 1
+    assert "…ey_a" not in pool.active_keys()
+    assert pool.status()[0]["disabled"]
+
+
+def test_invalid_key_is_disabled_when_seeding(server):
+    sent, statuses = server
+    pool = ClientPool(["key_a", "bad_key"])
+
+    assert pool.active_keys() == ["…ey_a"]
+    pool.search(q="coffee")
+    assert sent == {"key_a": 1}
+
+
+def test_throttled_key_rests(server):
+    sent, statuses = server
+    statuses["key_c"] = 429
+    pool = ClientPool(["key_a", "key_b", "key_c"])
+
+    for i in range(6):
+        pool.search(q=f"coffee { i }")
+
+    assert sent["key_c"] == 1
+    assert pool.status()[2]["resting_for"] > 100
+
+
+def test_every_key_rejected(server):
+    sent, statuses = server
+    statuses.update(key_a=401, key_b=401, key_c=401)
+    pool = ClientPool(["key_a", "key_b", "key_c"])
+
+    with pytest.raises(serpapi.HTTPError) as excinfo:
+        pool.search(q="coffee")
+    assert excinfo.value.status_code == 401
+
+
+def test_quota_exhausted(server):
+    sent, statuses = server
+    pool = ClientPool(["key_b"])
+
+    records = list(pool.search_many({"q": str(i)} for i in range(8)))
+
+    assert sum(record.ok for record in records) == 5
+    assert all(isinstance(record.exception, serpapi.QuotaExceeded) for record in records if not record.ok)
+    assert pool.available() == 0
+
+
+def test_round_robin_without_quota(server):
+    sent, statuses = server
+    pool = ClientPool(["key_a", "key_b"], track_quota=False)
+
+    for i in range(4):
+        pool.search(q=f"coffee { i }")
+
+    assert sent == {"key_a": 2, "key_b": 2}
+    assert pool.available() is None
+
+
+def test_shared_connection_pool():
+    pool = ClientPool(["key_a", "key_b"], track_quota=False, pool_maxsize=32)
+
+    assert pool.client.adapter.poolmanager.connection_pool_kw["maxsize"] == 32
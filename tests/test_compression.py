@@ -0,0 +1,122 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from serpapi import Client, HTTPXTransport
+
+BODY = json.dumps(
+    {
+        "search_metadata": {"id": "123"},
+        "organic_results": [{"position": i, "title": "Coffee", "snippet": "Coffee " * 20} for i in range(50)],
+    },
+    indent=2,
+).encode()
+
+
+class CompressingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.accept_encodings.append(self.headers.get("Accept-Encoding"))
+
+        body = BODY
+        self.send_response(200)
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(BODY)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CompressingHandler)
+    server.accept_encodings = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, **kwargs):
+    client = Client(api_key="test_key", **kwargs)
+    client.BASE_DOMAIN = f"http://127.0.0.1:{ server.server_address[1] }"
+    return client
+
+
+def test_compressed_transfer_is_measured(local_server):
+    client = make_client(local_server)
+
+    results = client.search(q="coffee")
+
+    assert len(results["organic_results"]) == 50
+    assert "gzip" in local_server.accept_encodings[0]
+
+    stats = client.transfer_stats()
+    assert stats.responses == 1
+    assert stats.content_bytes == len(BODY)
+    assert stats.wire_bytes == len(gzip.compress(BODY))
+    assert stats.ratio > 5
+    assert stats.saved_bytes == stats.content_bytes - stats.wire_bytes
+
+
+def test_compression_disabled(local_server):
+    client = make_client(local_server, compression=False)
+
+    client.search(q="coffee")
+
+    assert local_server.accept_encodings == ["identity"]
+    stats = client.transfer_stats()
+    assert stats.wire_bytes == stats.content_bytes == len(BODY)
+
+
+def test_explicit_accept_encoding(local_server):
+    client = make_client(local_server, compression="gzip")
+
+    client.search(q="coffee")
+
+    assert local_server.accept_encodings == ["gzip"]
+
+
+def test_streamed_transfer_is_measured(local_server):
+    client = make_client(local_server)
+
+    items = list(client.search_stream("organic_results", q="coffee", chunk_size=256))
+
+    assert len(items) == 50
+    stats = client.transfer_stats()
+    assert stats.responses == 1
+    assert stats.content_bytes == len(BODY)
+    assert stats.wire_bytes == len(gzip.compress(BODY))
+
+
+def test_wire_bytes_in_events(local_server):
+    events = []
+    client = make_client(local_server, hooks=[events.append])
+
+    client.search(q="coffee")
+
+    end = next(event for event in events if event.name == "request_end")
+    assert end.response_bytes == len(BODY)
+    assert end.wire_bytes < end.response_bytes
+
+
+def test_httpx_transport_compression(local_server):
+    client = make_client(local_server, transport=HTTPXTransport(http2=False))
+
+    results = client.search(q="coffee")
+
+    assert len(results["organic_results"]) == 50
+    stats = client.transfer_stats()
+    assert stats.content_bytes == len(BODY)
+    assert stats.wire_bytes == len(gzip.compress(BODY))
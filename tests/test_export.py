@@ -0,0 +1,67 @@
+import io
+import json
+
+from serpapi import BatchResult, SerpResults
+from serpapi.export import export_ndjson, flatten_record, iter_column_batches
+
+
+def make_pages(count):
+    """Chain ``count`` SerpResults pages together, as next_page would."""
+    pages = [
+        SerpResults(
+            {
+                "search_metadata": {"id": f"page-{ n }"},
+                "organic_results": [
+                    {"position": n * 10 + i, "title": f"Result { i }", "gps": {"lat": 1.5}}
+                    for i in range(2)
+                ],
+                "serpapi_pagination": {"next": f"page-{ n + 1 }"} if n + 1 < count else {},
+            },
+            client=None,
+        )
+        for n in range(count)
+    ]
+    for page, following in zip(pages, pages[1:]):
+        page.next_page = lambda following=following: following
+    return pages[0]
+
+
+def test_export_ndjson_paginates():
+    out = io.BytesIO()
+    count = export_ndjson(make_pages(3), out, ["organic_results"], max_pages=3, buffer_size=64)
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == len(lines) == 6
+    assert [line["position"] for line in lines] == [0, 1, 10, 11, 20, 21]
+    assert lines[2]["_search_id"] == "page-1"
+    assert lines[2]["_result_type"] == "organic_results"
+
+
+def test_export_ndjson_batch_skips_failures(tmp_path):
+    batch = [
+        BatchResult(0, {"q": "a"}, result=make_pages(1)),
+        BatchResult(1, {"q": "b"}, exception=ValueError()),
+    ]
+    path = str(tmp_path / "out.ndjson")
+
+    assert export_ndjson(batch, path, "organic_results", annotate=False, flatten=True) == 2
+    with open(path) as f:
+        assert json.loads(f.readline()) == {"position": 0, "title": "Result 0", "gps.lat": 1.5}
+
+
+def test_flatten_record():
+    record = {"a": {"b": {"c": 1}}, "tags": ["x", "y"], "links": [{"href": "/"}]}
+
+    assert flatten_record(record) == {"a.b.c": 1, "tags": ["x", "y"], "links": '[{"href":"/"}]'}
+
+
+def test_iter_column_batches():
+    pages = make_pages(3)
+    pages["organic_results"][0]["extra"] = "only here"
+
+    batches = list(iter_column_batches(pages, ["organic_results"], batch_size=4, max_pages=3))
+
+    assert [len(batch["position"]) for batch in batches] == [4, 2]
+    assert batches[0]["extra"] == ["only here", None, None, None]
+    assert all(len(column) == 4 for column in batches[0].values())
+    assert "extra" not in batches[1]
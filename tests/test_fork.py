@@ -0,0 +1,124 @@
+import functools
+import multiprocessing
+import os
+
+import pytest
+import requests
+
+import serpapi
+from benchmarks.mock_server import MockSerpApi
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires os.fork()"
+)
+
+
+@pytest.fixture
+def mock_serpapi():
+    with MockSerpApi(pages=1) as server:
+        yield server
+
+
+def make_client(url, **kwargs):
+    client = serpapi.Client(api_key="test_key", **kwargs)
+    client.BASE_DOMAIN = url
+    return client
+
+
+def count_results(results):
+    if results["search_parameters"]["q"] == "boom":
+        raise ValueError("can't process this one")
+    return os.getpid(), len(results["organic_results"])
+
+
+def _search_in_child(client, queue):
+    client.search(q="child")
+    stats = client.pool_stats()
+    queue.put((stats.connections_created, stats.requests))
+
+
+def test_child_process_opens_its_own_connections(mock_serpapi):
+    """Ensure that a forked child doesn't reuse (or close) the connections inherited from its parent."""
+    client = make_client(mock_serpapi.url)
+    client.search(q="parent")
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    child = context.Process(target=_search_in_child, args=(client, queue))
+    child.start()
+    assert queue.get(timeout=30) == (1, 1)
+    child.join()
+
+    # The parent's connection is still open, and still reused.
+    client.search(q="parent again")
+    stats = client.pool_stats()
+    assert (stats.connections_created, stats.connections_reused) == (1, 1)
+
+
+def test_after_fork_keeps_pool_sizes():
+    client = serpapi.Client(api_key="test_key", pool_connections=4, pool_maxsize=32, pool_block=True)
+    client.session.mount("http://example.com", requests.adapters.HTTPAdapter(pool_maxsize=2))
+
+    client.transport.after_fork()
+
+    assert client.adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert client.adapter.poolmanager.connection_pool_kw["block"] is True
+    plain = client.session.get_adapter("http://example.com")
+    assert plain.poolmanager.connection_pool_kw["maxsize"] == requests.adapters.DEFAULT_POOLSIZE
+
+
+def test_search_many_processes(mock_serpapi):
+    client = make_client(mock_serpapi.url)
+    params = [{"q": f"query { i }", "num": i + 1} for i in range(8)] + [{"q": "boom"}]
+
+    items = list(client.search_many_processes(params, count_results, processes=2, ordered=True))
+
+    assert [item.index for item in items] == list(range(9))
+    assert [item.result[1] for item in items[:8]] == list(range(1, 9))
+    assert {item.result[0] for item in items[:8]} - {os.getpid()}
+    assert isinstance(items[8].exception, ValueError)
+    # The parent's client sent nothing itself.
+    assert client.pool_stats().requests == 0
+
+
+def test_search_many_processes_with_factory(mock_serpapi):
+    factory = functools.partial(make_client, mock_serpapi.url, lazy_results=True)
+
+    items = list(
+        serpapi.batch.search_many_processes(factory, ({"q": q} for q in ["a", "b", "c"]), processes=2)
+    )
+
+    assert sorted(item.index for item in items) == [0, 1, 2]
+    assert all(isinstance(item.result, serpapi.SerpResults) for item in items)
+    assert {item.result["search_parameters"]["q"] for item in items} == {"a", "b", "c"}
+
+
+def test_search_many_processes_refuses_rate_limiter(mock_serpapi):
+    client = make_client(mock_serpapi.url, rate_limiter=serpapi.RateLimiter(5))
+
+    # Each worker would otherwise send at the full rate.
+    with pytest.raises(ValueError):
+        list(client.search_many_processes([{"q": "a"}], processes=2))
+
+
+def test_search_many_processes_http_errors():
+    """Ensure that an HTTP error in a worker is recorded on its item, rather than breaking the pool."""
+    with MockSerpApi(error_rate=1.0) as server:
+        client = make_client(server.url)
+
+        items = list(client.search_many_processes(({"q": q} for q in ["a", "b", "c"]), processes=2, ordered=True))
+
+    assert [item.index for item in items] == [0, 1, 2]
+    assert all(isinstance(item.exception, serpapi.HTTPError) for item in items)
+    assert items[0].exception.status_code == 503
+    assert items[0].exception.error == "Service temporarily unavailable."
+    assert "temporarily unavailable" in items[0].exception.response_text
+
+
+def test_search_many_processes_results_fetch_next_pages():
+    with MockSerpApi(pages=2) as server:
+        client = make_client(server.url)
+
+        (item,) = client.search_many_processes([{"q": "coffee"}], processes=1)
+        assert item.result.client is client
+        assert item.result.next_page() is not None
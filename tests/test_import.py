@@ -0,0 +1,35 @@
+import serpapi
+from benchmarks.importtime import BUDGET_MS, import_time_ms, imported_modules
+
+
+def test_import_is_lazy():
+    """Ensure that importing serpapi loads neither its HTTP libraries nor the default client."""
+    modules = imported_modules("import serpapi")
+
+    assert "serpapi" in modules
+    assert not modules & {"requests", "urllib3", "httpx", "pygments", "asyncio", "serpapi.core"}
+
+    # A synchronous client needs requests, but still not httpx, pygments or asyncio.
+    modules = imported_modules("import serpapi; serpapi.Client(api_key='test_key')")
+    assert "requests" in modules
+    assert not modules & {"httpx", "pygments", "asyncio"}
+
+
+def test_import_time_budget():
+    assert min(import_time_ms() for _ in range(3)) < BUDGET_MS
+
+
+def test_lazy_attributes():
+    assert serpapi.Client is serpapi.core.Client
+    assert serpapi.HTTPError is serpapi.exceptions.HTTPError
+    assert serpapi.export.export_ndjson
+    assert serpapi.search.__self__ is serpapi.core._client
+    assert "Client" in dir(serpapi)
+    assert set(serpapi.__all__) <= set(dir(serpapi))
+
+    try:
+        serpapi.no_such_name
+    except AttributeError as e:
+        assert "no_such_name" in str(e)
+    else:
+        raise AssertionError("expected an AttributeError")
@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+
+import serpapi
+from serpapi import Client, MemoryCache, MetricsRegistry, RetryPolicy
+
+from tests.conftest import mock_response
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(serpapi.http.time, "sleep", lambda delay: None)
+
+
+def make_client(mock_requests, statuses=(200,), **kwargs):
+    client = Client(api_key="test_key", **kwargs)
+    statuses = list(statuses)
+
+    def handler(url, params, **kwargs):
+        status_code = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return mock_response(status_code, {"search_metadata": {"id": "123", "total_time_taken": 1.5}})
+
+    mock_requests(client, handler)
+    return client
+
+
+def test_no_hooks_emits_nothing(monkeypatch, mock_requests):
+    client = make_client(mock_requests)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("no events expected")
+
+    monkeypatch.setattr(client, "emit", fail)
+    client.search(q="coffee")
+
+
+def test_request_events(mock_requests):
+    events = []
+    client = make_client(mock_requests, hooks=[events.append])
+
+    client.search(q="coffee", engine="bing")
+
+    assert [e.name for e in events] == ["request_start", "request_end", "decoded"]
+    start, end, decoded = events
+    assert start.request_id == end.request_id == decoded.request_id
+    assert end.path == "/search"
+    assert end.engine == "bing"
+    assert end.status_code == 200
+    assert end.response_bytes > 0
+    assert end.elapsed >= 0
+    assert end.error is None
+    assert decoded.total_time_taken == 1.5
+    assert "api_key" not in repr(end)
+
+
+def test_request_ids_unique_across_clients(mock_requests):
+    events = []
+    first = make_client(mock_requests, hooks=[events.append])
+    second = make_client(mock_requests, hooks=[events.append])
+
+    first.search(q="coffee")
+    second.search(q="coffee")
+
+    ids = [e.request_id for e in events if e.name == "request_start"]
+    assert len(ids) == 2
+    assert ids[0] != ids[1]
+
+
+def test_retry_and_error_events(mock_requests, no_sleep):
+    events = []
+    client = make_client(
+        mock_requests, statuses=(503, 503), hooks=[events.append], retry=RetryPolicy(max_attempts=2, jitter=False)
+    )
+
+    with pytest.raises(serpapi.HTTPError):
+        client.search(q="coffee")
+
+    assert [e.name for e in events] == ["request_start", "request_end", "retry", "request_start", "request_end"]
+    assert events[1].status_code == 503
+    assert isinstance(events[1].error, serpapi.HTTPError)
+    assert events[2].attempt == 1
+    assert events[2].delay == 0.5
+    assert events[4].attempt == 2
+
+
+def test_cache_events(mock_requests):
+    events = []
+    client = make_client(mock_requests, cache=MemoryCache())
+    client.add_hook(events.append)
+
+    client.search(q="coffee")
+    client.search(q="coffee")
+
+    names = [e.name for e in events]
+    assert names[0] == "cache_miss"
+    assert names[-1] == "cache_hit"
+    assert names.count("request_start") == 1
+
+    client.remove_hook(events.append)
+    client.search(q="coffee")
+    assert len(events) == len(names)
+
+
+def test_metrics_registry(mock_requests, no_sleep):
+    metrics = MetricsRegistry()
+    client = make_client(
+        mock_requests, statuses=(500, 200), hooks=[metrics], retry=RetryPolicy(max_attempts=2, jitter=False)
+    )
+
+    client.search(q="coffee", engine="google")
+
+    assert metrics.value("serpapi_requests_total") == 2
+    assert metrics.value("serpapi_requests_total", status="500") == 1
+    assert metrics.value("serpapi_retries_total", engine="google") == 1
+
+    text = metrics.render()
+    assert 'serpapi_requests_total{engine="google",path="/search",status="200"} 1' in text
+    assert 'serpapi_request_duration_seconds_bucket{engine="google",path="/search",le="+Inf"} 2' in text
+    assert 'serpapi_total_time_taken_seconds_count{engine="google",path="/search"} 1' in text
+
+
+def test_logging_hook(mock_requests, caplog):
+    client = make_client(mock_requests, hooks=[serpapi.LoggingHook()])
+
+    with caplog.at_level(logging.DEBUG, logger="serpapi"):
+        client.search(q="coffee")
+
+    assert any(record.message.startswith("request_end") for record in caplog.records)
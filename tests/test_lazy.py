@@ -0,0 +1,102 @@
+import json
+import pickle
+import threading
+import time
+
+from serpapi import Client, SerpResults, jsonlib
+from serpapi.lazy import LazySections, decode_lazily, index_sections
+
+
+RESULTS = {
+    "search_metadata": {"id": "123", "status": "Success"},
+    "search_parameters": {"q": "coffee, \"tea\"\n  \"fake\": 1"},
+    "organic_results": [{"position": 1, "link": "https://example.com"}],
+    "serpapi_pagination": {"next": "https://serpapi.com/search.json?start=10"},
+}
+
+# SerpApi.com pretty-prints its responses with two-space indentation.
+PRETTY = json.dumps(RESULTS, indent=2).encode("utf-8")
+
+
+def test_index_sections():
+    spans = index_sections(PRETTY)
+
+    assert list(spans) == list(RESULTS)
+    for key, (start, end) in spans.items():
+        assert json.loads(PRETTY[start:end]) == RESULTS[key]
+
+
+def test_compact_json_is_decoded_eagerly():
+    compact = json.dumps(RESULTS).encode("utf-8")
+
+    assert index_sections(compact) is None
+    assert decode_lazily(compact) == RESULTS
+
+
+def test_sections_decoded_on_access():
+    sections = decode_lazily(PRETTY)
+
+    assert isinstance(sections, LazySections)
+    assert sections.decoded == []
+    assert sections["search_metadata"]["id"] == "123"
+    assert sections.decoded == ["search_metadata"]
+    assert "organic_results" in sections
+    assert sections.copy() == RESULTS
+
+
+def test_concurrent_first_reads(monkeypatch):
+    loads = jsonlib.loads
+
+    def slow_loads(content):
+        # Widen the window between checking a section and decoding it.
+        time.sleep(0.001)
+        return loads(content)
+
+    for _ in range(20):
+        sections = decode_lazily(PRETTY)
+        monkeypatch.setattr(jsonlib, "loads", slow_loads)
+        barrier = threading.Barrier(8)
+        values, errors = [], []
+
+        def read():
+            barrier.wait()
+            try:
+                values.append(sections["organic_results"])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        monkeypatch.undo()
+
+        assert errors == []
+        # Decoded once: every reader gets the same object.
+        assert all(value is values[0] for value in values)
+        assert values[0] == RESULTS["organic_results"]
+
+
+def test_lazy_results_pickle_raw_bytes():
+    results = SerpResults(decode_lazily(PRETTY), client=None)
+    restored = pickle.loads(pickle.dumps(results))
+
+    assert isinstance(restored.data, LazySections)
+    assert restored.as_dict() == RESULTS
+
+    results["extra"] = True
+    restored = pickle.loads(pickle.dumps(results))
+    assert restored["extra"] is True
+    assert restored["organic_results"] == RESULTS["organic_results"]
+
+
+def test_client_lazy_results(mock_requests):
+    client = Client(api_key="test_key", lazy_results=True)
+    mock_requests(client, lambda url, params, **kwargs: PRETTY)
+
+    results = client.search(q="coffee")
+    assert isinstance(results.data, LazySections)
+    assert results["organic_results"][0]["position"] == 1
+    assert results.next_page_url == RESULTS["serpapi_pagination"]["next"]
+    assert results.data.decoded == ["organic_results", "serpapi_pagination"]
@@ -0,0 +1,147 @@
+import pytest
+import requests
+
+import serpapi
+from serpapi import Client, LocationIndex
+
+LOCATIONS = [
+    {
+        "id": "585069",
+        "google_id": 1026201,
+        "google_parent_id": 21176,
+        "name": "Austin",
+        "canonical_name": "Austin,Texas,United States",
+        "country_code": "US",
+        "target_type": "City",
+        "reach": 5560000,
+        "gps": [-97.7430608, 30.267153],
+        "keys": ["austin", "texas", "united", "states"],
+    },
+    {
+        "id": "1",
+        "name": "Austin",
+        "canonical_name": "Austin,Minnesota,United States",
+        "country_code": "US",
+        "target_type": "City",
+        "reach": 30000,
+    },
+    {
+        "id": "2",
+        "name": "Austintown",
+        "canonical_name": "Austintown,Ohio,United States",
+        "country_code": "US",
+        "target_type": "City",
+        "reach": 50000,
+    },
+    {
+        "id": "3",
+        "name": "Montréal",
+        "canonical_name": "Montreal,Quebec,Canada",
+        "country_code": "CA",
+        "target_type": "City",
+        "reach": 4000000,
+    },
+    {
+        "id": "4",
+        "name": "Texas",
+        "canonical_name": "Texas,United States",
+        "country_code": "US",
+        "target_type": "State",
+        "reach": 29000000,
+    },
+]
+
+
+@pytest.fixture
+def index():
+    return LocationIndex(LOCATIONS)
+
+
+def test_exact_and_get(index):
+    assert index.get("austin, texas, united states")["id"] == "585069"
+    assert [l["id"] for l in index.exact("AUSTIN")] == ["585069", "1"]
+    assert index.exact("montreal")[0]["canonical_name"] == "Montreal,Quebec,Canada"
+    assert index.get("Nowhere") is None
+
+
+def test_prefix(index):
+    assert [l["id"] for l in index.prefix("aust")] == ["585069", "2", "1"]
+    assert [l["id"] for l in index.prefix("aust", limit=1)] == ["585069"]
+    assert [l["id"] for l in index.prefix("te")] == ["4"]
+    assert index.prefix("te", target_type="City") == []
+    assert [l["id"] for l in index.prefix("m", country_code="ca")] == ["3"]
+
+
+def test_fuzzy(index):
+    assert index.fuzzy("Austn")[0]["id"] == "585069"
+    assert index.fuzzy("Montreall")[0]["id"] == "3"
+    assert index.fuzzy("zzzz") == []
+
+
+def test_search_falls_back(index):
+    assert index.search("Austin")[0]["id"] == "585069"
+    assert index.search("Austint")[0]["id"] == "2"
+    assert index.search("Mntreal")[0]["id"] == "3"
+
+
+def test_normalize(index):
+    assert index.normalize("austin") == "Austin,Texas,United States"
+    assert index.normalize("Montreal, Quebec, Canada") == "Montreal,Quebec,Canada"
+
+    with pytest.raises(serpapi.InvalidLocation) as excinfo:
+        index.normalize("Austn, Texas")
+    assert excinfo.value.suggestions
+
+
+def test_save_load_and_open(index, tmp_path, monkeypatch):
+    path = str(tmp_path / "locations.json.gz")
+    index.save(path)
+
+    loaded = LocationIndex.load(path)
+    assert len(loaded) == len(index)
+    assert loaded.fetched_at == index.fetched_at
+    assert loaded.normalize("austin") == "Austin,Texas,United States"
+
+    client = Client(api_key="test_key")
+    calls = []
+
+    def mock_locations(params=None, **kwargs):
+        calls.append(params)
+        return LOCATIONS[:1]
+
+    monkeypatch.setattr(client, "locations", mock_locations)
+
+    # A fresh file is used as it is.
+    assert len(LocationIndex.open(client, path)) == len(LOCATIONS)
+    assert calls == []
+
+    # A stale one is refreshed, and saved.
+    assert len(LocationIndex.open(client, path, max_age=-1)) == 1
+    assert len(calls) == 1
+    assert len(LocationIndex.load(path)) == 1
+
+
+def test_open_falls_back_to_stale_index(index, tmp_path, monkeypatch):
+    path = str(tmp_path / "locations.json.gz")
+    index.save(path)
+
+    client = Client(api_key="test_key")
+
+    def failing_locations(params=None, **kwargs):
+        raise serpapi.HTTPConnectionError(requests.exceptions.ConnectionError("offline"))
+
+    monkeypatch.setattr(client, "locations", failing_locations)
+
+    assert len(LocationIndex.open(client, path, max_age=-1)) == len(LOCATIONS)
+
+
+def test_search_normalizes_location(index, mock_requests):
+    client = Client(api_key="test_key", location_index=index)
+    sent = mock_requests(client)
+
+    client.search(q="coffee", location="austin, texas, united states")
+    assert sent[0]["location"] == "Austin,Texas,United States"
+
+    with pytest.raises(serpapi.InvalidLocation):
+        client.search(q="coffee", location="Atlantis")
+    assert len(sent) == 1
@@ -0,0 +1,71 @@
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from serpapi import Client
+
+
+def page_url(page):
+    return f"https://serpapi.com/search.json?q=coffee&start={ (page - 1) * 10 }"
+
+
+@pytest.fixture
+def paginated_client(mock_requests):
+    """A client serving 12 pages, each listing up to 3 further pages in other_pages."""
+    client = Client(api_key="test_key")
+    client.requested = []
+    client.peak = 0
+    lock = threading.Lock()
+    in_flight = 0
+
+    def handler(url, params, **kwargs):
+        nonlocal in_flight
+        query = parse_qs(urlparse(url).query)
+        page = int(query.get("start", ["0"])[0]) // 10 + 1
+
+        with lock:
+            client.requested.append(page)
+            in_flight += 1
+            client.peak = max(client.peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+        pagination = {
+            "current": page,
+            "other_pages": {str(n): page_url(n) for n in range(page + 1, min(page + 4, 13))},
+        }
+        if page < 12:
+            pagination["next"] = page_url(page + 1)
+
+        return {"page": page, "serpapi_pagination": pagination}
+
+    mock_requests(client, handler)
+    return client
+
+
+def test_yield_pages_prefetch_in_order(paginated_client):
+    first = paginated_client.search(q="coffee")
+    pages = [page["page"] for page in first.yield_pages(prefetch=3)]
+
+    assert pages == list(range(1, 13))
+    assert sorted(paginated_client.requested) == list(range(1, 13))
+    assert paginated_client.peak > 1
+
+
+def test_yield_pages_prefetch_respects_max_pages(paginated_client):
+    first = paginated_client.search(q="coffee")
+    pages = [page["page"] for page in first.yield_pages(max_pages=4, prefetch=3)]
+
+    assert pages == [1, 2, 3, 4]
+    assert sorted(paginated_client.requested) == [1, 2, 3, 4]
+
+
+def test_yield_pages_sequential_unchanged(paginated_client):
+    first = paginated_client.search(q="coffee")
+    pages = [page["page"] for page in first.yield_pages(max_pages=5)]
+
+    assert pages == [1, 2, 3, 4, 5]
+    assert paginated_client.peak == 1
@@ -0,0 +1,100 @@
+import json
+from collections import Counter
+from urllib.parse import urlparse
+
+import serpapi
+from serpapi import Client, SearchPipeline
+
+from tests.conftest import mock_response
+
+
+def make_client(mock_requests, polls_until_done=2):
+    """A client whose async searches finish after being polled ``polls_until_done`` times."""
+    client = Client(api_key="test_key")
+    client.polls = Counter()
+    client.timeouts = []
+
+    def handler(url, params, timeout=None, **kwargs):
+        client.timeouts.append(timeout)
+        path = urlparse(url).path
+
+        if path == "/search":
+            assert params["async"] == "true"
+            search_id = f"id-{ params['q'] }"
+            return {"search_metadata": {"id": search_id, "status": "Processing"}}
+
+        search_id = path.rsplit("/", 1)[-1]
+        if search_id == "id-missing":
+            return mock_response(404, {"error": "Invalid search id"})
+
+        client.polls[search_id] += 1
+        done = client.polls[search_id] >= polls_until_done
+        return {"search_metadata": {"id": search_id, "status": "Success" if done else "Processing"}}
+
+    client.sent = mock_requests(client, handler)
+    return client
+
+
+def test_submit_and_poll(mock_requests):
+    client = make_client(mock_requests)
+    pipeline = SearchPipeline(client, poll_interval=0.01)
+
+    records = pipeline.submit_many({"q": q} for q in ["a", "b", "c"])
+    assert sorted(record.result for record in records) == ["id-a", "id-b", "id-c"]
+    assert sorted(pipeline.pending) == ["id-a", "id-b", "id-c"]
+
+    ids = sorted(results["search_metadata"]["id"] for results in pipeline.results())
+    assert ids == ["id-a", "id-b", "id-c"]
+    assert pipeline.pending == []
+    assert set(client.polls.values()) == {2}
+
+
+def test_unknown_search_is_failed(mock_requests):
+    client = make_client(mock_requests)
+    pipeline = SearchPipeline(client, poll_interval=0.01)
+    pipeline.submit(q="missing")
+
+    assert list(pipeline.results()) == []
+    assert isinstance(pipeline.failed["id-missing"], serpapi.HTTPError)
+
+
+def test_max_wait(mock_requests):
+    client = make_client(mock_requests, polls_until_done=1_000)
+    pipeline = SearchPipeline(client, poll_interval=0.01, max_wait=0.05)
+    pipeline.submit(q="slow")
+
+    assert list(pipeline.results()) == []
+    assert isinstance(pipeline.failed["id-slow"], serpapi.TimeoutError)
+
+
+def test_submit_request_options(mock_requests, tmp_path):
+    client = make_client(mock_requests)
+
+    state_path = str(tmp_path / "pending.json")
+    pipeline = SearchPipeline(client, state_path=state_path)
+    pipeline.submit(q="x", timeout=5, retry=False)
+
+    assert client.sent == [{"q": "x", "async": "true", "api_key": "test_key"}]
+    assert client.timeouts == [5]
+
+    with open(state_path) as f:
+        assert json.load(f) == {"pending": {"id-x": {"q": "x"}}}
+
+
+def test_resume_from_state(mock_requests, tmp_path):
+    state_path = str(tmp_path / "pending.json")
+    client = make_client(mock_requests)
+
+    pipeline = SearchPipeline(client, state_path=state_path)
+    pipeline.submit(q="a", location="Austin")
+    del pipeline
+
+    with open(state_path) as f:
+        assert json.load(f) == {"pending": {"id-a": {"q": "a", "location": "Austin"}}}
+
+    resumed = SearchPipeline(client, state_path=state_path, poll_interval=0.01)
+    assert resumed.pending == ["id-a"]
+    assert [results["search_metadata"]["id"] for results in resumed.results()] == ["id-a"]
+
+    with open(state_path) as f:
+        assert json.load(f) == {"pending": {}}
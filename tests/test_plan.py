@@ -0,0 +1,82 @@
+import serpapi
+from serpapi import Client, LocationIndex, QueryPlan, canonical_params, normalize_params
+
+
+def test_canonical_params_equivalences():
+    base = canonical_params({"q": "coffee", "location": "Austin,Texas,United States"})
+
+    assert canonical_params({"location": "Austin, Texas, United States ", "q": "coffee"}) == base
+    assert canonical_params({"q": "coffee", "location": "Austin,Texas,United States", "engine": "google"}) == base
+    assert canonical_params({"q": "coffee", "location": "Austin,Texas,United States", "hl": None, "api_key": "x"}) == base
+    assert canonical_params({"q": "coffee", "no_cache": True}) == canonical_params({"q": "coffee", "no_cache": "true"})
+    assert canonical_params({"q": "coffee", "engine": "bing"}) != canonical_params({"q": "coffee"})
+
+
+def test_search_does_not_modify_params(mock_requests):
+    client = Client(api_key="test_key")
+    calls = mock_requests(client)
+    params = {"q": "coffee", "hl": None, "no_cache": True}
+
+    client.search(params, num=10)
+    client.search_archive({"search_id": "1"})
+
+    assert params == {"q": "coffee", "hl": None, "no_cache": True}
+    assert calls[0] == {"q": "coffee", "no_cache": "true", "num": 10, "api_key": "test_key"}
+    assert normalize_params(params) == {"q": "coffee", "no_cache": "true"}
+
+
+def test_query_plan_dedupes_and_fans_out(mock_requests):
+    client = Client(api_key="test_key")
+    calls = mock_requests(client)
+    batch = [
+        {"q": "coffee", "engine": "google"},
+        {"q": "tea"},
+        {"q": "coffee"},
+        {"engine": "google", "q": "coffee", "hl": None},
+        {"q": "tea", "api_key": "other"},
+    ]
+
+    plan = QueryPlan(batch)
+    assert (plan.total, len(plan), plan.saved) == (5, 2, 3)
+    assert repr(plan) == "<QueryPlan requests=5 unique=2 saved=3>"
+
+    items = list(plan.run(client, ordered=True))
+
+    assert len(calls) == 2
+    assert [item.index for item in items] == [0, 1, 2, 3, 4]
+    assert [item.params for item in items] == batch
+    assert items[0].result is items[2].result is items[3].result
+    assert items[1].result is items[4].result
+    assert items[0].result is not items[1].result
+
+
+def test_search_many_dedupe(mock_requests):
+    client = Client(api_key="test_key")
+    calls = mock_requests(client)
+
+    items = list(client.search_many(({"q": q} for q in ["a", "b", "a", "a"]), dedupe=True))
+
+    assert len(calls) == 2
+    assert sorted(item.index for item in items) == [0, 1, 2, 3]
+    assert all(isinstance(item.result, serpapi.SerpResults) for item in items)
+
+
+def test_unknown_location_fails_only_its_searches(mock_requests):
+    client = Client(api_key="test_key")
+    calls = mock_requests(client)
+    client.location_index = LocationIndex([{"id": "1", "name": "Austin", "canonical_name": "Austin,Texas,United States"}])
+    batch = [
+        {"q": "coffee", "location": "Nowhere"},
+        {"q": "coffee", "location": "Austin, Texas, United States"},
+        {"q": "tea", "location": "Nowhere"},
+    ]
+
+    plan = QueryPlan(batch, location_index=client.location_index)
+    assert (plan.total, len(plan), len(plan.failed), plan.saved) == (3, 1, 2, 0)
+
+    items = list(client.search_many(batch, dedupe=True, ordered=True))
+
+    assert len(calls) == 1
+    assert [item.index for item in items] == [0, 1, 2]
+    assert [item.ok for item in items] == [False, True, False]
+    assert isinstance(items[0].exception, serpapi.InvalidLocation)
@@ -0,0 +1,67 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from serpapi import Client
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"search_metadata": {"id": "123"}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{ server.server_address[1] }"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_configuration():
+    client = Client(api_key="test_key", pool_maxsize=64, pool_block=True, max_retries=2)
+    adapter = client.session.get_adapter("https://serpapi.com")
+
+    assert adapter is client.adapter
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.max_retries.total == 2
+
+
+def test_pool_stats_connection_reuse(local_server):
+    """Ensure that sequential requests reuse a single keep-alive connection."""
+    client = Client(api_key="test_key")
+    client.BASE_DOMAIN = local_server
+
+    for _ in range(5):
+        client.search(q="coffee")
+
+    stats = client.pool_stats()
+    assert stats.connections_created == 1
+    assert stats.requests == 5
+    assert stats.connections_reused == 4
+
+
+def test_pool_stats_without_keep_alive(local_server):
+    client = Client(api_key="test_key", keep_alive=False)
+    client.BASE_DOMAIN = local_server
+
+    for _ in range(3):
+        client.search(q="coffee")
+
+    stats = client.pool_stats()
+    assert stats.connections_created == 3
+    assert stats.connections_reused == 0
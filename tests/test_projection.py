@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+import serpapi
+from serpapi import Client, MemoryCache, Projection
+
+
+def body(page=1, pages=2):
+    data = {
+        "search_metadata": {"id": f"search-{ page }", "status": "Success"},
+        "search_parameters": {"engine": "google", "q": "coffee"},
+        "organic_results": [
+            {"position": i, "title": f"Result { i }", "link": f"https://example.com/{ i }", "snippet": "..." * 50}
+            for i in range(1, 11)
+        ],
+        "inline_images": [{"thumbnail": "data:image/png;base64," + "A" * 1000}] * 5,
+    }
+    if page < pages:
+        data["serpapi_pagination"] = {"current": page, "next": f"https://serpapi.com/search?q=coffee&start={ page * 10 }"}
+    # SerpApi.com pretty-prints its responses.
+    return json.dumps(data, indent=2).encode()
+
+
+@pytest.fixture
+def client(mock_requests):
+    client = Client(api_key="test_key")
+    client.sent = mock_requests(client, lambda url, params, **kwargs: body(page=2 if "start=" in url else 1))
+    return client
+
+
+def test_selectors():
+    projection = Projection("search_metadata.id", "$.organic_results[*].{position,link}", "knowledge_graph")
+
+    assert projection.selectors == (
+        "search_metadata.id",
+        "organic_results[*].position",
+        "organic_results[*].link",
+        "knowledge_graph",
+    )
+    assert projection.json_restrictor == (
+        "search_metadata.id,organic_results[].{position,link},knowledge_graph,error,serpapi_pagination"
+    )
+    # Selecting a whole value subsumes selecting its members.
+    assert Projection("a.b", "a").json_restrictor == Projection("a").json_restrictor
+    assert Projection("a[*].b", "a[]") == Projection("a[*]")
+    assert Projection.coerce("a.b") == Projection("a.b")
+
+    with pytest.raises(ValueError):
+        Projection("organic_results..title")
+    with pytest.raises(ValueError):
+        Projection()
+
+
+def test_decode_only_selected_sections(monkeypatch):
+    decoded = []
+    loads = serpapi.jsonlib.loads
+
+    def recording_loads(data):
+        decoded.append(len(data))
+        return loads(data)
+
+    monkeypatch.setattr(serpapi.projection.jsonlib, "loads", recording_loads)
+    projection = Projection("organic_results[*].title", "search_metadata.id")
+
+    content = body()
+    data = projection.decode(content)
+
+    assert data == {
+        "organic_results": [{"title": f"Result { i }"} for i in range(1, 11)],
+        "search_metadata": {"id": "search-1"},
+        "serpapi_pagination": json.loads(content)["serpapi_pagination"],
+    }
+    # inline_images and search_parameters were never decoded.
+    assert sum(decoded) < len(content) / 2
+
+    # Bodies laid out differently are decoded whole, then pruned.
+    assert projection.decode(json.dumps(json.loads(content)).encode()) == data
+
+
+def test_search_pushes_projection_down(client):
+    results = client.search(q="coffee", projection=["search_metadata.id", "organic_results[*].{position,link}"])
+
+    params = client.sent[0]
+    assert params["json_restrictor"] == (
+        "search_metadata.id,organic_results[].{position,link},error,serpapi_pagination"
+    )
+    assert isinstance(results, serpapi.SerpResults)
+    assert set(results) == {"search_metadata", "organic_results", "serpapi_pagination"}
+    assert results["organic_results"][0] == {"position": 1, "link": "https://example.com/1"}
+
+    # Next pages are fetched, and projected, the same way.
+    pages = list(results.yield_pages())
+    assert len(pages) == 2
+    assert client.sent[1]["json_restrictor"] == params["json_restrictor"]
+    assert set(pages[1]["organic_results"][0]) == {"position", "link"}
+
+
+def test_projection_without_pushdown(client):
+    client.cache = MemoryCache()
+    projection = Projection("organic_results[*].title", pushdown=False)
+
+    projected = client.search(q="coffee", projection=projection)
+    full = client.search(q="coffee")
+
+    assert "json_restrictor" not in client.sent[0]
+    assert len(client.sent) == 1
+    assert set(projected) == {"organic_results", "serpapi_pagination"}
+    assert "inline_images" in full
+
+
+def test_yield_pages_projection(client):
+    results = client.search(q="coffee")
+
+    pages = list(results.yield_pages(projection="organic_results[*].link"))
+
+    assert [set(page) for page in pages] == [{"organic_results", "serpapi_pagination"}, {"organic_results"}]
+    assert client.sent[1]["json_restrictor"] == "organic_results[].link,error,serpapi_pagination"
+    assert "inline_images" in results
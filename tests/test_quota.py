@@ -0,0 +1,134 @@
+import threading
+
+import serpapi
+from serpapi import Client, MemoryCache, QuotaTracker
+
+
+ACCOUNT = {
+    "plan_searches_left": 100,
+    "total_searches_left": 105,
+    "this_hour_searches": 10,
+    "account_rate_limit_per_hour": 15,
+}
+
+
+def make_client(monkeypatch, mock_requests, body=b'{"search_metadata": {"id": "123"}}', **kwargs):
+    client = Client(api_key="test_key", **kwargs)
+    client.account_calls = 0
+
+    def mock_account(params=None, **kwargs):
+        client.account_calls += 1
+        return dict(ACCOUNT)
+
+    monkeypatch.setattr(client, "account", mock_account)
+    mock_requests(client, lambda url, params, **kwargs: body)
+    return client
+
+
+def test_seeded_from_account(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests)
+    quota = QuotaTracker(client)
+
+    assert client.quota is quota
+    assert quota.searches_left == 105
+    assert quota.remaining_this_hour() == 5
+    assert quota.available() == 5
+
+
+def test_counts_searches_locally(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests, cache=MemoryCache())
+    quota = QuotaTracker(client)
+
+    client.search(q="coffee")
+    client.search(q="tea")
+    # Served by the local cache: not charged.
+    client.search(q="coffee")
+
+    assert quota.searches_left == 103
+    assert quota.this_hour_searches == 12
+    assert quota.available() == 3
+    assert client.account_calls == 1
+
+
+def test_errors_are_not_counted(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests, body=b'{"error": "Google hasn\'t returned any results for this query."}')
+    quota = QuotaTracker(client)
+
+    client.search(q="asdfghjkl")
+
+    assert quota.searches_left == 105
+
+
+def test_hourly_count_rolls_over(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests)
+    now = 1_000 * 3600 + 10
+    monkeypatch.setattr(serpapi.quota.time, "time", lambda: now)
+    quota = QuotaTracker(client)
+
+    for _ in range(5):
+        client.search(q="coffee")
+    assert quota.available() == 0
+
+    # The next hour, without a re-sync.
+    now += 3600
+    assert quota.remaining_this_hour() == 15
+    assert quota.available() == 15
+    client.search(q="coffee")
+    assert quota.this_hour_searches == 1
+    assert client.account_calls == 1
+
+
+def test_streamed_searches_are_counted(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests, body=b'{"organic_results": [{"position": 1}]}')
+    quota = QuotaTracker(client)
+
+    assert list(client.search_stream("organic_results", q="coffee")) == [{"position": 1}]
+    assert quota.searches_left == 104
+
+
+def test_reserve(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests)
+    quota = QuotaTracker(client, reserve=1)
+
+    assert quota.available() == 4
+    assert quota.try_reserve(3)
+    assert quota.available() == 1
+    assert not quota.try_reserve(2)
+    quota.release(3)
+    assert quota.available() == 4
+
+
+def test_search_many_stops_at_quota(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests)
+    QuotaTracker(client)
+
+    records = list(client.search_many(({"q": str(i)} for i in range(8)), max_workers=2))
+
+    assert sum(record.ok for record in records) == 5
+    assert all(isinstance(record.exception, serpapi.QuotaExceeded) for record in records if not record.ok)
+
+
+def test_background_resync(monkeypatch, mock_requests):
+    client = make_client(monkeypatch, mock_requests)
+    synced = threading.Event()
+
+    quota = QuotaTracker(client)
+    quota.record(5)
+    assert quota.available() == 0
+
+    original_sync = quota.sync
+
+    def sync():
+        original_sync()
+        synced.set()
+
+    monkeypatch.setattr(quota, "sync", sync)
+    quota.resync_interval = 0.01
+    quota.start()
+    try:
+        assert synced.wait(1)
+    finally:
+        quota.stop()
+
+    assert quota.available() == 5
+    assert client.account_calls >= 2
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from serpapi import Client, RateLimiter
+
+
+def test_burst_then_sustained_rate():
+    limiter = RateLimiter(rate=50, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.02
+
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_shared_across_threads_and_tasks():
+    """Ensure that concurrent callers share a single budget."""
+    limiter = RateLimiter(rate=100, burst=1)
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+
+    async def tasks():
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(5)))
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(tasks())
+    for thread in threads:
+        thread.join()
+
+    # 20 tokens, one free: the remaining 19 take at least 0.19s at 100/s.
+    assert time.monotonic() - start >= 0.19 * 0.9
+
+
+def test_try_acquire():
+    limiter = RateLimiter(rate=1, burst=2)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_from_account():
+    account = {
+        "account_rate_limit_per_hour": 3600,
+        "this_hour_searches": 3590,
+        "plan_searches_left": 5000,
+    }
+    limiter = RateLimiter.from_account(account)
+
+    assert limiter.rate == 1
+    assert limiter.burst == 60
+    assert limiter.available == pytest.approx(10, abs=0.1)
+
+
+def test_client_throttles_searches_only(mock_requests):
+    limiter = RateLimiter(rate=1, burst=1)
+    client = Client(api_key="test_key", rate_limiter=limiter)
+    mock_requests(client, lambda url, params, **kwargs: b"{}")
+
+    client.account()
+    client.search_archive(search_id="123")
+    assert limiter.available == pytest.approx(1, abs=0.01)
+
+    client.search(q="coffee")
+    assert limiter.available == pytest.approx(0, abs=0.01)
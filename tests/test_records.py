@@ -0,0 +1,66 @@
+import pickle
+import sys
+
+import pytest
+
+import serpapi
+from serpapi import OrganicResult, LocalResult, SerpResults
+from serpapi.records import RecordList
+
+
+ORGANIC = {
+    "position": 1,
+    "title": "Coffee - Wikipedia",
+    "link": "https://en.wikipedia.org/wiki/Coffee",
+    "displayed_link": "https://en.wikipedia.org › wiki › Coffee",
+    "favicon": "https://serpapi.com/searches/abc/images/1.png",
+    "snippet": "Coffee is a beverage brewed from roasted coffee beans.",
+    "snippet_highlighted_words": ["Coffee"],
+    "sitelinks": {"inline": [{"title": "History", "link": "https://en.wikipedia.org/wiki/History_of_coffee"}]},
+    "source": "Wikipedia",
+    "rich_snippet": {"bottom": {"extensions": ["Caffeine"]}},
+    "redirect_link": "https://www.google.com/url?q=https://en.wikipedia.org/wiki/Coffee",
+    "extra-key": {"kept": True},
+}
+
+
+def test_record_round_trip():
+    record = OrganicResult.from_dict(ORGANIC)
+
+    assert record.title == "Coffee - Wikipedia"
+    assert record.sitelinks is ORGANIC["sitelinks"]
+    # Known fields the result didn't have read as None, but aren't invented by as_dict().
+    assert record.date is None
+    assert "date" not in record
+    with pytest.raises(KeyError):
+        record["date"]
+    assert record["extra-key"] == {"kept": True}
+    assert record.get("missing", "default") == "default"
+
+    assert record.as_dict() == ORGANIC
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert OrganicResult(title="Coffee").as_dict() == {"title": "Coffee"}
+    assert OrganicResult(title="Coffee") != LocalResult(title="Coffee")
+
+
+def test_record_is_smaller_than_dict():
+    decoded = serpapi.jsonlib.loads(serpapi.jsonlib.dumps(ORGANIC))
+    record = OrganicResult.from_dict(decoded)
+    assert sys.getsizeof(record) * 2.5 < sys.getsizeof(decoded)
+
+
+def test_serp_results_records():
+    results = SerpResults({"organic_results": [dict(ORGANIC, position=i) for i in range(1, 4)]}, client=None)
+
+    records = results.records("organic_results")
+    assert isinstance(records, RecordList)
+    assert len(records) == 3
+    assert [record.position for record in records] == [1, 2, 3]
+    assert records[-1].position == 3
+    assert [record.position for record in records[1:]] == [2, 3]
+    assert all(isinstance(record, serpapi.OrganicResult) for record in records)
+
+    assert len(results.records("local_results")) == 0
+    assert results.records("organic_results", record_type=LocalResult)[0].title == ORGANIC["title"]
+    with pytest.raises(ValueError):
+        results.records("inline_images")
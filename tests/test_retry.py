@@ -0,0 +1,117 @@
+import pytest
+import requests
+
+import serpapi
+from serpapi import Client, RetryPolicy
+
+from tests.conftest import mock_response
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(serpapi.http.time, "sleep", delays.append)
+    return delays
+
+
+def test_retry_transient_failures(mock_requests, no_sleep):
+    """Ensure that 503s and timeouts are retried, and the attempt count is reported."""
+    client = Client(api_key="test_key", retry=RetryPolicy(max_attempts=3, jitter=False))
+    outcomes = [
+        requests.exceptions.Timeout(),
+        mock_response(503),
+        mock_response(200),
+    ]
+
+    def handler(url, params, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    mock_requests(client, handler)
+
+    results = client.search(q="coffee")
+    assert results["search_metadata"]["id"] == "123"
+    assert results.attempts == 3
+    assert no_sleep == [0.5, 1.0]
+
+
+def test_retry_gives_up(mock_requests, no_sleep):
+    client = Client(api_key="test_key", retry=RetryPolicy(max_attempts=2))
+
+    def handler(url, params, **kwargs):
+        return mock_response(502)
+
+    mock_requests(client, handler)
+
+    with pytest.raises(serpapi.HTTPError) as exc_info:
+        client.search(q="coffee")
+
+    assert exc_info.value.status_code == 502
+    assert exc_info.value.attempts == 2
+
+
+def test_retry_not_for_client_errors(mock_requests, no_sleep):
+    client = Client(api_key="test_key", retry=RetryPolicy())
+
+    def handler(url, params, **kwargs):
+        return mock_response(401, b'{"error": "Invalid API key"}')
+
+    mock_requests(client, handler)
+
+    with pytest.raises(serpapi.HTTPError) as exc_info:
+        client.search(q="coffee")
+
+    assert exc_info.value.attempts == 1
+    assert no_sleep == []
+
+
+def test_retry_after_and_per_call_override(mock_requests, no_sleep):
+    """Ensure that Retry-After is honoured, and that retry can be set per call."""
+    client = Client(api_key="test_key")
+    outcomes = [mock_response(429, headers={"Retry-After": "7"}), mock_response(200)]
+
+    def handler(url, params, **kwargs):
+        assert "retry" not in kwargs
+        return outcomes.pop(0)
+
+    mock_requests(client, handler)
+
+    results = client.search(q="coffee", retry=RetryPolicy(backoff_base=1, jitter=False))
+    assert results.attempts == 2
+    assert no_sleep == [7.0]
+
+
+def test_retry_closes_failed_responses(mock_requests, no_sleep):
+    """Ensure that a retried attempt's response is closed, so a streamed one gives its connection back."""
+    client = Client(api_key="test_key", retry=RetryPolicy(jitter=False))
+    failed = mock_response(503)
+    closed = []
+    failed.close = lambda: closed.append(failed)
+    outcomes = [failed, mock_response(200)]
+
+    def handler(url, params, stream, **kwargs):
+        assert stream
+        return outcomes.pop(0)
+
+    mock_requests(client, handler)
+
+    results = client.search(q="coffee", stream=True)
+    assert results.attempts == 2
+    assert closed == [failed]
+
+
+def test_retry_after_too_long():
+    policy = RetryPolicy(max_retry_after=60)
+    error = serpapi.HTTPError(
+        requests.exceptions.HTTPError(response=mock_response(429, headers={"Retry-After": "3600"}))
+    )
+
+    assert policy.is_retryable(error)
+    assert policy.next_delay(error, 1) is None
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
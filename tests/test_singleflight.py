@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import serpapi
+from serpapi import Client
+from serpapi.singleflight import AsyncSingleFlight
+
+from tests.conftest import mock_response
+
+
+def make_client(mock_requests, status_code=200):
+    client = Client(api_key="test_key", coalesce=True)
+    client.calls = 0
+    release = threading.Event()
+
+    def handler(url, params, **kwargs):
+        client.calls += 1
+        release.wait(1)
+        return mock_response(status_code)
+
+    mock_requests(client, handler)
+    return client, release
+
+
+def run_concurrently(fn, count):
+    outcomes = [None] * count
+
+    def worker(i):
+        try:
+            outcomes[i] = fn(i)
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_identical_searches_share_one_request(mock_requests):
+    client, release = make_client(mock_requests)
+
+    # The same parameters, in a different order each time.
+    threads, outcomes = run_concurrently(
+        lambda i: client.search({"q": "coffee", "hl": "en"} if i % 2 else {"hl": "en", "q": "coffee"}),
+        5,
+    )
+    while client.in_flight.shared < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert client.calls == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert outcomes[0]["search_metadata"]["id"] == "123"
+
+
+def test_errors_reach_every_waiter(mock_requests):
+    client, release = make_client(mock_requests, status_code=503)
+
+    threads, outcomes = run_concurrently(lambda i: client.search(q="coffee"), 3)
+    while client.in_flight.shared < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert client.calls == 1
+    assert all(isinstance(outcome, serpapi.HTTPError) for outcome in outcomes)
+
+
+def test_sequential_searches_are_not_coalesced(mock_requests):
+    client, release = make_client(mock_requests)
+    release.set()
+
+    client.search(q="coffee")
+    client.search(q="coffee")
+
+    assert client.calls == 2
+
+
+def test_async_single_flight():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise serpapi.TimeoutError("timed out")
+
+    async def main():
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+        errors = await asyncio.gather(*(flight.do("key", failing) for _ in range(3)), return_exceptions=True)
+        return results, errors
+
+    results, errors = asyncio.run(main())
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert all(isinstance(error, serpapi.TimeoutError) for error in errors)
+    assert flight.shared == 6
+
+
+def test_async_single_flight_leader_cancelled():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(asyncio.wait_for(flight.do("key", fetch), timeout=0.01))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do("key", fetch))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+        return await waiter, flight._calls
+
+    result, calls = asyncio.run(main())
+
+    # The leader timing out doesn't cancel the call it started for the waiter.
+    assert result == "result"
+    assert calls == {}
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from serpapi import Client, InvalidLocation, LocationIndex, SearchError
+from serpapi.streaming import iter_array
+
+from tests.conftest import mock_response
+
+
+DOCUMENT = {
+    "search_metadata": {"id": "123", "note": 'braces } and ] \\" inside strings'},
+    "ads": [{"title": "[ad]"}, {"nested": {"a": [1, 2, {"b": "}"}]}}],
+    "count": 12.5e3,
+    "flag": None,
+    "organic_results": [
+        {"position": 1, "title": "Café ☕", "link": "https://example.com/1"},
+        {"position": 2, "title": 'Escaped \\" quote', "link": "https://example.com/2"},
+        {"position": 3, "snippet": ""},
+    ],
+    "pagination": {"next": "https://example.com?page=2"},
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1_000_000])
+def test_iter_array_across_chunk_boundaries(chunk_size):
+    data = json.dumps(DOCUMENT).encode("utf-8")
+    items = list(iter_array(chunked(data, chunk_size), "organic_results"))
+
+    assert items == DOCUMENT["organic_results"]
+
+
+def test_iter_array_stops_reading_after_array():
+    data = json.dumps(DOCUMENT, indent=2).encode("utf-8")
+    chunks = iter(chunked(data, 16))
+
+    assert len(list(iter_array(chunks, "organic_results"))) == 3
+    assert next(chunks, None) is not None
+
+
+def test_iter_array_missing_or_not_array():
+    data = json.dumps({"error": "No results", "organic_results": "n/a"}).encode()
+
+    assert list(iter_array([data], "local_results")) == []
+    assert list(iter_array([data], "organic_results")) == []
+
+
+def test_iter_array_truncated():
+    data = json.dumps(DOCUMENT).encode("utf-8")[:-60]
+
+    with pytest.raises(ValueError):
+        list(iter_array(chunked(data, 32), "pagination"))
+
+
+def test_search_stream(mock_requests):
+    client = Client(api_key="test_key")
+    closed = []
+
+    def handler(url, params, stream, **kwargs):
+        assert stream is True
+        response = mock_response(200, DOCUMENT)
+        response.close = lambda: closed.append(True)
+        return response
+
+    mock_requests(client, handler)
+
+    links = [item.get("link") for item in client.search_stream("organic_results", q="coffee", chunk_size=10)]
+
+    assert links == ["https://example.com/1", "https://example.com/2", None]
+    assert closed == [True]
+
+
+def test_search_stream_error(mock_requests):
+    client = Client(api_key="test_key")
+    closed = []
+
+    def handler(url, params, **kwargs):
+        response = mock_response(200, {"search_metadata": {"id": "123"}, "error": "Google hasn't returned any results for this query."})
+        response.close = lambda: closed.append(True)
+        return response
+
+    mock_requests(client, handler)
+
+    with pytest.raises(SearchError) as excinfo:
+        list(client.search_stream("organic_results", q="coffee"))
+
+    assert excinfo.value.error == "Google hasn't returned any results for this query."
+    assert closed == [True]
+
+
+def test_search_stream_normalizes_params(mock_requests):
+    client = Client(api_key="test_key")
+    sent = mock_requests(client, lambda url, params, **kwargs: {"organic_results": []})
+
+    assert list(client.search_stream("organic_results", q="coffee", no_cache=True, hl=None)) == []
+    assert sent == [{"q": "coffee", "no_cache": "true", "api_key": "test_key"}]
+
+    # Locations are checked against the index, as search() does, before anything is sent.
+    client.location_index = LocationIndex([{"id": "1", "name": "Austin", "canonical_name": "Austin,Texas,United States"}])
+    with pytest.raises(InvalidLocation):
+        client.search_stream("organic_results", q="coffee", location="Nowhere")
+    assert len(sent) == 1
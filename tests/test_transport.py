@@ -0,0 +1,102 @@
+import httpx
+import pytest
+
+import serpapi
+from serpapi import Client, HTTPXTransport, RequestsTransport
+
+
+def make_client(handler, **kwargs):
+    transport = HTTPXTransport(http2=False)
+    transport.session = httpx.Client(transport=httpx.MockTransport(handler))
+    return Client(api_key="test_key", transport=transport, **kwargs)
+
+
+def test_default_transport():
+    client = Client(api_key="test_key")
+
+    assert isinstance(client.transport, RequestsTransport)
+    assert client.session.get_adapter("https://serpapi.com") is client.adapter
+
+
+def test_httpx_transport_search():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"search_metadata": {"id": "123"}})
+
+    client = make_client(handler)
+    results = client.search(q="coffee", location=None)
+
+    assert results["search_metadata"]["id"] == "123"
+    assert seen[0].url.params["q"] == "coffee"
+    assert seen[0].url.params["api_key"] == "test_key"
+    assert "location" not in seen[0].url.params
+    assert seen[0].headers["User-Agent"] == client.USER_AGENT
+
+
+def test_httpx_transport_merges_query_string():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    client.request("GET", "https://serpapi.com/search.json?q=coffee&start=10", params={})
+
+    assert seen[0].url.params["start"] == "10"
+    assert seen[0].url.params["api_key"] == "test_key"
+
+
+def test_httpx_transport_http_error():
+    client = make_client(lambda request: httpx.Response(401, json={"error": "Invalid API key."}))
+
+    with pytest.raises(serpapi.HTTPError) as excinfo:
+        client.search(q="coffee")
+
+    assert excinfo.value.status_code == 401
+    assert excinfo.value.error == "Invalid API key."
+
+
+@pytest.mark.parametrize(
+    "raised, expected",
+    [
+        (httpx.ReadTimeout("timed out"), serpapi.TimeoutError),
+        (httpx.ConnectError("refused"), serpapi.HTTPConnectionError),
+    ],
+)
+def test_httpx_transport_exception_mapping(raised, expected):
+    def handler(request):
+        raise raised
+
+    client = make_client(handler)
+
+    with pytest.raises(expected):
+        client.search(q="coffee")
+
+
+def test_httpx_transport_stream():
+    body = b'{"search_metadata": {"id": "123"}, "organic_results": [{"position": 1}, {"position": 2}]}'
+    client = make_client(lambda request: httpx.Response(200, content=body))
+
+    results = client.search_stream("organic_results", q="coffee", chunk_size=8)
+
+    assert [item["position"] for item in results] == [1, 2]
+
+
+def test_httpx_transport_rejects_per_request_options():
+    client = make_client(lambda request: httpx.Response(200, json={}))
+
+    with pytest.raises(TypeError):
+        client.search(q="coffee", verify=False)
+
+
+def test_httpx_transport_rejects_pool_options():
+    with pytest.raises(TypeError):
+        make_client(lambda request: httpx.Response(200, json={}), keep_alive=False)
+
+    client = make_client(lambda request: httpx.Response(200, json={}))
+
+    assert client.adapter is None
+    assert client.pool_stats() is None